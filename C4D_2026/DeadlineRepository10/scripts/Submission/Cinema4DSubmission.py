@@ -2,6 +2,9 @@ from __future__ import absolute_import
 import re
 import imp  # For Integration UI
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
 from System import *
@@ -14,8 +17,6 @@ from Deadline.Scripting import RepositoryUtils, ClientUtils, FrameUtils, PathUti
 from DeadlineUI.Controls.Scripting.DeadlineScriptDialog import DeadlineScriptDialog
 from ThinkboxUI.Controls.Scripting.RangeControl import RangeControl
 from ThinkboxUI.Controls.Scripting.ButtonControl import ButtonControl
-imp.load_source( 'IntegrationUI', RepositoryUtils.GetRepositoryFilePath( "submission/Integration/Main/IntegrationUI.py", True ) )
-import IntegrationUI
 
 ########################################################################
 ## Globals
@@ -23,11 +24,36 @@ import IntegrationUI
 scriptDialog = None  # type: DeadlineScriptDialog
 settings = None
 integration_dialog = None
+# The value each output override checkbox was last handled with, so change events that repeat it are skipped.
+_last_use_default = {}
+
+# Neither folder changes during a Monitor session, so look them up once and build paths in Python.
+_temp_path = ClientUtils.GetDeadlineTempPath()
+_settings_filename = os.path.join( ClientUtils.GetUsersSettingsDirectory(), "Cinema4DSettings.ini" )
 
 ProjectManagementOptions = ["Shotgun","FTrack","NIM"]
 DraftRequested = False
 
-SUPPORTED_VERSIONS = ["12", "13", "14", "15", "16", "17", "18", "19", "20", "21", "22", "23", "24", "25", "26", "2023", "2024", "2025", "2026"]
+# Comma separated list of up to two digit GPU device Ids, e.g. "0" or "0,1,2". Empty is allowed.
+_GPU_DEVICES_RE = re.compile( r"\A(\d{1,2}(?:,\d{1,2})*)?\Z" )
+
+# Upper bound on the number of deadlinecommand processes spawned at once for multi-scene submissions.
+MAX_SUBMISSION_THREADS = 8
+
+# Controls that are read once per submission and shared by every scene file's job and plugin info.
+SUBMISSION_CONTROLS = ("NameBox","CommentBox","DepartmentBox","PoolBox","SecondaryPoolBox","GroupBox","PriorityBox","TaskTimeoutBox","AutoTimeoutBox","ConcurrentTasksBox","LimitConcurrentTasksBox","MachineLimitBox","IsBlacklistBox","MachineListBox","LimitGroupBox","DependencyBox","OnJobCompleteBox","SubmitSuspendedBox","ChunkSizeBox","VersionBox","BuildBox","NoOpenGLBox","ThreadsBox","LocalRenderingBox","TakeBox","GPUsPerTaskBox","UseBatchPluginBox")
+
+SUPPORTED_VERSIONS = ("12", "13", "14", "15", "16", "17", "18", "19", "20", "21", "22", "23", "24", "25", "26", "2023", "2024", "2025", "2026")
+
+def _as_version( version ):
+    # type: (str) -> int
+    # Year based releases (2023 onwards) follow on from R26, so compare them as 23, 24, etc.
+    version = int( version )
+    return version - 2000 if version >= 2000 else version
+
+# Versions that support takes (R17+) and the batch plugin (R15+).
+_TAKE_OK = frozenset( v for v in SUPPORTED_VERSIONS if _as_version( v ) >= 17 )
+_BATCH_OK = frozenset( v for v in SUPPORTED_VERSIONS if _as_version( v ) >= 15 )
 
 ########################################################################
 ## Main Function Called By Deadline
@@ -178,7 +204,7 @@ def __main__():
     scriptDialog.EndGrid()
     scriptDialog.EndTabPage()
     
-    integration_dialog = IntegrationUI.IntegrationDialog()
+    integration_dialog = GetIntegrationUI().IntegrationDialog()
     integration_dialog.AddIntegrationTabs( scriptDialog, "Cinema4DMonitor", DraftRequested, ProjectManagementOptions, failOnNoTabs=False )
     
     scriptDialog.EndTabControl()
@@ -210,16 +236,22 @@ def __main__():
     
     scriptDialog.ShowDialog( False )
     
+def GetIntegrationUI():
+    # type: () -> Any
+    # Only load the Integration UI once the dialog is actually being built. The Monitor runs this script with fresh module
+    # state every time, so there is nothing to reuse between opens.
+    return imp.load_source( 'IntegrationUI', RepositoryUtils.GetRepositoryFilePath( "submission/Integration/Main/IntegrationUI.py", True ) )
+
 def GetSettingsFilename():
     # type: () -> str
-    return Path.Combine( ClientUtils.GetUsersSettingsDirectory(), "Cinema4DSettings.ini" )
+    return _settings_filename
 
 def VersionBoxChanged():
     # type: () -> None
     global scriptDialog
     version = scriptDialog.GetValue("VersionBox")
-    scriptDialog.SetEnabled("TakeBox", int(version) >= 17 )
-    scriptDialog.SetEnabled("UseBatchPluginBox", int(version) >= 15 )
+    scriptDialog.SetEnabled("TakeBox", version in _TAKE_OK )
+    scriptDialog.SetEnabled("UseBatchPluginBox", version in _BATCH_OK )
     
 def ScriptJobChanged( *args ):
     # type: (*Any) -> None
@@ -255,25 +287,68 @@ def CloseDialog():
     scriptDialog.SaveSettings(GetSettingsFilename(),settings)
     scriptDialog.CloseDialog()
     
+def SetEnabledBulk( dialog, controls, enabled ):
+    # type: (DeadlineScriptDialog, tuple, bool) -> None
+    # DeadlineScriptDialog has no SuspendLayout/ResumeLayout, so keep related toggles together in one place.
+    for control in controls:
+        dialog.SetEnabled( control, enabled )
+
 def UseDefaultOutputChanged(*args):
     # type: (*Any) -> None
     global scriptDialog
     useDefault = scriptDialog.GetValue("UseDefaultOutputBox")
+    if _last_use_default.get("UseDefaultOutputBox") == useDefault:
+        return
+    _last_use_default["UseDefaultOutputBox"] = useDefault
     
-    scriptDialog.SetEnabled("OutputFolderBox",not useDefault)
-    scriptDialog.SetEnabled("OutputFolderLabel",not useDefault)
-    scriptDialog.SetEnabled("OutputPrefixBox",not useDefault)
-    scriptDialog.SetEnabled("OutputPrefixLabel",not useDefault)
+    SetEnabledBulk( scriptDialog, ("OutputFolderBox","OutputFolderLabel","OutputPrefixBox","OutputPrefixLabel"), not useDefault )
 
 def UseDefaultMPOutputChanged(*args):
     # type: (*Any) -> None
     global scriptDialog
     useDefault = scriptDialog.GetValue("UseDefaultMPOutputBox")
+    if _last_use_default.get("UseDefaultMPOutputBox") == useDefault:
+        return
+    _last_use_default["UseDefaultMPOutputBox"] = useDefault
+    
+    SetEnabledBulk( scriptDialog, ("OutputMPFolderBox","OutputMPFolderLabel","OutputMPPrefixBox","OutputMPPrefixLabel"), not useDefault )
+
+@lru_cache( maxsize=64 )
+def _is_dir_local( folder ):
+    # type: (str) -> bool
+    # Scene files are usually picked from the same folder, so only resolve each folder's mount point once per submission.
+    return PathUtils.IsPathLocal( folder )
+
+def GetExistingFiles( filenames ):
+    # type: (list) -> set
+    # List each parent folder once instead of checking every file, which saves a round trip per file on network shares.
+    filesByFolder = defaultdict( list )
+    for filename in filenames:
+        filesByFolder[ Path.GetDirectoryName( filename ) ].append( filename )
+    
+    existingFiles = set()
+    for folder, folderFiles in filesByFolder.items():
+        if not Directory.Exists( folder ):
+            continue
+        
+        folderContents = set( os.path.normcase( Path.GetFileName( f ) ) for f in Directory.GetFiles( folder ) )
+        existingFiles.update( f for f in folderFiles if os.path.normcase( Path.GetFileName( f ) ) in folderContents )
     
-    scriptDialog.SetEnabled("OutputMPFolderBox",not useDefault)
-    scriptDialog.SetEnabled("OutputMPFolderLabel",not useDefault)
-    scriptDialog.SetEnabled("OutputMPPrefixBox",not useDefault)
-    scriptDialog.SetEnabled("OutputMPPrefixLabel",not useDefault)
+    return existingFiles
+
+def WriteLines( writer, lines ):
+    # type: (StreamWriter, list) -> None
+    # Write everything in one call instead of crossing into .NET once per WriteLine.
+    if lines:
+        writer.Write( Environment.NewLine.join( lines ) + Environment.NewLine )
+
+def _execute_submission( arguments ):
+    # type: (StringCollection) -> int
+    # Runs on a pool thread. A submission that raises counts as a failure, so the other scenes still get submitted.
+    try:
+        return ClientUtils.ExecuteCommand( arguments )
+    except Exception:
+        return -1
 
 def CloseButtonPressed(*args):
     # type: (*ButtonControl) -> None
@@ -286,18 +361,25 @@ def SubmitButtonPressed(*args):
     
     # Check if cinema 4d files exist.
     sceneFiles = StringUtils.FromSemicolonSeparatedString( scriptDialog.GetValue( "SceneBox" ), False )
+    submitScene = scriptDialog.GetValue( "SubmitSceneBox" )
     if( len( sceneFiles ) == 0 ):
         scriptDialog.ShowMessageBox( "No Cinema 4D file specified", "Error" )
         return
     
-    for sceneFile in sceneFiles:
-        if( not File.Exists( sceneFile ) ):
-            scriptDialog.ShowMessageBox( "Cinema 4D file %s does not exist" % sceneFile, "Error" )
+    # Report every missing or local scene file at once, rather than one prompt per file.
+    existingSceneFiles = GetExistingFiles( sceneFiles )
+    missingSceneFiles = [ f for f in sceneFiles if f not in existingSceneFiles ]
+    if missingSceneFiles:
+        scriptDialog.ShowMessageBox( "The following Cinema 4D files do not exist:\n\n%s" % "\n".join( missingSceneFiles ), "Error" )
+        return
+    
+    # Drives can be mapped or unmapped between submissions from the same dialog, so check the folders again each time.
+    _is_dir_local.cache_clear()
+    localSceneFiles = [ f for f in sceneFiles if not submitScene and _is_dir_local( Path.GetDirectoryName( f ) ) ]
+    if localSceneFiles:
+        result = scriptDialog.ShowMessageBox( "The following Cinema 4D files are local:\n\n%s\n\nAre you sure you want to continue?" % "\n".join( localSceneFiles ), "Warning", ("Yes","No") )
+        if(result=="No"):
             return
-        elif (not scriptDialog.GetValue("SubmitSceneBox") and PathUtils.IsPathLocal(sceneFile)):
-            result = scriptDialog.ShowMessageBox( "Cinema 4D file %s is local.  Are you sure you want to continue?" % sceneFile, "Warning", ("Yes","No") )
-            if(result=="No"):
-                return
                 
     #Check the output folder
     outputFolder=""
@@ -359,9 +441,8 @@ def SubmitButtonPressed(*args):
             return
 
     # Gpu Options
-    regex = re.compile( "^(\d{1,2}(,\d{1,2})*)?$" )
     selectDevices = scriptDialog.GetValue( "GPUsSelectDevicesBox" )
-    validSyntax = regex.match( selectDevices )
+    validSyntax = _GPU_DEVICES_RE.match( selectDevices )
     if not validSyntax:
         scriptDialog.ShowMessageBox( "'Select GPU Devices' syntax is invalid!\n\nTrailing 'commas' if present, should be removed.\n\nValid Examples: 0 or 2 or 0,1,2 or 0,3,4 etc", "Error" )
         return
@@ -378,9 +459,14 @@ def SubmitButtonPressed(*args):
     successes = 0
     failures = 0
     
-    # Submit each scene file separately.
-    for sceneFile in sceneFiles:
-        jobName = scriptDialog.GetValue( "NameBox" )
+    # Read the remaining control values once, rather than once per scene file.
+    values = dict( ( control, scriptDialog.GetValue( control ) ) for control in SUBMISSION_CONTROLS )
+    useBatchPlugin = scriptDialog.GetEnabled( "UseBatchPluginBox" ) and ( values["UseBatchPluginBox"] or scriptJob )
+    
+    # Write the job and plugin info files for each scene file up front, so the submissions themselves can run in parallel.
+    submissions = []
+    for index, sceneFile in enumerate( sceneFiles ):
+        jobName = values["NameBox"]
         if len(sceneFiles) > 1:
             jobName = jobName + " [" + Path.GetFileName( sceneFile ) + "]"
             
@@ -388,51 +474,54 @@ def SubmitButtonPressed(*args):
             jobName = jobName + " [Script Job]"
                 
         # Create job info file.
-        jobInfoFilename = Path.Combine( ClientUtils.GetDeadlineTempPath(), "cinema4d_job_info.job" )
-        writer = StreamWriter( jobInfoFilename, False, Encoding.Unicode )
-        if scriptDialog.GetEnabled( "UseBatchPluginBox" ) and ( scriptDialog.GetValue( "UseBatchPluginBox" ) or scriptJob ):
-            writer.WriteLine( "Plugin=Cinema4DBatch" )
+        jobInfoFilename = os.path.join( _temp_path, "cinema4d_job_info_%d.job" % index )
+        lines = []
+        if useBatchPlugin:
+            lines.append( "Plugin=Cinema4DBatch" )
         else:
-            writer.WriteLine( "Plugin=Cinema4D" )
+            lines.append( "Plugin=Cinema4D" )
         
-        writer.WriteLine( "Name=%s" % jobName )
-        writer.WriteLine( "Comment=%s" % scriptDialog.GetValue( "CommentBox" ) )
-        writer.WriteLine( "Department=%s" % scriptDialog.GetValue( "DepartmentBox" ) )
-        writer.WriteLine( "Pool=%s" % scriptDialog.GetValue( "PoolBox" ) )
-        writer.WriteLine( "SecondaryPool=%s" % scriptDialog.GetValue( "SecondaryPoolBox" ) )
-        writer.WriteLine( "Group=%s" % scriptDialog.GetValue( "GroupBox" ) )
-        writer.WriteLine( "Priority=%s" % scriptDialog.GetValue( "PriorityBox" ) )
-        writer.WriteLine( "TaskTimeoutMinutes=%s" % scriptDialog.GetValue( "TaskTimeoutBox" ) )
-        writer.WriteLine( "EnableAutoTimeout=%s" % scriptDialog.GetValue( "AutoTimeoutBox" ) )
-        writer.WriteLine( "ConcurrentTasks=%s" % scriptDialog.GetValue( "ConcurrentTasksBox" ) )
-        writer.WriteLine( "LimitConcurrentTasksToNumberOfCpus=%s" % scriptDialog.GetValue( "LimitConcurrentTasksBox" ) )
+        lines.append( "Name=%s" % jobName )
+        lines.append( "Comment=%s" % values["CommentBox"] )
+        lines.append( "Department=%s" % values["DepartmentBox"] )
+        lines.append( "Pool=%s" % values["PoolBox"] )
+        lines.append( "SecondaryPool=%s" % values["SecondaryPoolBox"] )
+        lines.append( "Group=%s" % values["GroupBox"] )
+        lines.append( "Priority=%s" % values["PriorityBox"] )
+        lines.append( "TaskTimeoutMinutes=%s" % values["TaskTimeoutBox"] )
+        lines.append( "EnableAutoTimeout=%s" % values["AutoTimeoutBox"] )
+        lines.append( "ConcurrentTasks=%s" % values["ConcurrentTasksBox"] )
+        lines.append( "LimitConcurrentTasksToNumberOfCpus=%s" % values["LimitConcurrentTasksBox"] )
         
-        writer.WriteLine( "MachineLimit=%s" % scriptDialog.GetValue( "MachineLimitBox" ) )
-        if( bool(scriptDialog.GetValue( "IsBlacklistBox" )) ):
-            writer.WriteLine( "Blacklist=%s" % scriptDialog.GetValue( "MachineListBox" ) )
+        lines.append( "MachineLimit=%s" % values["MachineLimitBox"] )
+        if( bool(values["IsBlacklistBox"]) ):
+            lines.append( "Blacklist=%s" % values["MachineListBox"] )
         else:
-            writer.WriteLine( "Whitelist=%s" % scriptDialog.GetValue( "MachineListBox" ) )
+            lines.append( "Whitelist=%s" % values["MachineListBox"] )
         
-        writer.WriteLine( "LimitGroups=%s" % scriptDialog.GetValue( "LimitGroupBox" ) )
-        writer.WriteLine( "JobDependencies=%s" % scriptDialog.GetValue( "DependencyBox" ) )
-        writer.WriteLine( "OnJobComplete=%s" % scriptDialog.GetValue( "OnJobCompleteBox" ) )
+        lines.append( "LimitGroups=%s" % values["LimitGroupBox"] )
+        lines.append( "JobDependencies=%s" % values["DependencyBox"] )
+        lines.append( "OnJobComplete=%s" % values["OnJobCompleteBox"] )
         
-        if( bool(scriptDialog.GetValue( "SubmitSuspendedBox" )) ):
-            writer.WriteLine( "InitialStatus=Suspended" )
+        if( bool(values["SubmitSuspendedBox"]) ):
+            lines.append( "InitialStatus=Suspended" )
         
-        writer.WriteLine( "Frames=%s" % frames )
-        writer.WriteLine( "ChunkSize=%s" % scriptDialog.GetValue( "ChunkSizeBox" ) )
+        lines.append( "Frames=%s" % frames )
+        lines.append( "ChunkSize=%s" % values["ChunkSizeBox"] )
         
         if not scriptJob:
             outputCount = 0
             if outputFolder != "":
-                writer.WriteLine( "OutputDirectory" + str(outputCount) + "=" + outputFolder )
+                lines.append( "OutputDirectory" + str(outputCount) + "=" + outputFolder )
                 outputCount = outputCount + 1
             
             if outputMPFolder != "":
-                writer.WriteLine( "OutputDirectory" + str(outputCount) + "=" + outputMPFolder )
+                lines.append( "OutputDirectory" + str(outputCount) + "=" + outputMPFolder )
                 outputCount = outputCount + 1
         
+        writer = StreamWriter( jobInfoFilename, False, Encoding.Unicode )
+        WriteLines( writer, lines )
+        
         # Integration
         extraKVPIndex = 0
         groupBatch = False
@@ -445,33 +534,35 @@ def SubmitButtonPressed(*args):
         writer.Close()
         
         # Create plugin info file.
-        pluginInfoFilename = Path.Combine( ClientUtils.GetDeadlineTempPath(), "cinema4d_plugin_info.job" )
-        writer = StreamWriter( pluginInfoFilename, False, Encoding.Unicode )
+        pluginInfoFilename = os.path.join( _temp_path, "cinema4d_plugin_info_%d.job" % index )
+        lines = []
         
-        if( not scriptDialog.GetValue( "SubmitSceneBox" ) ):
-            writer.WriteLine( "SceneFile=" + sceneFile )
+        if( not submitScene ):
+            lines.append( "SceneFile=" + sceneFile )
 
-        writer.WriteLine( "Version=" + scriptDialog.GetValue( "VersionBox" ) )
-        writer.WriteLine( "Build=" + scriptDialog.GetValue( "BuildBox" ) )
-        writer.WriteLine( "NoOpenGL=" + str( scriptDialog.GetValue( "NoOpenGLBox" ) ) )
+        lines.append( "Version=" + values["VersionBox"] )
+        lines.append( "Build=" + values["BuildBox"] )
+        lines.append( "NoOpenGL=" + str( values["NoOpenGLBox"] ) )
         if scriptJob:
-            writer.WriteLine( "ScriptJob=True" )
-            writer.WriteLine( "ScriptFilename=%s" % Path.GetFileName( scriptFile ) )
+            lines.append( "ScriptJob=True" )
+            lines.append( "ScriptFilename=%s" % Path.GetFileName( scriptFile ) )
         else:
-            writer.WriteLine( "Threads=" + str( scriptDialog.GetValue( "ThreadsBox" ) ) )
-            writer.WriteLine( "Width=0" )
-            writer.WriteLine( "Height=0" )
-            writer.WriteLine( "LocalRendering=" + str( scriptDialog.GetValue( "LocalRenderingBox" ) ) )
-            writer.WriteLine( "FilePath=" + outputFolder )
-            writer.WriteLine( "FilePrefix=" + outputPrefix )
-            writer.WriteLine( "MultiFilePath=" + outputMPFolder )
-            writer.WriteLine( "MultiFilePrefix=" + outputMPPrefix )
-            writer.WriteLine( "Take=" + str( scriptDialog.GetValue( "TakeBox" ) ) )
+            lines.append( "Threads=" + str( values["ThreadsBox"] ) )
+            lines.append( "Width=0" )
+            lines.append( "Height=0" )
+            lines.append( "LocalRendering=" + str( values["LocalRenderingBox"] ) )
+            lines.append( "FilePath=" + outputFolder )
+            lines.append( "FilePrefix=" + outputPrefix )
+            lines.append( "MultiFilePath=" + outputMPFolder )
+            lines.append( "MultiFilePrefix=" + outputMPPrefix )
+            lines.append( "Take=" + str( values["TakeBox"] ) )
 
             # Gpu Options - Only affects when using Redshift
-            writer.WriteLine( "GPUsPerTask=%s" % scriptDialog.GetValue( "GPUsPerTaskBox" ) )
-            writer.WriteLine( "GPUsSelectDevices=%s" % selectDevices )
+            lines.append( "GPUsPerTask=%s" % values["GPUsPerTaskBox"] )
+            lines.append( "GPUsSelectDevices=%s" % selectDevices )
         
+        writer = StreamWriter( pluginInfoFilename, False, Encoding.Unicode )
+        WriteLines( writer, lines )
         writer.Close()
         
         # Setup the command line arguments.
@@ -480,24 +571,24 @@ def SubmitButtonPressed(*args):
         arguments.Add( jobInfoFilename )
         arguments.Add( pluginInfoFilename )
         
-        if scriptDialog.GetValue( "SubmitSceneBox" ):
+        if submitScene:
             arguments.Add( sceneFile )
 
         if scriptJob:
             arguments.Add( scriptFile )
         
-        if( len( sceneFiles ) == 1 ):
-            results = ClientUtils.ExecuteCommandAndGetOutput( arguments )
-            scriptDialog.ShowMessageBox( results, "Submission Results" )
-        else:
-            # Now submit the job.
-            exitCode = ClientUtils.ExecuteCommand( arguments )
-            if( exitCode == 0 ):
-                successes = successes + 1
-            else:
-                failures = failures + 1
+        submissions.append( arguments )
+    
+    if( len( sceneFiles ) == 1 ):
+        results = ClientUtils.ExecuteCommandAndGetOutput( submissions[0] )
+        scriptDialog.ShowMessageBox( results, "Submission Results" )
+    else:
+        # Now submit the jobs. Each submission spends most of its time waiting on deadlinecommand, so overlap them.
+        with ThreadPoolExecutor( max_workers=min( MAX_SUBMISSION_THREADS, len( submissions ) ) ) as executor:
+            exitCodes = list( executor.map( _execute_submission, submissions ) )
         
-    if( len( sceneFiles ) > 1 ):
+        successes = sum( 1 for exitCode in exitCodes if exitCode == 0 )
+        failures = len( exitCodes ) - successes
         scriptDialog.ShowMessageBox( "Jobs submitted successfully: %d\nJobs not submitted: %d" % (successes, failures), "Submission Results" )
     
     if successes > 0:
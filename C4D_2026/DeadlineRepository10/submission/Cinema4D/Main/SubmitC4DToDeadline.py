@@ -3,8 +3,11 @@
 
 from __future__ import print_function
 
+import getpass
+import importlib.util
 import io
 import json
+import locale
 import os
 import re
 import shutil
@@ -12,48 +15,82 @@ import string
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import traceback
+import types
 from collections import namedtuple
-from functools import partial
+from functools import lru_cache, partial
 
+import configparser as ConfigParser
+
+# orjson is not shipped with C4D, but use it for the submitter info if it has been installed.
 try:
-    import ConfigParser
+    from orjson import loads as json_loads
 except ImportError:
-    try:
-        import configparser as ConfigParser
-    except ImportError:
-        print( "Could not load ConfigParser module, sticky settings will not be loaded/saved" )
-    
+    json_loads = json.loads
+
 import c4d
 from c4d import documents
 from c4d import gui
 from c4d import plugins
 
-try:
-    unicode_type = unicode
-except:
-    unicode_type = str    
-    
-useTakes = False
-try:
-    from c4d.modules import takesystem
-    useTakes = True
-except ImportError:
-    print( "Could not load takesystem module, modules will not be used." )
-
-useTokens = False
-try:
-    from c4d.modules import tokensystem
-    useTokens = True
-except ImportError:
-    print( "Could not load tokensystem module, module will not be used." )
+# The take and token systems have shipped with every version of C4D this submitter supports,
+# the flags are kept for the code paths that still check them.
+from c4d.modules import takesystem
+from c4d.modules import tokensystem
+useTakes = True
+useTokens = True
 
 import deadlinec4d
 
 # A rectangular region
 Region = namedtuple( "Region", [ "left", "top", "right", "bottom" ] )
 
+def _get_user_name():
+    """
+    :return: The current user's name, made safe to use in a file name, or an empty string if it can't be found.
+    """
+    try:
+        return re.sub( r"[^\w.-]", "_", getpass.getuser() )
+    except Exception:
+        return ""
+
+# The submitter info rarely changes, so it is reused for SUBMISSION_INFO_CACHE_TTL seconds, both in memory and on disk
+# so it also carries over to the next C4D session. The info includes the user's Deadline home folder, so each user gets
+# their own cache file. Both caches are tied to the user, the deadlinecommand install and the repository the info was
+# read from, see _get_submission_info_cache_key.
+SUBMISSION_INFO_CACHE_FILE = os.path.join( tempfile.gettempdir(), "c4d_deadline_subinfo_%s.json" % _get_user_name() )
+SUBMISSION_INFO_CACHE_TTL = 300
+# A ( cache key, submitter info, time the info was fetched ) tuple.
+_SUBMISSION_INFO_CACHE = None
+
+# The Deadline client settings files that hold the repository root, the user's own settings first.
+if os.name == 'nt':
+    DEADLINE_CLIENT_INI_FILES = (
+        os.path.join( os.environ.get( "LOCALAPPDATA", "" ), "Thinkbox", "Deadline10", "deadline.ini" ),
+        os.path.join( os.environ.get( "PROGRAMDATA", "C:\\ProgramData" ), "Thinkbox", "Deadline10", "deadline.ini" ),
+    )
+else:
+    DEADLINE_CLIENT_INI_FILES = (
+        os.path.join( os.path.expanduser( "~" ), "Thinkbox", "Deadline10", "deadline.ini" ),
+        os.path.join( os.path.expanduser( "~" ), "Library", "Application Support", "Thinkbox", "Deadline10", "deadline.ini" ),
+        "/Users/Shared/Thinkbox/Deadline10/deadline.ini",
+        "/var/lib/Thinkbox/Deadline10/deadline.ini",
+    )
+
+# The pipeline tools status for each scene, kept across dialog opens. See SubmitC4DToDeadlineDialog.getPipelineToolStatusCacheKey.
+_PIPELINE_TOOL_STATUS_CACHE = {}
+
+# Converters for the sticky settings types. Anything other than a true value reads back as False, rather than raising
+# like ConfigParser.getboolean does.
+_STICKY_TRUE_VALUES = frozenset( ( "1", "yes", "true", "on" ) )
+_STICKY_CONVERTERS = {
+    bool: lambda value: value.strip().lower() in _STICKY_TRUE_VALUES,
+    int: int,
+    str: str,
+}
+
 
 ## The submission dialog class.
 class SubmitC4DToDeadlineDialog( gui.GeDialog ):
@@ -63,6 +100,10 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
     ComboBoxWidth = 180
     RangeBoxWidth = 190
     SliderLabelWidth = 180
+    # Derived widths used throughout the layout, computed once here rather than per control.
+    CheckboxWidth = LabelWidth + ComboBoxWidth + 12
+    SelectionBoxWidth = TextBoxWidth - 56
+    RangeBoxSpacerWidth = LabelWidth + RangeBoxWidth + 4
 
     renderersDict = {
         # third-party
@@ -84,7 +125,13 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         1016630 : "cineman"
     }
 
-    gpuRenderers = [ "redshift" ]
+    # Reverse lookup of renderer name to renderer/video post ID.
+    rendererIDs = { name: rendererID for rendererID, name in renderersDict.items() }
+
+    gpuRenderers = frozenset( [ "redshift" ] )
+    # Built with map, since a generator in the class body can't see the other class attributes.
+    gpuRendererIDs = frozenset( map( rendererIDs.__getitem__, gpuRenderers ) )
+    VRAY5_RENDERER_ID = rendererIDs[ "vray_5" ]
 
     mPassTypePrefixDict ={
         c4d.VPBUFFER_AMBIENT : "ambient",               # Ambient
@@ -144,70 +191,367 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
     USER_PASS_TOKEN = "$userpass"
     FRAME_PLACEHOLDER = "####"
 
+    # Precompiled patterns for the output path tokens and frame strings above.
+    PASS_TOKENS_RE = re.compile( r"\$(?:userpass|pass)" )
+    DOTTED_PASS_TOKENS_RE = re.compile( r"\.?\$(?:userpass|pass)" )
+    RENDER_ELEMENT_SEPARATORS_RE = re.compile( r"[\s-]" )
+    FRAME_PADDING_RE = re.compile( r"#{3,4}" )
+    FRAME_STEP_RE = re.compile( r"x(\d+)" )
+
+    # The five entries a tile rendering config file has for each tile.
+    DTA_TILE_CONFIG_TEMPLATE = "Tile{0}FileName={1}\nTile{0}X={2}\nTile{0}Y={3}\nTile{0}Width={4}\nTile{0}Height={5}"
+
+    # V-Ray formats that always write the RGB pass and every render element into a single file.
+    VRAY5_SINGLE_FILE_FORMATS = frozenset( ( "exr", "vrimg" ) )
+    # Output extensions that Octane standalone jobs can write.
+    OCTANE_OUTPUT_EXTENSIONS = frozenset( ( "png", "exr" ) )
+    # Octane buffer types Deadline supports. 2 is Float (tonemapped). 3 is Float (Linear).
+    OCTANE_BUFFER_TYPES = frozenset( ( 2, 3 ) )
+    # Octane render pass formats that are EXR. 3 is EXR. 8 is EXR(Octane).
+    OCTANE_EXR_PASS_FORMATS = frozenset( ( 3, 8 ) )
+    # Octane's EXR compression IDs and the names the Deadline submitter uses for them.
+    OCTANE_COMPRESSIONS = {
+        0: "Uncompressed",
+        1: "RLE (lossless)",
+        2: "ZIPS (lossless)",
+        3: "ZIP (lossless)",
+        4: "PIZ (lossless)",
+        5: "PXR24 (lossy)",
+        6: "B44 (lossy)",
+        7: "B44A (lossy)",
+        8: "DWAA (lossy)",
+        9: "DWAB (lossy)",
+    }
+    # Octane major versions in C4D that Deadline knows by a different version.
+    OCTANE_C4D_TO_DEADLINE_VERSIONS = { "5": "2018", "6": "2019", "10": "2020" }
+
+    # The names of every dialog control we need to reference. Each one is assigned a fixed integer ID as a class
+    # attribute (eg. SubmitC4DToDeadlineDialog.NameBoxID) once the class has been defined.
+    DIALOG_ID_NAMES = (
+        # Job Options
+        "NameBoxID",
+        "CommentBoxID",
+        "DepartmentBoxID",
+        "PoolBoxID",
+        "SecondaryPoolBoxID",
+        "GroupBoxID",
+        "PriorityBoxID",
+        "UseBatchBoxID",
+        "AutoTimeoutBoxID",
+        "TaskTimeoutBoxID",
+        "ConcurrentTasksBoxID",
+        "LimitConcurrentTasksBoxID",
+        "MachineLimitBoxID",
+        "IsBlacklistBoxID",
+        "MachineListBoxID",
+        "MachineListButtonID",
+        "LimitGroupsBoxID",
+        "LimitGroupsButtonID",
+        "DependenciesBoxID",
+        "DependenciesButtonID",
+        "OnCompleteBoxID",
+        "SubmitSuspendedBoxID",
+        "FramesBoxID",
+        "EnableFrameStepBoxID",
+        "TakeFramesBoxID",
+
+        # Cinema4D Options
+        "ChunkSizeBoxID",
+        "ThreadsBoxID",
+        "TakesBoxID",
+        "IncludeMainBoxID",
+        "BuildBoxID",
+        "LocalRenderingBoxID",
+        "SubmitSceneBoxID",
+        "ExportProjectBoxID",
+        "CloseOnSubmissionID",
+        "OpenGLBoxID",
+
+        # Output Override Options
+        "OutputOverrideID",
+        "OutputOverrideButtonID",
+        "OutputMultipassOverrideID",
+        "OutputMultipassOverrideButtonID",
+
+        # Gpu Override Options
+        "GPUsPerTaskID",
+        "SelectGPUDevicesID",
+
+        # AWS Portal Options
+        "EnableAssetServerPrecachingID",
+
+        # Export Options
+        "ExportJobID",
+        "ExportJobTypesID",
+        "ExportLocalID",
+        "ExportDependentJobBoxID",
+
+        # General Export Options
+        "ExportPoolBoxID",
+        "ExportSecondaryPoolBoxID",
+        "ExportGroupBoxID",
+        "ExportPriorityBoxID",
+        "ExportMachineLimitBoxID",
+        "ExportConcurrentTasksBoxID",
+        "ExportTaskTimeoutBoxID",
+        "ExportLimitGroupsBoxID",
+        "ExportLimitGroupsButtonID",
+        "ExportMachineListBoxID",
+        "ExportMachineListButtonID",
+        "ExportOnCompleteBoxID",
+        "ExportIsBlacklistBoxID",
+        "ExportThreadsBoxID",
+        "ExportSubmitSuspendedBoxID",
+        "ExportLimitConcurrentTasksBoxID",
+        "ExportAutoTimeoutBoxID",
+        "ExportLocationBoxID",
+        "ExportLocationButtonID",
+
+        # Region Rendering Options
+        "RegionRenderTypeID",
+        "EnableRegionRenderingID",
+        "TilesInXID",
+        "TilesInYID",
+        "SingleFrameTileJobID",
+        "SingleFrameJobFrameID",
+        "SubmitDependentAssemblyID",
+        "CleanupTilesID",
+        "ErrorOnMissingTilesID",
+        "AssembleTilesOverID",
+        "BackgroundImageID",
+        "BackgroundImageButtonID",
+        "ErrorOnMissingBackgroundID",
+
+        # Generic Dialog Buttons
+        "PipelineToolStatusID",
+        "SubmitButtonID",
+        "CancelButtonID",
+        "UnifiedIntegrationButtonID",
+    )
+
+    # The dialog control IDs by name. The dict is kept for scripts such as CustomSanityChecks.py that look IDs up by name.
+    dialogIDs = { name: index for index, name in enumerate( DIALOG_ID_NAMES, 1 ) }
+
+    # Controls that are only enabled when a dependent export job is being submitted.
+    DEPENDENT_EXPORT_IDS = tuple( map( dialogIDs.__getitem__, (
+        "ExportPoolBoxID",
+        "ExportSecondaryPoolBoxID",
+        "ExportGroupBoxID",
+        "ExportPriorityBoxID",
+        "ExportThreadsBoxID",
+        "ExportTaskTimeoutBoxID",
+        "ExportAutoTimeoutBoxID",
+        "ExportConcurrentTasksBoxID",
+        "ExportLimitConcurrentTasksBoxID",
+        "ExportMachineLimitBoxID",
+        "ExportIsBlacklistBoxID",
+        "ExportMachineListBoxID",
+        "ExportMachineListButtonID",
+        "ExportLimitGroupsBoxID",
+        "ExportLimitGroupsButtonID",
+        "ExportOnCompleteBoxID",
+        "ExportSubmitSuspendedBoxID",
+        "ExportLocalID",
+    ) ) )
+
+    # Controls that are only enabled when region rendering is enabled.
+    REGION_RENDERING_IDS = tuple( map( dialogIDs.__getitem__, (
+        "TilesInXID",
+        "TilesInYID",
+        "SingleFrameTileJobID",
+        "SubmitDependentAssemblyID",
+        "CleanupTilesID",
+        "ErrorOnMissingTilesID",
+        "AssembleTilesOverID",
+    ) ) )
+
+    # Controls that depend on what the tiles are assembled over, and whether each one is enabled for every AssembleOver option.
+    ASSEMBLE_OVER_IDS = tuple( map( dialogIDs.__getitem__, (
+        "BackgroundImageID",
+        "BackgroundImageButtonID",
+        "ErrorOnMissingBackgroundID",
+    ) ) )
+    # Job info entries for the dependent export job that are read straight from an integer or checkbox control.
+    EXPORT_LONG_SETTINGS = (
+        ( "Priority", dialogIDs[ "ExportPriorityBoxID" ] ),
+        ( "MachineLimit", dialogIDs[ "ExportMachineLimitBoxID" ] ),
+        ( "TaskTimeoutMinutes", dialogIDs[ "ExportTaskTimeoutBoxID" ] ),
+        ( "ConcurrentTasks", dialogIDs[ "ExportConcurrentTasksBoxID" ] ),
+    )
+    EXPORT_BOOL_SETTINGS = (
+        ( "EnableAutoTimeout", dialogIDs[ "ExportAutoTimeoutBoxID" ] ),
+        ( "LimitConcurrentTasksToNumberOfCpus", dialogIDs[ "ExportLimitConcurrentTasksBoxID" ] ),
+    )
+
+    ASSEMBLE_OVER_STATES = (
+        ( False, False, False ), # Blank Image
+        ( False, False, True ), # Previous Output
+        ( True, True, True ), # Selected Image
+    )
+
+    # The settings saved in the Sticky section of the settings file, and the type each one is read back as.
+    STICKY_SETTINGS = (
+        ( "Department", str ),
+        ( "Pool", str ),
+        ( "SecondaryPool", str ),
+        ( "Group", str ),
+        ( "Priority", int ),
+        ( "MachineLimit", int ),
+        ( "LimitGroups", str ),
+        ( "ConcurrentTasks", int ),
+        ( "IsBlacklist", bool ),
+        ( "MachineList", str ),
+        ( "SubmitSuspended", bool ),
+        ( "ChunkSize", int ),
+
+        ( "IncludeMainTake", bool ),
+        ( "OutputOverride", str ),
+        ( "OutputMultipassOverride", str ),
+        ( "UseTakeFrames", bool ),
+        ( "SubmitScene", bool ),
+        ( "Threads", int ),
+        ( "ExportProject", bool ),
+        ( "Build", str ),
+        ( "LocalRendering", bool ),
+        ( "CloseOnSubmission", bool ),
+        ( "UseBatchPlugin", bool ),
+
+        ( "ExportJob", bool ),
+        ( "ExportDependentJob", bool ),
+        ( "LocalExport", bool ),
+        ( "ExportPool", str ),
+        ( "ExportSecondaryPool", str ),
+        ( "ExportGroup", str ),
+        ( "ExportPriority", int ),
+        ( "ExportMachineLimit", int ),
+        ( "ExportLimitGroups", str ),
+        ( "ExportIsBlacklist", bool ),
+        ( "ExportMachineList", str ),
+        ( "ExportSubmitSuspended", bool ),
+        ( "ExportThreads", int ),
+        ( "ExportOutputLocation", str ),
+
+        ( "EnableRegionRendering", bool ),
+        ( "TilesInX", int ),
+        ( "TilesInY", int ),
+        ( "SingleFrameTileJob", bool ),
+        ( "SingleFrameJobFrame", int ),
+        ( "SubmitDependentAssembly", bool ),
+        ( "CleanupTiles", bool ),
+        ( "ErrorOnMissingTiles", bool ),
+        ( "AssembleTilesOver", str ),
+        ( "BackgroundImage", str ),
+        ( "ErrorOnMissingBackground", bool ),
+        ( "SelectedAssembleOver", int ),
+
+        ( "GPUsPerTask", int ),
+        ( "GPUsSelectDevices", str ),
+
+        ( "EnableAssetServerPrecaching", bool ),
+    )
+    # The same settings with the lowercase option name ConfigParser stores them under, so it isn't worked out on every read.
+    STICKY_OPTIONS = tuple( ( name, name.lower(), valueType ) for name, valueType in STICKY_SETTINGS )
+
+    # The sticky settings written straight from a text, integer or checkbox control, and the control each one is read from.
+    STICKY_STRING_CONTROLS = (
+        ( "Department", dialogIDs[ "DepartmentBoxID" ] ),
+        ( "MachineList", dialogIDs[ "MachineListBoxID" ] ),
+        ( "LimitGroups", dialogIDs[ "LimitGroupsBoxID" ] ),
+        ( "ExportMachineList", dialogIDs[ "ExportMachineListBoxID" ] ),
+        ( "ExportLimitGroups", dialogIDs[ "ExportLimitGroupsBoxID" ] ),
+        ( "ExportOutputLocation", dialogIDs[ "ExportLocationBoxID" ] ),
+        ( "BackgroundImage", dialogIDs[ "BackgroundImageID" ] ),
+        ( "OutputOverride", dialogIDs[ "OutputOverrideID" ] ),
+        ( "OutputMultipassOverride", dialogIDs[ "OutputMultipassOverrideID" ] ),
+        ( "GPUsSelectDevices", dialogIDs[ "SelectGPUDevicesID" ] ),
+    )
+    STICKY_LONG_CONTROLS = (
+        ( "Priority", dialogIDs[ "PriorityBoxID" ] ),
+        ( "MachineLimit", dialogIDs[ "MachineLimitBoxID" ] ),
+        ( "ConcurrentTasks", dialogIDs[ "ConcurrentTasksBoxID" ] ),
+        ( "ChunkSize", dialogIDs[ "ChunkSizeBoxID" ] ),
+        ( "Threads", dialogIDs[ "ThreadsBoxID" ] ),
+        ( "ExportPriority", dialogIDs[ "ExportPriorityBoxID" ] ),
+        ( "ExportMachineLimit", dialogIDs[ "ExportMachineLimitBoxID" ] ),
+        ( "ExportThreads", dialogIDs[ "ExportThreadsBoxID" ] ),
+        ( "TilesInX", dialogIDs[ "TilesInXID" ] ),
+        ( "TilesInY", dialogIDs[ "TilesInYID" ] ),
+        ( "SingleFrameJobFrame", dialogIDs[ "SingleFrameJobFrameID" ] ),
+        ( "GPUsPerTask", dialogIDs[ "GPUsPerTaskID" ] ),
+    )
+    STICKY_BOOL_CONTROLS = (
+        ( "IsBlacklist", dialogIDs[ "IsBlacklistBoxID" ] ),
+        ( "SubmitSuspended", dialogIDs[ "SubmitSuspendedBoxID" ] ),
+        ( "IncludeMainTake", dialogIDs[ "IncludeMainBoxID" ] ),
+        ( "UseTakeFrames", dialogIDs[ "TakeFramesBoxID" ] ),
+        ( "SubmitScene", dialogIDs[ "SubmitSceneBoxID" ] ),
+        ( "ExportProject", dialogIDs[ "ExportProjectBoxID" ] ),
+        ( "LocalRendering", dialogIDs[ "LocalRenderingBoxID" ] ),
+        ( "CloseOnSubmission", dialogIDs[ "CloseOnSubmissionID" ] ),
+        ( "UseBatchPlugin", dialogIDs[ "UseBatchBoxID" ] ),
+        ( "ExportJob", dialogIDs[ "ExportJobID" ] ),
+        ( "ExportDependentJob", dialogIDs[ "ExportDependentJobBoxID" ] ),
+        ( "LocalExport", dialogIDs[ "ExportLocalID" ] ),
+        ( "ExportIsBlacklist", dialogIDs[ "ExportIsBlacklistBoxID" ] ),
+        ( "ExportSubmitSuspended", dialogIDs[ "ExportSubmitSuspendedBoxID" ] ),
+        ( "EnableRegionRendering", dialogIDs[ "EnableRegionRenderingID" ] ),
+        ( "SingleFrameTileJob", dialogIDs[ "SingleFrameTileJobID" ] ),
+        ( "SubmitDependentAssembly", dialogIDs[ "SubmitDependentAssemblyID" ] ),
+        ( "CleanupTiles", dialogIDs[ "CleanupTilesID" ] ),
+        ( "ErrorOnMissingTiles", dialogIDs[ "ErrorOnMissingTilesID" ] ),
+        ( "ErrorOnMissingBackground", dialogIDs[ "ErrorOnMissingBackgroundID" ] ),
+        ( "EnableAssetServerPrecaching", dialogIDs[ "EnableAssetServerPrecachingID" ] ),
+    )
+    # Combo boxes save the selected option's name rather than its index, so each one also names the attribute holding its options.
+    STICKY_COMBO_CONTROLS = (
+        ( "Pool", dialogIDs[ "PoolBoxID" ], "Pools" ),
+        ( "SecondaryPool", dialogIDs[ "SecondaryPoolBoxID" ], "SecondaryPools" ),
+        ( "Group", dialogIDs[ "GroupBoxID" ], "Groups" ),
+        ( "Build", dialogIDs[ "BuildBoxID" ], "Builds" ),
+        ( "ExportPool", dialogIDs[ "ExportPoolBoxID" ], "Pools" ),
+        ( "ExportSecondaryPool", dialogIDs[ "ExportSecondaryPoolBoxID" ], "SecondaryPools" ),
+        ( "ExportGroup", dialogIDs[ "ExportGroupBoxID" ], "Groups" ),
+        ( "AssembleTilesOver", dialogIDs[ "AssembleTilesOverID" ], "AssembleOver" ),
+    )
+    STICKY_CONTROL_NAMES = tuple( name for name, dialogID in STICKY_STRING_CONTROLS + STICKY_LONG_CONTROLS + STICKY_BOOL_CONTROLS ) + \
+        tuple( name for name, dialogID, optionsName in STICKY_COMBO_CONTROLS )
+
+    # Every control read by readDialogState: the sticky controls plus the ones SubmitJob needs that aren't saved.
+    DIALOG_STATE_STRING_CONTROLS = STICKY_STRING_CONTROLS + (
+        ( "JobName", dialogIDs[ "NameBoxID" ] ),
+        ( "Comment", dialogIDs[ "CommentBoxID" ] ),
+        ( "Dependencies", dialogIDs[ "DependenciesBoxID" ] ),
+        ( "Frames", dialogIDs[ "FramesBoxID" ] ),
+    )
+    DIALOG_STATE_LONG_CONTROLS = STICKY_LONG_CONTROLS + (
+        ( "TaskTimeout", dialogIDs[ "TaskTimeoutBoxID" ] ),
+    )
+    DIALOG_STATE_BOOL_CONTROLS = STICKY_BOOL_CONTROLS + (
+        ( "AutoTimeout", dialogIDs[ "AutoTimeoutBoxID" ] ),
+        ( "LimitConcurrentTasks", dialogIDs[ "LimitConcurrentTasksBoxID" ] ),
+        ( "EnableFrameStep", dialogIDs[ "EnableFrameStepBoxID" ] ),
+        ( "DisableOpenGL", dialogIDs[ "OpenGLBoxID" ] ),
+    )
+    DIALOG_STATE_COMBO_CONTROLS = STICKY_COMBO_CONTROLS + (
+        ( "OnComplete", dialogIDs[ "OnCompleteBoxID" ], "OnComplete" ),
+        ( "Exporter", dialogIDs[ "ExportJobTypesID" ], "Exporters" ),
+    )
+
     def __init__( self ):
         c4d.StatusSetBar( 25 )
         stdout = None
         self.c4dMajorVersion = c4d.GetC4DVersion() // 1000
+        # The Cinema4DBatch plugin needs Cinema 4D R15 or later.
+        self.batchSupported = self.c4dMajorVersion >= 15
         
+        # Grab the submitter info in the background so the dialog layout can be built in the meantime.
+        # It is collected in InitValues, which is the first place that needs it.
         print( "Grabbing submitter info..." )
-        try:
-            dcOutput = CallDeadlineCommand( [ "-prettyJSON", "-GetSubmissionInfo", "Pools", "Groups", "MaxPriority", "TaskLimit", "UserHomeDir", "RepoDir:submission/Cinema4D/Main", "RepoDir:submission/Integration/Main", ], useDeadlineBg=True )
-            output = json.loads( dcOutput )
-        except:
-            gui.MessageDialog( "Unable to get submitter info from Deadline:\n\n" + traceback.format_exc() )
-            raise
-        
-        if output[ "ok" ]:
-            self.SubmissionInfo = output[ "result" ]
-        else:
-            gui.MessageDialog( "DeadlineCommand returned a bad result and was unable to grab the submitter info.\n\n" + output[ "result" ] )
-            c4d.StatusClear()
-            raise Exception( output[ "result" ] )
-        
-        c4d.StatusSetBar( 70 )
-        
-        # Pools
-        self.Pools = []
-        self.SecondaryPools = [ " " ] # Need to have a space, since empty strings don't seem to show up.
-        for pool in self.SubmissionInfo[ "Pools" ]:
-            pool = pool.strip()
-            self.Pools.append( pool )
-            self.SecondaryPools.append( pool ) 
-            
-        if not self.Pools:
-            self.Pools.append( "none" )
-            self.SecondaryPools.append( "none" ) 
-        
-        c4d.StatusSetBar( 75 )
-        
-        # Groups
-        self.Groups = []
-        for group in self.SubmissionInfo[ "Groups" ]:
-            self.Groups.append( group.strip() )
-        
-        if not self.Groups:
-            self.Groups.append( "none" )
-            
-        c4d.StatusSetBar( 80 )
-        
-        # Maximum Priority / Task Limit
-        self.MaximumPriority = int( self.SubmissionInfo.get( "MaxPriority", 100 ) )
-        self.TaskLimit = int( self.SubmissionInfo.get( "TaskLimit", 5000 ) )
-        
-        c4d.StatusSetBar( 85 )
-        
-        # User Home Deadline Directory
-        self.DeadlineHome = self.SubmissionInfo[ "UserHomeDir" ].strip()
-        self.DeadlineSettings = os.path.join( self.DeadlineHome, "settings" )
-        self.DeadlineTemp = os.path.join( self.DeadlineHome, "temp" )
-        
-        c4d.StatusSetBar( 90 )
-        
-        # Repository Directories
-        self.C4DSubmissionDir = self.SubmissionInfo[ "RepoDirs" ][ "submission/Cinema4D/Main" ].strip()
-        self.IntegrationDir = self.SubmissionInfo[ "RepoDirs" ][ "submission/Integration/Main" ].strip()
-        
-        c4d.StatusSetBar( 100 )
+        self.submissionInfoOutput = None
+        self.submissionInfoError = ""
+        self.submissionInfoThread = threading.Thread( target=self.fetchSubmissionInfo )
+        self.submissionInfoThread.daemon = True
+        self.submissionInfoThread.start()
         
         # Set On Job Complete settings.
         self.OnComplete = ( "Archive", "Delete", "Nothing" )
@@ -215,130 +559,106 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         # Set Build settings.
         self.Builds = ( "None", "32bit", "64bit" )
         
-        self.Exporters = []
-        if plugins.FindPlugin( SubmitC4DToDeadlineDialog.ARNOLD_PLUGIN_ID ) is not None:
-            self.Exporters.append( "Arnold" )
-        if plugins.FindPlugin( SubmitC4DToDeadlineDialog.OCTANE_PLUGIN_ID ) is not None:
-            self.Exporters.append( "Octane" )
-        if plugins.FindPlugin( SubmitC4DToDeadlineDialog.REDSHIFT_PLUGIN_ID ) is not None:
-            self.Exporters.append( "Redshift" )
-
-        self.Takes = []
+        exporters = []
+        if _find_plugin( SubmitC4DToDeadlineDialog.ARNOLD_PLUGIN_ID ) is not None:
+            exporters.append( "Arnold" )
+        if _find_plugin( SubmitC4DToDeadlineDialog.OCTANE_PLUGIN_ID ) is not None:
+            exporters.append( "Octane" )
+        if _find_plugin( SubmitC4DToDeadlineDialog.REDSHIFT_PLUGIN_ID ) is not None:
+            exporters.append( "Redshift" )
+        self.Exporters = tuple( exporters )
+
+        self.Takes = ()
         if useTakes:
-            self.Takes = ["Active", "All"]
+            self.Takes = ( "Active", "All" )
             if deadlinec4d.takes.can_takes_be_checked():
-                self.Takes.append("Marked")
-        
-        self.AssembleOver = [ "Blank Image", "Previous Output", "Selected Image" ]
-        
-        self.dialogIDs = {
-            # Job Options
-            "NameBoxID" : 0,
-            "CommentBoxID" : 0,
-            "DepartmentBoxID" : 0,
-            "PoolBoxID" : 0,
-            "SecondaryPoolBoxID" : 0,
-            "GroupBoxID" : 0,
-            "PriorityBoxID" : 0,
-            "UseBatchBoxID" : 0,
-            "AutoTimeoutBoxID" : 0,
-            "TaskTimeoutBoxID" : 0,
-            "ConcurrentTasksBoxID" : 0,
-            "LimitConcurrentTasksBoxID" : 0,
-            "MachineLimitBoxID" : 0,
-            "IsBlacklistBoxID" : 0,
-            "MachineListBoxID" :0,
-            "MachineListButtonID" : 0,
-            "LimitGroupsBoxID" : 0,
-            "LimitGroupsButtonID" : 0,
-            "DependenciesBoxID" : 0,
-            "DependenciesButtonID" : 0,
-            "OnCompleteBoxID" : 0,
-            "SubmitSuspendedBoxID" : 0,
-            "FramesBoxID" : 0,
-            "EnableFrameStepBoxID" : 0,
-            "TakeFramesBoxID" : 0,
-
-            # Cinema4D Options
-            "ChunkSizeBoxID" : 0,
-            "ThreadsBoxID" : 0,
-            "TakesBoxID" : 0,
-            "IncludeMainBoxID" : 0,
-            "BuildBoxID" : 0,
-            "LocalRenderingBoxID" : 0,
-            "SubmitSceneBoxID" : 0,
-            "ExportProjectBoxID" : 0,
-            "CloseOnSubmissionID" : 0,
-            "OpenGLBoxID" : 0,
-            
-            # Output Override Options
-            "OutputOverrideID" : 0,
-            "OutputOverrideButtonID" : 0,
-            "OutputMultipassOverrideID" : 0,
-            "OutputMultipassOverrideButtonID" : 0,
-
-            # Gpu Override Options
-            "GPUsPerTaskID" : 0,
-            "SelectGPUDevicesID" : 0,
-
-            # AWS Portal Options
-            "EnableAssetServerPrecachingID": 0,
-
-            # Export Options
-            "ExportJobID" : 0,
-            "ExportJobTypesID" : 0,
-            "ExportLocalID" : 0,
-            "ExportDependentJobBoxID" : 0,
-
-            # General Export Options 
-            "ExportPoolBoxID" : 0,
-            "ExportSecondaryPoolBoxID" : 0,
-            "ExportGroupBoxID" : 0,
-            "ExportPriorityBoxID" : 0,
-            "ExportMachineLimitBoxID" : 0,
-            "ExportConcurrentTasksBoxID" : 0,
-            "ExportTaskTimeoutBoxID" : 0,
-            "ExportLimitGroupsBoxID" : 0,
-            "ExportLimitGroupsButtonID" : 0,
-            "ExportMachineListBoxID" : 0,
-            "ExportMachineListButtonID" : 0,
-            "ExportOnCompleteBoxID" : 0,
-            "ExportIsBlacklistBoxID" : 0,
-            "ExportThreadsBoxID" : 0,
-            "ExportSubmitSuspendedBoxID" : 0,
-            "ExportLimitConcurrentTasksBoxID" : 0,
-            "ExportAutoTimeoutBoxID" : 0,
-            "ExportLocationBoxID" : 0,
-            "ExportLocationButtonID" : 0,
-
-            # Region Rendering Options
-            "RegionRenderTypeID" : 0,
-            "EnableRegionRenderingID" : 0,
-            "TilesInXID" : 0,
-            "TilesInYID" : 0,
-            "SingleFrameTileJobID" : 0,
-            "SingleFrameJobFrameID" : 0,
-            "SubmitDependentAssemblyID" : 0,
-            "CleanupTilesID" : 0,
-            "ErrorOnMissingTilesID" : 0,
-            "AssembleTilesOverID" : 0,
-            "BackgroundImageID" : 0,
-            "BackgroundImageButtonID" : 0,
-            "ErrorOnMissingBackgroundID" : 0,
-
-            # Generic Dialog Buttons
-            "PipelineToolStatusID" : 0,
-            "SubmitButtonID" : 0,
-            "CancelButtonID" : 0,
-            "UnifiedIntegrationButtonID" : 0
-        }
+                self.Takes += ( "Marked", )
+        
+        self.AssembleOver = ( "Blank Image", "Previous Output", "Selected Image" )
+
+        # Maps each combo box option list to the index of every option in it, so shared lists like the pools are only indexed once.
+        self.optionIndices = {}
+
+        # Whether each take renders with a GPU renderer, keyed by the take's GUID. Cleared whenever the document changes.
+        self.gpuTakeCache = {}
 
-        # Set all the IDs for the dialog
-        self.NextID = 0
-        for dialogID in self.dialogIDs.keys():
-            self.dialogIDs[ dialogID ] = self.GetNextID()
+        # The folder of the active document. Looked up on first use and cleared whenever the document changes.
+        self.activeScenePath = None
+
+        # Per-submission lookups of each take's render settings, video posts and V-Ray render elements, and of the
+        # Octane version. Only valid during SubmitJob.
+        self.renderInfoCache = {}
+        self.videoPostCache = {}
+        self.vray5RenderElementsCache = {}
+        self.octaneVersion = None
+        # Whether each path checked during a submission is local. Takes usually share their output folders.
+        self.localPathCache = {}
+
+        # The text of the settings file as it was last read or written, so unchanged sticky settings aren't rewritten.
+        self.stickySettingsContents = None
         
-        c4d.StatusClear()
+        # Layout IDs that are not referenced by name are handed out after the named control IDs.
+        self.NextID = len( SubmitC4DToDeadlineDialog.DIALOG_ID_NAMES )
+    
+    def fetchSubmissionInfo( self ):
+        """
+        Runs on a background thread. Must not touch the dialog or any other part of the C4D API.
+        """
+        try:
+            self.submissionInfoOutput = _load_submission_info()
+        except:
+            self.submissionInfoError = traceback.format_exc()
+
+    def loadSubmissionInfo( self ):
+        """
+        Waits for the background submitter info request and sets up the pools, groups and Deadline directories from it.
+        :return: True if the submitter info was loaded, False otherwise.
+        """
+        try:
+            self.submissionInfoThread.join()
+
+            if self.submissionInfoOutput is None:
+                gui.MessageDialog( "Unable to get submitter info from Deadline:\n\n" + self.submissionInfoError )
+                return False
+
+            output = self.submissionInfoOutput
+            if output[ "ok" ]:
+                self.SubmissionInfo = output[ "result" ]
+            else:
+                gui.MessageDialog( "DeadlineCommand returned a bad result and was unable to grab the submitter info.\n\n" + output[ "result" ] )
+                return False
+        
+            c4d.StatusSetBar( 70 )
+        
+            # Pools
+            self.Pools = tuple( pool.strip() for pool in self.SubmissionInfo[ "Pools" ] ) or ( "none", )
+            self.SecondaryPools = ( " ", ) + self.Pools # Need to have a space, since empty strings don't seem to show up.
+        
+            # Groups
+            self.Groups = tuple( group.strip() for group in self.SubmissionInfo[ "Groups" ] ) or ( "none", )
+            
+            # Maximum Priority / Task Limit
+            self.MaximumPriority = int( self.SubmissionInfo.get( "MaxPriority", 100 ) )
+            self.TaskLimit = int( self.SubmissionInfo.get( "TaskLimit", 5000 ) )
+        
+            # User Home Deadline Directory
+            self.DeadlineHome = self.SubmissionInfo[ "UserHomeDir" ].strip()
+            self.DeadlineSettings = os.path.join( self.DeadlineHome, "settings" )
+            self.DeadlineTemp = os.path.join( self.DeadlineHome, "temp" )
+            self.C4DJobInfoFile = os.path.join( self.DeadlineTemp, "c4d_submit_info.job" )
+            self.C4DPluginInfoFile = os.path.join( self.DeadlineTemp, "c4d_plugin_info.job" )
+        
+            # Repository Directories
+            self.C4DSubmissionDir = self.SubmissionInfo[ "RepoDirs" ][ "submission/Cinema4D/Main" ].strip()
+            self.SanityCheckFile = os.path.join( self.C4DSubmissionDir, "CustomSanityChecks.py" )
+            self.IntegrationDir = self.SubmissionInfo[ "RepoDirs" ][ "submission/Integration/Main" ].strip()
+            self.JobWriterPath = os.path.join( self.IntegrationDir, "JobWriter.py" )
+            self.IntegrationUIPath = os.path.join( self.IntegrationDir, "IntegrationUIStandAlone.py" )
+        
+            c4d.StatusSetBar( 100 )
+            return True
+        finally:
+            c4d.StatusClear()
     
     def GetNextID( self ):
         self.NextID += 1
@@ -354,48 +674,50 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
     
     def AddTextBoxGroup( self, id, label ):
         self.GroupBegin( self.GetNextID(), 0, 2, 1, "", 0 )
-        self.AddStaticText( self.GetNextID(), 0, SubmitC4DToDeadlineDialog.LabelWidth, 0, label, 0 )
-        self.AddEditText( id, 0, SubmitC4DToDeadlineDialog.TextBoxWidth, 0 )
+        self.AddStaticText( self.GetNextID(), 0, self.LabelWidth, 0, label, 0 )
+        self.AddEditText( id, 0, self.TextBoxWidth, 0 )
         self.GroupEnd()
     
     def AddComboBoxGroup( self, id, label, checkboxID=-1, checkboxLabel="" ):
         self.GroupBegin( self.GetNextID(), 0, 3, 1, "", 0 )
-        self.AddStaticText( self.GetNextID(), 0, SubmitC4DToDeadlineDialog.LabelWidth, 0, label, 0 )
-        self.AddComboBox( id, 0, SubmitC4DToDeadlineDialog.ComboBoxWidth, 0 )
+        self.AddStaticText( self.GetNextID(), 0, self.LabelWidth, 0, label, 0 )
+        self.AddComboBox( id, 0, self.ComboBoxWidth, 0 )
         if checkboxID >= 0 and checkboxLabel != "":
-            self.AddCheckbox( checkboxID, 0, SubmitC4DToDeadlineDialog.LabelWidth + SubmitC4DToDeadlineDialog.ComboBoxWidth + 12, 0, checkboxLabel )
+            self.AddCheckbox( checkboxID, 0, self.CheckboxWidth, 0, checkboxLabel )
         elif checkboxID > -2:
-            self.AddStaticText( self.GetNextID(), 0, SubmitC4DToDeadlineDialog.LabelWidth + SubmitC4DToDeadlineDialog.ComboBoxWidth + 12, 0, "", 0 )
+            self.AddStaticText( self.GetNextID(), 0, self.CheckboxWidth, 0, "", 0 )
         self.GroupEnd()
     
     def AddRangeBoxGroup( self, id, label, min, max, inc, checkboxID=-1, checkboxLabel="" ):
         self.GroupBegin( self.GetNextID(), 0, 3, 1, "", 0 )
-        self.AddStaticText( self.GetNextID(), 0, SubmitC4DToDeadlineDialog.LabelWidth, 0, label, 0 )
-        self.AddEditNumberArrows( id, 0, SubmitC4DToDeadlineDialog.RangeBoxWidth, 0 )
+        self.AddStaticText( self.GetNextID(), 0, self.LabelWidth, 0, label, 0 )
+        self.AddEditNumberArrows( id, 0, self.RangeBoxWidth, 0 )
         if checkboxID >= 0 and checkboxLabel != "":
-            self.AddCheckbox( checkboxID, 0, SubmitC4DToDeadlineDialog.LabelWidth + SubmitC4DToDeadlineDialog.ComboBoxWidth + 12, 0, checkboxLabel )
+            self.AddCheckbox( checkboxID, 0, self.CheckboxWidth, 0, checkboxLabel )
         else:
-            self.AddStaticText( self.GetNextID(), 0, SubmitC4DToDeadlineDialog.LabelWidth + SubmitC4DToDeadlineDialog.RangeBoxWidth + 4, 0, "", 0 )
+            self.AddStaticText( self.GetNextID(), 0, self.RangeBoxSpacerWidth, 0, "", 0 )
         self.SetLong( id, min, min, max, inc )
         self.GroupEnd()
     
     def AddSelectionBoxGroup( self, id, label, buttonID ):
         self.GroupBegin( self.GetNextID(), 0, 3, 1, "", 0 )
-        self.AddStaticText( self.GetNextID(), 0, SubmitC4DToDeadlineDialog.LabelWidth, 0, label, 0 )
-        self.AddEditText( id, 0, SubmitC4DToDeadlineDialog.TextBoxWidth - 56, 0 )
+        self.AddStaticText( self.GetNextID(), 0, self.LabelWidth, 0, label, 0 )
+        self.AddEditText( id, 0, self.SelectionBoxWidth, 0 )
         self.AddButton( buttonID, 0, 8, 0, "..." )
         self.GroupEnd()
     
     def AddCheckboxGroup( self, checkboxID, checkboxLabel, textID, buttonID ):
         self.GroupBegin( self.GetNextID(), 0, 3, 1, "", 0 )
-        self.AddCheckbox( checkboxID, 0, SubmitC4DToDeadlineDialog.LabelWidth, 0, checkboxLabel )
-        self.AddEditText( textID, 0, SubmitC4DToDeadlineDialog.TextBoxWidth - 56, 0 )
+        self.AddCheckbox( checkboxID, 0, self.LabelWidth, 0, checkboxLabel )
+        self.AddEditText( textID, 0, self.SelectionBoxWidth, 0 )
         self.AddButton( buttonID, 0, 8, 0, "..." )
         self.GroupEnd()
     
     ## This is called when the dialog is initialized.
     def CreateLayout( self ):
         self.SetTitle( "Submit To Deadline" )
+        labelWidth = self.LabelWidth
+        checkboxWidth = self.CheckboxWidth
         
         self.TabGroupBegin( self.GetNextID(), 0 )
         #General Options Tab
@@ -403,52 +725,52 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         self.GroupBorderNoTitle( c4d.BORDER_NONE )
         
         self.StartGroup( "Job Description" )
-        self.AddTextBoxGroup( self.dialogIDs[ "NameBoxID" ], "Job Name" )
-        self.AddTextBoxGroup( self.dialogIDs[ "CommentBoxID" ], "Comment" )
-        self.AddTextBoxGroup( self.dialogIDs[ "DepartmentBoxID" ], "Department" )
+        self.AddTextBoxGroup( self.NameBoxID, "Job Name" )
+        self.AddTextBoxGroup( self.CommentBoxID, "Comment" )
+        self.AddTextBoxGroup( self.DepartmentBoxID, "Department" )
         self.EndGroup()
         
         self.StartGroup( "Job Options" )
-        self.AddComboBoxGroup( self.dialogIDs[ "PoolBoxID" ], "Pool" )
-        self.AddComboBoxGroup( self.dialogIDs[ "SecondaryPoolBoxID" ], "Secondary Pool" )
-        self.AddComboBoxGroup( self.dialogIDs[ "GroupBoxID" ], "Group" )
-        self.AddRangeBoxGroup( self.dialogIDs[ "PriorityBoxID" ], "Priority", 0, 100, 1 )
-        self.AddRangeBoxGroup( self.dialogIDs[ "TaskTimeoutBoxID" ], "Task Timeout", 0, 999999, 1, self.dialogIDs[ "AutoTimeoutBoxID" ], "Enable Auto Task Timeout" )
-        self.AddRangeBoxGroup( self.dialogIDs[ "ConcurrentTasksBoxID" ], "Concurrent Tasks", 1, 16, 1, self.dialogIDs[ "LimitConcurrentTasksBoxID" ], "Limit Tasks To Worker's Task Limit" )
-        self.AddRangeBoxGroup( self.dialogIDs[ "MachineLimitBoxID" ], "Machine Limit", 0, 999999, 1, self.dialogIDs[ "IsBlacklistBoxID" ], "Machine List Is A Deny List" )
-        self.AddSelectionBoxGroup( self.dialogIDs[ "MachineListBoxID" ], "Machine List", self.dialogIDs[ "MachineListButtonID" ] )
-        self.AddSelectionBoxGroup( self.dialogIDs[ "LimitGroupsBoxID" ], "Limit Groups", self.dialogIDs[ "LimitGroupsButtonID" ] )
-        self.AddSelectionBoxGroup( self.dialogIDs[ "DependenciesBoxID" ], "Dependencies", self.dialogIDs[ "DependenciesButtonID" ] )
-        self.AddComboBoxGroup( self.dialogIDs[ "OnCompleteBoxID" ], "On Job Complete", self.dialogIDs[ "SubmitSuspendedBoxID" ], "Submit Job As Suspended" )
+        self.AddComboBoxGroup( self.PoolBoxID, "Pool" )
+        self.AddComboBoxGroup( self.SecondaryPoolBoxID, "Secondary Pool" )
+        self.AddComboBoxGroup( self.GroupBoxID, "Group" )
+        self.AddRangeBoxGroup( self.PriorityBoxID, "Priority", 0, 100, 1 )
+        self.AddRangeBoxGroup( self.TaskTimeoutBoxID, "Task Timeout", 0, 999999, 1, self.AutoTimeoutBoxID, "Enable Auto Task Timeout" )
+        self.AddRangeBoxGroup( self.ConcurrentTasksBoxID, "Concurrent Tasks", 1, 16, 1, self.LimitConcurrentTasksBoxID, "Limit Tasks To Worker's Task Limit" )
+        self.AddRangeBoxGroup( self.MachineLimitBoxID, "Machine Limit", 0, 999999, 1, self.IsBlacklistBoxID, "Machine List Is A Deny List" )
+        self.AddSelectionBoxGroup( self.MachineListBoxID, "Machine List", self.MachineListButtonID )
+        self.AddSelectionBoxGroup( self.LimitGroupsBoxID, "Limit Groups", self.LimitGroupsButtonID )
+        self.AddSelectionBoxGroup( self.DependenciesBoxID, "Dependencies", self.DependenciesButtonID )
+        self.AddComboBoxGroup( self.OnCompleteBoxID, "On Job Complete", self.SubmitSuspendedBoxID, "Submit Job As Suspended" )
         self.EndGroup()
         
         self.StartGroup( "Cinema 4D Options" )
 
-        self.AddComboBoxGroup( self.dialogIDs[ "TakesBoxID" ], "Take List", self.dialogIDs[ "IncludeMainBoxID" ], "Include Main take in All takes" )
+        self.AddComboBoxGroup( self.TakesBoxID, "Take List", self.IncludeMainBoxID, "Include Main take in All takes" )
 
-        self.AddTextBoxGroup( self.dialogIDs[ "FramesBoxID" ], "Frame List" )
+        self.AddTextBoxGroup( self.FramesBoxID, "Frame List" )
 
         self.GroupBegin( self.GetNextID(), c4d.BFH_LEFT, 4, 1, "", 0 )
-        self.AddStaticText( self.GetNextID(), 0, SubmitC4DToDeadlineDialog.LabelWidth, 0, "", 0 )
-        self.AddCheckbox( self.dialogIDs[ "TakeFramesBoxID" ], 0, SubmitC4DToDeadlineDialog.LabelWidth + 23, 0, "Use Take Frame Range" )
-        self.AddCheckbox( self.dialogIDs[ "EnableFrameStepBoxID" ], 0, 0, 0, "Submit all frames as single task" )
+        self.AddStaticText( self.GetNextID(), 0, labelWidth, 0, "", 0 )
+        self.AddCheckbox( self.TakeFramesBoxID, 0, labelWidth + 23, 0, "Use Take Frame Range" )
+        self.AddCheckbox( self.EnableFrameStepBoxID, 0, 0, 0, "Submit all frames as single task" )
         self.GroupEnd()
         
-        self.AddRangeBoxGroup( self.dialogIDs[ "ChunkSizeBoxID" ], "Frames Per Task", 1, 999999, 1, self.dialogIDs[ "SubmitSceneBoxID" ], "Submit Cinema 4D Scene File" )
-        self.AddRangeBoxGroup( self.dialogIDs[ "ThreadsBoxID" ], "Threads To Use", 0, 256, 1, self.dialogIDs[ "ExportProjectBoxID" ], "Export Project Before Submission" )
-        self.AddComboBoxGroup( self.dialogIDs[ "BuildBoxID" ], "Build To Force", self.dialogIDs[ "LocalRenderingBoxID" ], "Enable Local Rendering" )
+        self.AddRangeBoxGroup( self.ChunkSizeBoxID, "Frames Per Task", 1, 999999, 1, self.SubmitSceneBoxID, "Submit Cinema 4D Scene File" )
+        self.AddRangeBoxGroup( self.ThreadsBoxID, "Threads To Use", 0, 256, 1, self.ExportProjectBoxID, "Export Project Before Submission" )
+        self.AddComboBoxGroup( self.BuildBoxID, "Build To Force", self.LocalRenderingBoxID, "Enable Local Rendering" )
         
         self.GroupBegin( self.GetNextID(), c4d.BFH_LEFT, 4, 1, "", 0 )
-        self.AddStaticText( self.GetNextID(), 0, SubmitC4DToDeadlineDialog.LabelWidth, 0, "", 0 )
-        self.AddCheckbox( self.dialogIDs[ "CloseOnSubmissionID" ], 0, SubmitC4DToDeadlineDialog.LabelWidth + 23, 0, "Close On Submission" )
-        self.AddCheckbox( self.dialogIDs[ "UseBatchBoxID" ], 0, 0, 0, "Use Batch Plugin" )
-        self.AddCheckbox( self.dialogIDs[ "OpenGLBoxID" ], 0, 0, 0, "Disable OpenGL" )
+        self.AddStaticText( self.GetNextID(), 0, labelWidth, 0, "", 0 )
+        self.AddCheckbox( self.CloseOnSubmissionID, 0, labelWidth + 23, 0, "Close On Submission" )
+        self.AddCheckbox( self.UseBatchBoxID, 0, 0, 0, "Use Batch Plugin" )
+        self.AddCheckbox( self.OpenGLBoxID, 0, 0, 0, "Disable OpenGL" )
         self.GroupEnd()
 
         self.GroupBegin( self.GetNextID(), c4d.BFH_LEFT, 4, 1, "", 0 )
-        self.AddStaticText( self.GetNextID(), 0, SubmitC4DToDeadlineDialog.LabelWidth, 0, "", 0 )
-        self.AddButton( self.dialogIDs[ "UnifiedIntegrationButtonID" ], c4d.BFH_CENTER, 183, 0, "Pipeline Tools" )
-        self.AddStaticText( self.dialogIDs[ "PipelineToolStatusID" ], c4d.BFH_CENTER, 380, 0, "No Tools Set", 0 )
+        self.AddStaticText( self.GetNextID(), 0, labelWidth, 0, "", 0 )
+        self.AddButton( self.UnifiedIntegrationButtonID, c4d.BFH_CENTER, 183, 0, "Pipeline Tools" )
+        self.AddStaticText( self.PipelineToolStatusID, c4d.BFH_CENTER, 380, 0, "No Tools Set", 0 )
         self.EndGroup()
         
         self.EndGroup()
@@ -461,36 +783,36 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
 
         # Output Overrides
         self.StartGroup( "Output Overrides" )
-        self.AddSelectionBoxGroup( self.dialogIDs[ "OutputOverrideID" ], "Output File", self.dialogIDs[ "OutputOverrideButtonID" ] )
-        self.AddSelectionBoxGroup( self.dialogIDs[ "OutputMultipassOverrideID" ], "Multipass File", self.dialogIDs[ "OutputMultipassOverrideButtonID" ] )
+        self.AddSelectionBoxGroup( self.OutputOverrideID, "Output File", self.OutputOverrideButtonID )
+        self.AddSelectionBoxGroup( self.OutputMultipassOverrideID, "Multipass File", self.OutputMultipassOverrideButtonID )
         self.EndGroup()
         
         # GPU AFFINITY
         self.StartGroup( "GPU Affinity Overrides" )
-        self.AddRangeBoxGroup( self.dialogIDs[ "GPUsPerTaskID" ], "GPUs Per Task", 0, 16, 1 )
-        self.AddTextBoxGroup( self.dialogIDs[ "SelectGPUDevicesID" ], "Select GPU Devices" )
+        self.AddRangeBoxGroup( self.GPUsPerTaskID, "GPUs Per Task", 0, 16, 1 )
+        self.AddTextBoxGroup( self.SelectGPUDevicesID, "Select GPU Devices" )
         self.EndGroup()
         
         self.StartGroup( "Region Rendering" )
-        self.AddCheckbox( self.dialogIDs[ "EnableRegionRenderingID" ], 0, SubmitC4DToDeadlineDialog.LabelWidth+SubmitC4DToDeadlineDialog.ComboBoxWidth + 12, 0, "Enable Region Rendering" )
-        self.AddRangeBoxGroup( self.dialogIDs[ "TilesInXID" ], "Tiles In X", 1, 100, 1 )
-        self.AddRangeBoxGroup( self.dialogIDs[ "TilesInYID" ], "Tiles In Y", 1, 100, 1 )
+        self.AddCheckbox( self.EnableRegionRenderingID, 0, checkboxWidth, 0, "Enable Region Rendering" )
+        self.AddRangeBoxGroup( self.TilesInXID, "Tiles In X", 1, 100, 1 )
+        self.AddRangeBoxGroup( self.TilesInYID, "Tiles In Y", 1, 100, 1 )
         
         self.GroupBegin( self.GetNextID(), 0, 3, 1, "", 0 )
-        self.AddRangeBoxGroup( self.dialogIDs[ "SingleFrameJobFrameID" ], "Frame to Render", 0, 9999999, 1, self.dialogIDs[ "SingleFrameTileJobID" ], "Submit All Tiles as a Single Job." )
+        self.AddRangeBoxGroup( self.SingleFrameJobFrameID, "Frame to Render", 0, 9999999, 1, self.SingleFrameTileJobID, "Submit All Tiles as a Single Job." )
         self.GroupEnd() 
-        self.AddCheckbox( self.dialogIDs[ "SubmitDependentAssemblyID" ], 0, SubmitC4DToDeadlineDialog.LabelWidth+SubmitC4DToDeadlineDialog.ComboBoxWidth + 12, 0, "Submit Dependent Assembly Job" )
-        self.AddCheckbox( self.dialogIDs[ "CleanupTilesID" ], 0, SubmitC4DToDeadlineDialog.LabelWidth+SubmitC4DToDeadlineDialog.ComboBoxWidth + 12, 0, "Cleanup Tiles After Assembly" )
-        self.AddCheckbox( self.dialogIDs[ "ErrorOnMissingTilesID" ], 0, SubmitC4DToDeadlineDialog.LabelWidth+SubmitC4DToDeadlineDialog.ComboBoxWidth + 12, 0, "Error on Missing Tiles" )
-        self.AddComboBoxGroup( self.dialogIDs[ "AssembleTilesOverID" ], "Assemble Tiles Over" )
+        self.AddCheckbox( self.SubmitDependentAssemblyID, 0, checkboxWidth, 0, "Submit Dependent Assembly Job" )
+        self.AddCheckbox( self.CleanupTilesID, 0, checkboxWidth, 0, "Cleanup Tiles After Assembly" )
+        self.AddCheckbox( self.ErrorOnMissingTilesID, 0, checkboxWidth, 0, "Error on Missing Tiles" )
+        self.AddComboBoxGroup( self.AssembleTilesOverID, "Assemble Tiles Over" )
         
-        self.AddSelectionBoxGroup( self.dialogIDs[ "BackgroundImageID" ], "Background Image", self.dialogIDs[ "BackgroundImageButtonID" ] )
-        self.AddCheckbox( self.dialogIDs[ "ErrorOnMissingBackgroundID" ], 0, SubmitC4DToDeadlineDialog.LabelWidth+SubmitC4DToDeadlineDialog.ComboBoxWidth + 12, 0, "Error on Missing Background" )
+        self.AddSelectionBoxGroup( self.BackgroundImageID, "Background Image", self.BackgroundImageButtonID )
+        self.AddCheckbox( self.ErrorOnMissingBackgroundID, 0, checkboxWidth, 0, "Error on Missing Background" )
         self.EndGroup()
 
         # AWSPortal 
         self.StartGroup( "AWSPortal Options" )
-        self.AddCheckbox( self.dialogIDs[ "EnableAssetServerPrecachingID" ], 0, SubmitC4DToDeadlineDialog.LabelWidth+SubmitC4DToDeadlineDialog.TextBoxWidth + 30, 0, "Precache assets for AWS" )
+        self.AddCheckbox( self.EnableAssetServerPrecachingID, 0, labelWidth + self.TextBoxWidth + 30, 0, "Precache assets for AWS" )
         self.EndGroup()
 
         self.GroupEnd() #Region Rendering Tab
@@ -499,48 +821,52 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         self.GroupBegin( self.GetNextID(), c4d.BFV_TOP, 0, 40, "Export Jobs", 0 )
         self.StartGroup( "Export Jobs" )
         self.GroupBegin( self.GetNextID(), c4d.BFH_LEFT, 4, 1, "", 0 )
-        self.AddCheckbox( self.dialogIDs[ "ExportJobID" ], 0, 624, 0, "Submit Export Job" )
-        self.AddStaticText( self.GetNextID(), 0, SubmitC4DToDeadlineDialog.LabelWidth, 0, "", 0 )
+        self.AddCheckbox( self.ExportJobID, 0, 624, 0, "Submit Export Job" )
+        self.AddStaticText( self.GetNextID(), 0, labelWidth, 0, "", 0 )
         self.GroupEnd()
-        self.AddComboBoxGroup( self.dialogIDs[ "ExportJobTypesID" ], "Export Type" )
-        self.AddSelectionBoxGroup( self.dialogIDs[ "ExportLocationBoxID" ], "Export File Location", self.dialogIDs[ "ExportLocationButtonID" ] )
+        self.AddComboBoxGroup( self.ExportJobTypesID, "Export Type" )
+        self.AddSelectionBoxGroup( self.ExportLocationBoxID, "Export File Location", self.ExportLocationButtonID )
         self.EndGroup()#Export Group
 
         self.StartGroup( "Dependent Job Options" )
         self.GroupBegin( self.GetNextID(), c4d.BFH_LEFT, 4, 1, "", 0 )
-        self.AddCheckbox( self.dialogIDs[ "ExportDependentJobBoxID" ], 0, 0, 0, "Submit Dependent Job" )
-        self.AddCheckbox( self.dialogIDs[ "ExportLocalID" ], 0, 0, 0, "Export Locally" )
+        self.AddCheckbox( self.ExportDependentJobBoxID, 0, 0, 0, "Submit Dependent Job" )
+        self.AddCheckbox( self.ExportLocalID, 0, 0, 0, "Export Locally" )
         self.GroupEnd()
 
         self.GroupBegin( self.GetNextID(), c4d.BFH_LEFT, 4, 1, "", 0 )
-        self.AddStaticText( self.GetNextID(), 0, SubmitC4DToDeadlineDialog.LabelWidth, 0, "", 0 )
+        self.AddStaticText( self.GetNextID(), 0, labelWidth, 0, "", 0 )
         self.GroupEnd()
 
-        self.AddComboBoxGroup( self.dialogIDs[ "ExportPoolBoxID" ], "Pool" )
-        self.AddComboBoxGroup( self.dialogIDs[ "ExportSecondaryPoolBoxID" ], "Secondary Pool" )
-        self.AddComboBoxGroup( self.dialogIDs[ "ExportGroupBoxID" ], "Group" )
-        self.AddRangeBoxGroup( self.dialogIDs[ "ExportPriorityBoxID" ], "Priority", 0, 100, 1 )
-        self.AddRangeBoxGroup( self.dialogIDs[ "ExportThreadsBoxID" ], "Threads To Use", 0, 256, 1 )
-        self.AddRangeBoxGroup( self.dialogIDs[ "ExportTaskTimeoutBoxID" ], "Task Timeout", 0, 999999, 1, self.dialogIDs[ "ExportAutoTimeoutBoxID" ], "Enable Auto Task Timeout" )
-        self.AddRangeBoxGroup( self.dialogIDs[ "ExportConcurrentTasksBoxID" ], "Concurrent Tasks", 1, 16, 1, self.dialogIDs[ "ExportLimitConcurrentTasksBoxID" ], "Limit Tasks To Worker's Task Limit" )
-        self.AddRangeBoxGroup( self.dialogIDs[ "ExportMachineLimitBoxID" ], "Machine Limit", 0, 999999, 1, self.dialogIDs[ "ExportIsBlacklistBoxID" ], "Machine List Is A Deny List" )
-        self.AddSelectionBoxGroup( self.dialogIDs[ "ExportMachineListBoxID" ], "Machine List", self.dialogIDs[ "ExportMachineListButtonID" ] )
-        self.AddSelectionBoxGroup( self.dialogIDs[ "ExportLimitGroupsBoxID" ], "Limit Groups", self.dialogIDs[ "ExportLimitGroupsButtonID" ] )
-        self.AddComboBoxGroup( self.dialogIDs[ "ExportOnCompleteBoxID" ], "On Job Complete", self.dialogIDs[ "ExportSubmitSuspendedBoxID" ], "Submit Job As Suspended" )
+        self.AddComboBoxGroup( self.ExportPoolBoxID, "Pool" )
+        self.AddComboBoxGroup( self.ExportSecondaryPoolBoxID, "Secondary Pool" )
+        self.AddComboBoxGroup( self.ExportGroupBoxID, "Group" )
+        self.AddRangeBoxGroup( self.ExportPriorityBoxID, "Priority", 0, 100, 1 )
+        self.AddRangeBoxGroup( self.ExportThreadsBoxID, "Threads To Use", 0, 256, 1 )
+        self.AddRangeBoxGroup( self.ExportTaskTimeoutBoxID, "Task Timeout", 0, 999999, 1, self.ExportAutoTimeoutBoxID, "Enable Auto Task Timeout" )
+        self.AddRangeBoxGroup( self.ExportConcurrentTasksBoxID, "Concurrent Tasks", 1, 16, 1, self.ExportLimitConcurrentTasksBoxID, "Limit Tasks To Worker's Task Limit" )
+        self.AddRangeBoxGroup( self.ExportMachineLimitBoxID, "Machine Limit", 0, 999999, 1, self.ExportIsBlacklistBoxID, "Machine List Is A Deny List" )
+        self.AddSelectionBoxGroup( self.ExportMachineListBoxID, "Machine List", self.ExportMachineListButtonID )
+        self.AddSelectionBoxGroup( self.ExportLimitGroupsBoxID, "Limit Groups", self.ExportLimitGroupsButtonID )
+        self.AddComboBoxGroup( self.ExportOnCompleteBoxID, "On Job Complete", self.ExportSubmitSuspendedBoxID, "Submit Job As Suspended" )
         self.EndGroup()#Job Options Group
 
         self.GroupEnd() #Export Jobs tab
         self.GroupEnd() #Tab group
         
         self.GroupBegin( self.GetNextID(), c4d.BFH_SCALE, 0, 1, "", 0 )
-        self.AddButton( self.dialogIDs[ "SubmitButtonID" ], 0, 100, 0, "Submit" )
-        self.AddButton( self.dialogIDs[ "CancelButtonID" ], 0, 100, 0, "Cancel" )
+        self.AddButton( self.SubmitButtonID, 0, 100, 0, "Submit" )
+        self.AddButton( self.CancelButtonID, 0, 100, 0, "Cancel" )
         self.GroupEnd()
         
         return True
     
     ## This is called after the dialog has been initialized.
     def InitValues( self ):
+        if not self.loadSubmissionInfo():
+            self.Close()
+            return False
+
         scene = documents.GetActiveDocument()
         frameRate = scene.GetFps()
         
@@ -567,11 +893,12 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
             endFrame = scene.GetLoopMaxTime().GetFrame( frameRate )
             stepFrame = renderData.GetLong( c4d.RDATA_FRAMESTEP )
         
-        frameList = str( startFrame )
+        frameListParts = [ str( startFrame ) ]
         if startFrame != endFrame:
-            frameList = frameList + "-" + str( endFrame )
+            frameListParts.append( "-%s" % endFrame )
         if stepFrame > 1:
-            frameList = frameList + "x" + str( stepFrame )
+            frameListParts.append( "x%s" % stepFrame )
+        frameList = "".join( frameListParts )
         
         initName = os.path.splitext( scene.GetDocumentName() )[0]
         initComment = ""
@@ -652,245 +979,189 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         
         # Read in sticky settings
         self.ConfigFile = os.path.join( self.DeadlineSettings, "c4d_py_submission.ini" )
-        try:
-            if os.path.isfile( self.ConfigFile ):
-                config = ConfigParser.ConfigParser()
-                config.read( self.ConfigFile )
-                
-                if config.has_section( "Sticky" ):
-                    if config.has_option( "Sticky", "Department" ):
-                        initDepartment = config.get( "Sticky", "Department" )
-                    if config.has_option( "Sticky", "Pool" ):
-                        initPool = config.get( "Sticky", "Pool" )
-                    if config.has_option( "Sticky", "SecondaryPool" ):
-                        initSecondaryPool = config.get( "Sticky", "SecondaryPool" )
-                    if config.has_option( "Sticky", "Group" ):
-                        initGroup = config.get( "Sticky", "Group" )
-                    if config.has_option( "Sticky", "Priority" ):
-                        initPriority = config.getint( "Sticky", "Priority" )
-                    if config.has_option( "Sticky", "MachineLimit" ):
-                        initMachineLimit = config.getint( "Sticky", "MachineLimit" )
-                    if config.has_option( "Sticky", "LimitGroups" ):
-                        initLimitGroups = config.get( "Sticky", "LimitGroups" )
-                    if config.has_option( "Sticky", "ConcurrentTasks" ):
-                        initConcurrentTasks = config.getint( "Sticky", "ConcurrentTasks" )
-                    if config.has_option( "Sticky", "IsBlacklist" ):
-                        initIsBlacklist = config.getboolean( "Sticky", "IsBlacklist" )
-                    if config.has_option( "Sticky", "MachineList" ):
-                        initMachineList = config.get( "Sticky", "MachineList" )
-                    if config.has_option( "Sticky", "SubmitSuspended" ):
-                        initSubmitSuspended = config.getboolean( "Sticky", "SubmitSuspended" )
-                    if config.has_option( "Sticky", "ChunkSize" ):
-                        initChunkSize = config.getint( "Sticky", "ChunkSize" )
-
-                    if config.has_option( "Sticky", "IncludeMainTake" ):
-                        initIncludeMainTake = config.getboolean( "Sticky", "IncludeMainTake" )
-                    if config.has_option( "Sticky", "OutputOverride" ):
-                        initOutputOverride = config.get( "Sticky", "OutputOverride" )
-                    if config.has_option( "Sticky", "OutputMultipassOverride" ):
-                        initOutputMultipassOverride = config.get( "Sticky", "OutputMultipassOverride" )
-                    if config.has_option( "Sticky", "UseTakeFrames" ):
-                        initUseTakeFrames = config.getboolean( "Sticky", "UseTakeFrames" )
-                    if config.has_option( "Sticky", "SubmitScene" ):
-                        initSubmitScene = config.getboolean( "Sticky", "SubmitScene" )
-                    if config.has_option( "Sticky", "Threads" ):
-                        initThreads = config.getint( "Sticky", "Threads" )
-                    if config.has_option( "Sticky", "ExportProject" ):
-                        initExportProject = config.getboolean( "Sticky", "ExportProject" )
-                    if config.has_option( "Sticky", "Build" ):
-                        initBuild = config.get( "Sticky", "Build" )
-                    if config.has_option( "Sticky", "LocalRendering" ):
-                        initLocalRendering = config.getboolean( "Sticky", "LocalRendering" )
-                    if config.has_option( "Sticky", "CloseOnSubmission" ):
-                        initCloseOnSubmission = config.getboolean( "Sticky", "CloseOnSubmission" )
-                    if config.has_option( "Sticky", "UseBatchPlugin" ):
-                        initUseBatch = config.getboolean( "Sticky", "UseBatchPlugin" )
-
-                    if config.has_option( "Sticky", "ExportJob" ):
-                        initExportJob = config.getboolean( "Sticky", "ExportJob" )
-                    if config.has_option( "Sticky", "ExportDependentJob" ):
-                        initExportDependentJob = config.getboolean( "Sticky", "ExportDependentJob" )
-                    if config.has_option( "Sticky", "LocalExport" ):
-                        initExportJobLocal = config.getboolean( "Sticky", "LocalExport" )
-                    if config.has_option( "Sticky", "ExportPool" ):
-                        initExportPool = config.get( "Sticky", "ExportPool" )
-                    if config.has_option( "Sticky", "ExportSecondaryPool" ):
-                        initExportSecondaryPool = config.get( "Sticky", "ExportSecondaryPool" )
-                    if config.has_option( "Sticky", "ExportGroup" ):
-                        initExportGroup = config.get( "Sticky", "ExportGroup" )
-                    if config.has_option( "Sticky", "ExportPriority" ):
-                        initExportPriority = config.getint( "Sticky", "ExportPriority" )
-                    if config.has_option( "Sticky", "ExportMachineLimit" ):
-                        initExportMachineLimit = config.getint( "Sticky", "ExportMachineLimit" )
-                    if config.has_option( "Sticky", "ExportLimitGroups" ):
-                        initExportLimitGroups = config.get( "Sticky", "ExportLimitGroups" )
-                    if config.has_option( "Sticky", "ExportIsBlacklist" ):
-                        initExportIsBlacklist = config.getboolean( "Sticky", "ExportIsBlacklist" )
-                    if config.has_option( "Sticky", "ExportMachineList" ):
-                        initExportMachineList = config.get( "Sticky", "ExportMachineList" )
-                    if config.has_option( "Sticky", "ExportSubmitSuspended" ):
-                        initExportSubmitSuspended = config.getboolean( "Sticky", "ExportSubmitSuspended" )
-                    if config.has_option( "Sticky", "ExportThreads" ):
-                        initExportThreads = config.getint( "Sticky", "ExportThreads" )
-                    if config.has_option( "Sticky", "ExportOutputLocation" ):
-                        initExportLocation = config.get( "Sticky", "ExportOutputLocation" )    
-
-                    if config.has_option( "Sticky", "EnableRegionRendering" ):
-                        initEnableRegionRendering = config.getboolean( "Sticky", "EnableRegionRendering" )
-                    if config.has_option( "Sticky", "TilesInX" ):
-                        initTilesInX = config.getint( "Sticky", "TilesInX" )
-                    if config.has_option( "Sticky", "TilesInY" ):
-                        initTilesInY = config.getint( "Sticky", "TilesInY" )
-                    if config.has_option( "Sticky", "SingleFrameTileJob" ):
-                        initSingleFrameTileJob = config.getboolean( "Sticky", "SingleFrameTileJob" )
-                    if config.has_option( "Sticky", "SingleFrameJobFrame" ):
-                        initSingleFrameJobFrame = config.getint( "Sticky", "SingleFrameJobFrame" )
-                    if config.has_option( "Sticky", "SubmitDependentAssembly" ):
-                        initSubmitDependentAssembly = config.getboolean( "Sticky", "SubmitDependentAssembly" )
-                    if config.has_option( "Sticky", "CleanupTiles" ):
-                        initCleanupTiles = config.getboolean( "Sticky", "CleanupTiles" )
-                    if config.has_option( "Sticky", "ErrorOnMissingTiles" ):
-                        initErrorOnMissingTiles = config.getboolean( "Sticky", "ErrorOnMissingTiles" )
-                    if config.has_option( "Sticky", "AssembleTilesOver" ):
-                        initAssembleTilesOver = config.get( "Sticky", "AssembleTilesOver" )
-                    if config.has_option( "Sticky", "BackgroundImage" ):
-                        initBackgroundImage = config.get( "Sticky", "BackgroundImage" )
-                    if config.has_option( "Sticky", "ErrorOnMissingBackground" ):
-                        initErrorOnMissingBackground = config.getboolean( "Sticky", "ErrorOnMissingBackground" )
-                    if config.has_option( "Sticky", "SelectedAssembleOver" ):
-                        initSelectedAssembleOver = config.getint( "Sticky", "SelectedAssembleOver" )    
-
-                    if config.has_option( "Sticky", "GPUsPerTask" ):
-                        initGPUsPerTask = config.getint( "Sticky", "GPUsPerTask" )
-                    if config.has_option( "Sticky", "GPUsSelectDevices" ):
-                        initGPUsSelectDevices = config.get( "Sticky", "GPUsSelectDevices" )
-
-                    if config.has_option( "Sticky", "EnableAssetServerPrecaching" ):
-                        initEnableAssetServerPrecaching = config.getboolean( "Sticky", "EnableAssetServerPrecaching" )
-        except:
-            print( "Could not read sticky settings:\n" + traceback.format_exc() )
+        sticky = self.readStickySettings()
+
+        initDepartment = sticky.get( "Department", initDepartment )
+        initPool = sticky.get( "Pool", initPool )
+        initSecondaryPool = sticky.get( "SecondaryPool", initSecondaryPool )
+        initGroup = sticky.get( "Group", initGroup )
+        initPriority = sticky.get( "Priority", initPriority )
+        initMachineLimit = sticky.get( "MachineLimit", initMachineLimit )
+        initLimitGroups = sticky.get( "LimitGroups", initLimitGroups )
+        initConcurrentTasks = sticky.get( "ConcurrentTasks", initConcurrentTasks )
+        initIsBlacklist = sticky.get( "IsBlacklist", initIsBlacklist )
+        initMachineList = sticky.get( "MachineList", initMachineList )
+        initSubmitSuspended = sticky.get( "SubmitSuspended", initSubmitSuspended )
+        initChunkSize = sticky.get( "ChunkSize", initChunkSize )
+
+        initIncludeMainTake = sticky.get( "IncludeMainTake", initIncludeMainTake )
+        initOutputOverride = sticky.get( "OutputOverride", initOutputOverride )
+        initOutputMultipassOverride = sticky.get( "OutputMultipassOverride", initOutputMultipassOverride )
+        initUseTakeFrames = sticky.get( "UseTakeFrames", initUseTakeFrames )
+        initSubmitScene = sticky.get( "SubmitScene", initSubmitScene )
+        initThreads = sticky.get( "Threads", initThreads )
+        initExportProject = sticky.get( "ExportProject", initExportProject )
+        initBuild = sticky.get( "Build", initBuild )
+        initLocalRendering = sticky.get( "LocalRendering", initLocalRendering )
+        initCloseOnSubmission = sticky.get( "CloseOnSubmission", initCloseOnSubmission )
+        initUseBatch = sticky.get( "UseBatchPlugin", initUseBatch )
+
+        initExportJob = sticky.get( "ExportJob", initExportJob )
+        initExportDependentJob = sticky.get( "ExportDependentJob", initExportDependentJob )
+        initExportJobLocal = sticky.get( "LocalExport", initExportJobLocal )
+        initExportPool = sticky.get( "ExportPool", initExportPool )
+        initExportSecondaryPool = sticky.get( "ExportSecondaryPool", initExportSecondaryPool )
+        initExportGroup = sticky.get( "ExportGroup", initExportGroup )
+        initExportPriority = sticky.get( "ExportPriority", initExportPriority )
+        initExportMachineLimit = sticky.get( "ExportMachineLimit", initExportMachineLimit )
+        initExportLimitGroups = sticky.get( "ExportLimitGroups", initExportLimitGroups )
+        initExportIsBlacklist = sticky.get( "ExportIsBlacklist", initExportIsBlacklist )
+        initExportMachineList = sticky.get( "ExportMachineList", initExportMachineList )
+        initExportSubmitSuspended = sticky.get( "ExportSubmitSuspended", initExportSubmitSuspended )
+        initExportThreads = sticky.get( "ExportThreads", initExportThreads )
+        initExportLocation = sticky.get( "ExportOutputLocation", initExportLocation )
+
+        initEnableRegionRendering = sticky.get( "EnableRegionRendering", initEnableRegionRendering )
+        initTilesInX = sticky.get( "TilesInX", initTilesInX )
+        initTilesInY = sticky.get( "TilesInY", initTilesInY )
+        initSingleFrameTileJob = sticky.get( "SingleFrameTileJob", initSingleFrameTileJob )
+        initSingleFrameJobFrame = sticky.get( "SingleFrameJobFrame", initSingleFrameJobFrame )
+        initSubmitDependentAssembly = sticky.get( "SubmitDependentAssembly", initSubmitDependentAssembly )
+        initCleanupTiles = sticky.get( "CleanupTiles", initCleanupTiles )
+        initErrorOnMissingTiles = sticky.get( "ErrorOnMissingTiles", initErrorOnMissingTiles )
+        initAssembleTilesOver = sticky.get( "AssembleTilesOver", initAssembleTilesOver )
+        initBackgroundImage = sticky.get( "BackgroundImage", initBackgroundImage )
+        initErrorOnMissingBackground = sticky.get( "ErrorOnMissingBackground", initErrorOnMissingBackground )
+        initSelectedAssembleOver = sticky.get( "SelectedAssembleOver", initSelectedAssembleOver )
+
+        initGPUsPerTask = sticky.get( "GPUsPerTask", initGPUsPerTask )
+        initGPUsSelectDevices = sticky.get( "GPUsSelectDevices", initGPUsSelectDevices )
+
+        initEnableAssetServerPrecaching = sticky.get( "EnableAssetServerPrecaching", initEnableAssetServerPrecaching )
         
         if initPriority > self.MaximumPriority:
             initPriority = self.MaximumPriority // 2
        
+        # Bind the dialog setters locally, they are called for every control below.
+        setLong, setBool, setString, enable = self.SetLong, self.SetBool, self.SetString, self.Enable
+
         # Populate the combo boxes, and figure out the default selected index if necessary.       
-        selectedPoolID = self.setComboBoxOptions( self.Pools, self.dialogIDs[ "PoolBoxID" ], initPool )
-        selectedSecondaryPoolID = self.setComboBoxOptions( self.SecondaryPools, self.dialogIDs[ "SecondaryPoolBoxID" ], initSecondaryPool )
-        selectedGroupID = self.setComboBoxOptions( self.Groups, self.dialogIDs[ "GroupBoxID" ], initGroup )
-        selectedOnCompleteID = self.setComboBoxOptions( self.OnComplete, self.dialogIDs[ "OnCompleteBoxID" ], initOnComplete )
-        selectedBuildID = self.setComboBoxOptions( self.Builds, self.dialogIDs[ "BuildBoxID" ], initBuild )
-        self.setComboBoxOptions( self.Takes, self.dialogIDs[ "TakesBoxID" ], "Active" )
+        selectedPoolID = self.setComboBoxOptions( self.Pools, self.PoolBoxID, initPool )
+        selectedSecondaryPoolID = self.setComboBoxOptions( self.SecondaryPools, self.SecondaryPoolBoxID, initSecondaryPool )
+        selectedGroupID = self.setComboBoxOptions( self.Groups, self.GroupBoxID, initGroup )
+        selectedOnCompleteID = self.setComboBoxOptions( self.OnComplete, self.OnCompleteBoxID, initOnComplete )
+        selectedBuildID = self.setComboBoxOptions( self.Builds, self.BuildBoxID, initBuild )
+        self.setComboBoxOptions( self.Takes, self.TakesBoxID, "Active" )
 
         # Populate the Export combo boxes, and figure out the default selected index if necessary.
-        selectExportJobTypeID = self.setComboBoxOptions( self.Exporters, self.dialogIDs[ "ExportJobTypesID" ], initExporter )
-        selectedExportPoolID = self.setComboBoxOptions( self.Pools, self.dialogIDs[ "ExportPoolBoxID" ], initExportPool )
-        selectedExportSecondaryPoolID = self.setComboBoxOptions( self.SecondaryPools, self.dialogIDs[ "ExportSecondaryPoolBoxID" ], initExportSecondaryPool )
-        selectedExportGroupID = self.setComboBoxOptions( self.Groups, self.dialogIDs[ "ExportGroupBoxID" ], initExportGroup )
-        selectedExportOnCompleteID = self.setComboBoxOptions( self.OnComplete, self.dialogIDs[ "ExportOnCompleteBoxID" ], initExportOnComplete )
+        selectExportJobTypeID = self.setComboBoxOptions( self.Exporters, self.ExportJobTypesID, initExporter )
+        selectedExportPoolID = self.setComboBoxOptions( self.Pools, self.ExportPoolBoxID, initExportPool )
+        selectedExportSecondaryPoolID = self.setComboBoxOptions( self.SecondaryPools, self.ExportSecondaryPoolBoxID, initExportSecondaryPool )
+        selectedExportGroupID = self.setComboBoxOptions( self.Groups, self.ExportGroupBoxID, initExportGroup )
+        selectedExportOnCompleteID = self.setComboBoxOptions( self.OnComplete, self.ExportOnCompleteBoxID, initExportOnComplete )
         
-        selectedAssembleOverID = self.setComboBoxOptions( self.AssembleOver, self.dialogIDs[ "AssembleTilesOverID" ], initSelectedAssembleOver )
+        selectedAssembleOverID = self.setComboBoxOptions( self.AssembleOver, self.AssembleTilesOverID, initSelectedAssembleOver )
 
-        self.Enable( self.dialogIDs[ "TakesBoxID" ], useTakes )
-        self.Enable( self.dialogIDs[ "IncludeMainBoxID" ], useTakes )
-        self.Enable( self.dialogIDs[ "TakeFramesBoxID" ], useTakes )
+        enable( self.TakesBoxID, useTakes )
+        enable( self.IncludeMainBoxID, useTakes )
+        enable( self.TakeFramesBoxID, useTakes )
 
         # Set the default settings.
-        self.SetString( self.dialogIDs[ "NameBoxID" ], initName )
-        self.SetString( self.dialogIDs[ "CommentBoxID" ], initComment )
-        self.SetString( self.dialogIDs[ "DepartmentBoxID" ], initDepartment )
-
-        self.SetLong( self.dialogIDs[ "PoolBoxID" ], selectedPoolID )
-        self.SetLong( self.dialogIDs[ "SecondaryPoolBoxID" ], selectedSecondaryPoolID )
-        self.SetLong( self.dialogIDs[ "GroupBoxID" ], selectedGroupID )
-        self.SetLong( self.dialogIDs[ "PriorityBoxID" ], initPriority, 0, self.MaximumPriority, 1 )
-        self.SetLong( self.dialogIDs[ "MachineLimitBoxID" ], initMachineLimit )
-        self.SetLong( self.dialogIDs[ "TaskTimeoutBoxID" ], initTaskTimeout )
-        self.SetBool( self.dialogIDs[ "AutoTimeoutBoxID" ], initAutoTaskTimeout )
-        self.SetLong( self.dialogIDs[ "ConcurrentTasksBoxID" ], initConcurrentTasks )
-        self.SetBool( self.dialogIDs[ "LimitConcurrentTasksBoxID" ], initLimitConcurrentTasks )
-        self.SetBool( self.dialogIDs[ "IsBlacklistBoxID" ], initIsBlacklist )
-        self.SetString( self.dialogIDs[ "MachineListBoxID" ], initMachineList )
-        self.SetString( self.dialogIDs[ "LimitGroupsBoxID" ], initLimitGroups )
-        self.SetString( self.dialogIDs[ "DependenciesBoxID" ], initDependencies )
-        self.SetLong( self.dialogIDs[ "OnCompleteBoxID" ], selectedOnCompleteID )
-        self.SetBool( self.dialogIDs[ "SubmitSuspendedBoxID" ], initSubmitSuspended )
-        self.SetLong( self.dialogIDs[ "ChunkSizeBoxID" ], initChunkSize )
+        setString( self.NameBoxID, initName )
+        setString( self.CommentBoxID, initComment )
+        setString( self.DepartmentBoxID, initDepartment )
+
+        setLong( self.PoolBoxID, selectedPoolID )
+        setLong( self.SecondaryPoolBoxID, selectedSecondaryPoolID )
+        setLong( self.GroupBoxID, selectedGroupID )
+        setLong( self.PriorityBoxID, initPriority, 0, self.MaximumPriority, 1 )
+        setLong( self.MachineLimitBoxID, initMachineLimit )
+        setLong( self.TaskTimeoutBoxID, initTaskTimeout )
+        setBool( self.AutoTimeoutBoxID, initAutoTaskTimeout )
+        setLong( self.ConcurrentTasksBoxID, initConcurrentTasks )
+        setBool( self.LimitConcurrentTasksBoxID, initLimitConcurrentTasks )
+        setBool( self.IsBlacklistBoxID, initIsBlacklist )
+        setString( self.MachineListBoxID, initMachineList )
+        setString( self.LimitGroupsBoxID, initLimitGroups )
+        setString( self.DependenciesBoxID, initDependencies )
+        setLong( self.OnCompleteBoxID, selectedOnCompleteID )
+        setBool( self.SubmitSuspendedBoxID, initSubmitSuspended )
+        setLong( self.ChunkSizeBoxID, initChunkSize )
 
         # Find current take in list of all takes
-        self.SetLong( self.dialogIDs[ "TakesBoxID" ], 0 )
-        self.SetBool( self.dialogIDs[ "IncludeMainBoxID" ], initIncludeMainTake )
-        self.SetString( self.dialogIDs[ "FramesBoxID" ], initFrames )
-        self.SetBool( self.dialogIDs[ "TakeFramesBoxID" ], initUseTakeFrames )
-        self.SetBool( self.dialogIDs[ "SubmitSceneBoxID" ], initSubmitScene )
-        self.SetLong( self.dialogIDs[ "ThreadsBoxID" ], initThreads )
-        self.SetBool( self.dialogIDs[ "ExportProjectBoxID" ], initExportProject )
-        self.SetLong( self.dialogIDs[ "BuildBoxID" ], selectedBuildID )
-        self.SetBool( self.dialogIDs[ "LocalRenderingBoxID" ], initLocalRendering )
-        self.SetBool( self.dialogIDs[ "CloseOnSubmissionID" ], initCloseOnSubmission )
-        self.SetBool( self.dialogIDs[ "UseBatchBoxID" ], initUseBatch )
-
-        self.SetBool( self.dialogIDs[ "EnableFrameStepBoxID" ], False )
+        setLong( self.TakesBoxID, 0 )
+        setBool( self.IncludeMainBoxID, initIncludeMainTake )
+        setString( self.FramesBoxID, initFrames )
+        setBool( self.TakeFramesBoxID, initUseTakeFrames )
+        setBool( self.SubmitSceneBoxID, initSubmitScene )
+        setLong( self.ThreadsBoxID, initThreads )
+        setBool( self.ExportProjectBoxID, initExportProject )
+        setLong( self.BuildBoxID, selectedBuildID )
+        setBool( self.LocalRenderingBoxID, initLocalRendering )
+        setBool( self.CloseOnSubmissionID, initCloseOnSubmission )
+        setBool( self.UseBatchBoxID, initUseBatch )
+
+        setBool( self.EnableFrameStepBoxID, False )
         self.EnableFrameStep()
-        self.Enable( self.dialogIDs[ "SubmitSceneBoxID" ], not initExportProject )
-        self.Enable( self.dialogIDs[ "UseBatchBoxID" ], ( c4d.GetC4DVersion() / 1000 ) >= 15 )
-
-        self.SetBool( self.dialogIDs[ "EnableRegionRenderingID" ], initEnableRegionRendering )
-        self.SetLong( self.dialogIDs[ "TilesInXID" ], initTilesInX )
-        self.SetLong( self.dialogIDs[ "TilesInYID" ], initTilesInY )
-        self.SetBool( self.dialogIDs[ "SingleFrameTileJobID" ], initSingleFrameTileJob )
-        self.SetLong( self.dialogIDs[ "SingleFrameJobFrameID" ], initSingleFrameJobFrame )
-        self.SetBool( self.dialogIDs[ "SubmitDependentAssemblyID" ], initSubmitDependentAssembly )
-        self.SetBool( self.dialogIDs[ "CleanupTilesID" ], initCleanupTiles )
-        self.SetBool( self.dialogIDs[ "ErrorOnMissingTilesID" ], initErrorOnMissingTiles )
-        self.SetLong( self.dialogIDs[ "AssembleTilesOverID" ], selectedAssembleOverID)
-        self.SetString( self.dialogIDs[ "BackgroundImageID" ], initBackgroundImage )
-        self.SetBool( self.dialogIDs[ "ErrorOnMissingBackgroundID" ], initErrorOnMissingBackground )
+        enable( self.SubmitSceneBoxID, not initExportProject )
+        enable( self.UseBatchBoxID, self.batchSupported )
+
+        setBool( self.EnableRegionRenderingID, initEnableRegionRendering )
+        setLong( self.TilesInXID, initTilesInX )
+        setLong( self.TilesInYID, initTilesInY )
+        setBool( self.SingleFrameTileJobID, initSingleFrameTileJob )
+        setLong( self.SingleFrameJobFrameID, initSingleFrameJobFrame )
+        setBool( self.SubmitDependentAssemblyID, initSubmitDependentAssembly )
+        setBool( self.CleanupTilesID, initCleanupTiles )
+        setBool( self.ErrorOnMissingTilesID, initErrorOnMissingTiles )
+        setLong( self.AssembleTilesOverID, selectedAssembleOverID)
+        setString( self.BackgroundImageID, initBackgroundImage )
+        setBool( self.ErrorOnMissingBackgroundID, initErrorOnMissingBackground )
 
         self.EnableRegionRendering()
 
-        self.SetString( self.dialogIDs[ "OutputOverrideID" ], initOutputOverride )
-        self.SetString( self.dialogIDs[ "OutputMultipassOverrideID" ], initOutputMultipassOverride )
+        setString( self.OutputOverrideID, initOutputOverride )
+        setString( self.OutputMultipassOverrideID, initOutputMultipassOverride )
 
-        self.SetLong( self.dialogIDs[ "GPUsPerTaskID" ], initGPUsPerTask )
-        self.SetString( self.dialogIDs[ "SelectGPUDevicesID" ], initGPUsSelectDevices )
+        setLong( self.GPUsPerTaskID, initGPUsPerTask )
+        setString( self.SelectGPUDevicesID, initGPUsSelectDevices )
 
-        self.SetBool( self.dialogIDs[ "EnableAssetServerPrecachingID" ], initEnableAssetServerPrecaching )
+        setBool( self.EnableAssetServerPrecachingID, initEnableAssetServerPrecaching )
 
         self.EnableGPUAffinityOverride()
 
-        self.SetString( self.dialogIDs[ "ExportLocationBoxID" ], initExportLocation )
-        self.SetBool( self.dialogIDs[ "ExportJobID" ], initExportJob )
-        if len( self.Exporters ) == 0:
-            self.SetBool( self.dialogIDs[ "ExportJobID" ], False )
-            self.Enable( self.dialogIDs[ "ExportJobID" ], False )
+        setString( self.ExportLocationBoxID, initExportLocation )
+        setBool( self.ExportJobID, initExportJob )
+        if not self.Exporters:
+            setBool( self.ExportJobID, False )
+            enable( self.ExportJobID, False )
         self.EnableExportFields()
 
-        self.SetBool( self.dialogIDs[ "ExportLocalID" ], initExportJobLocal )
-        self.SetBool( self.dialogIDs[ "ExportDependentJobBoxID" ], initExportDependentJob )
+        setBool( self.ExportLocalID, initExportJobLocal )
+        setBool( self.ExportDependentJobBoxID, initExportDependentJob )
         self.EnableDependentExportFields()
 
-        self.SetLong( self.dialogIDs[ "ExportPoolBoxID" ], selectedExportPoolID )
-        self.SetLong( self.dialogIDs[ "ExportSecondaryPoolBoxID" ], selectedExportSecondaryPoolID )
-        self.SetLong( self.dialogIDs[ "ExportGroupBoxID" ], selectedExportGroupID )
-        self.SetLong( self.dialogIDs[ "ExportPriorityBoxID" ], initExportPriority, 0, self.MaximumPriority, 1 )
-        self.SetLong( self.dialogIDs[ "ExportThreadsBoxID" ], initExportThreads )
-        self.SetLong( self.dialogIDs[ "ExportTaskTimeoutBoxID" ], initExportTaskTimeout )
-        self.SetBool( self.dialogIDs[ "ExportAutoTimeoutBoxID" ], initExportAutoTaskTimeout )
-        self.SetLong( self.dialogIDs[ "ExportConcurrentTasksBoxID" ], initExportConcurrentTasks )
-        self.SetBool( self.dialogIDs[ "ExportLimitConcurrentTasksBoxID" ], initExportLimitConcurrentTasks )
-        self.SetLong( self.dialogIDs[ "ExportMachineLimitBoxID" ], initExportMachineLimit )
-        self.SetBool( self.dialogIDs[ "ExportIsBlacklistBoxID" ], initExportIsBlacklist )
-        self.SetString( self.dialogIDs[ "ExportMachineListBoxID" ], initExportMachineList )
-        self.SetString( self.dialogIDs[ "ExportLimitGroupsBoxID" ], initExportLimitGroups )
-        self.SetLong( self.dialogIDs[ "ExportOnCompleteBoxID" ], selectedExportOnCompleteID )
-        self.SetBool( self.dialogIDs[ "ExportSubmitSuspendedBoxID" ], initExportSubmitSuspended )
+        setLong( self.ExportPoolBoxID, selectedExportPoolID )
+        setLong( self.ExportSecondaryPoolBoxID, selectedExportSecondaryPoolID )
+        setLong( self.ExportGroupBoxID, selectedExportGroupID )
+        setLong( self.ExportPriorityBoxID, initExportPriority, 0, self.MaximumPriority, 1 )
+        setLong( self.ExportThreadsBoxID, initExportThreads )
+        setLong( self.ExportTaskTimeoutBoxID, initExportTaskTimeout )
+        setBool( self.ExportAutoTimeoutBoxID, initExportAutoTaskTimeout )
+        setLong( self.ExportConcurrentTasksBoxID, initExportConcurrentTasks )
+        setBool( self.ExportLimitConcurrentTasksBoxID, initExportLimitConcurrentTasks )
+        setLong( self.ExportMachineLimitBoxID, initExportMachineLimit )
+        setBool( self.ExportIsBlacklistBoxID, initExportIsBlacklist )
+        setString( self.ExportMachineListBoxID, initExportMachineList )
+        setString( self.ExportLimitGroupsBoxID, initExportLimitGroups )
+        setLong( self.ExportOnCompleteBoxID, selectedExportOnCompleteID )
+        setBool( self.ExportSubmitSuspendedBoxID, initExportSubmitSuspended )
 
         #If 'CustomSanityChecks.py' exists, then it executes. This gives the user the ability to change default values
-        self.SanityCheckFile = os.path.join( self.C4DSubmissionDir, "CustomSanityChecks.py" )
         if os.path.isfile( self.SanityCheckFile ):
             print( "Running sanity check script: " + self.SanityCheckFile )
             try:
-                import CustomSanityChecks
+                CustomSanityChecks = _import_from_path( "CustomSanityChecks", self.SanityCheckFile )
                 sanityResult = CustomSanityChecks.RunSanityCheck( self )
                 if not sanityResult:
                     print( "Sanity check returned False, exiting" )
@@ -905,53 +1176,88 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
 
         return True
 
+    def readStickySettings( self ):
+        """
+        Reads the Sticky section of the settings file in a single pass.
+        :return: A dict of setting name to value, converted to the type listed in STICKY_SETTINGS. Settings that have not been saved are left out.
+        """
+        sticky = {}
+        try:
+            if not os.path.isfile( self.ConfigFile ):
+                return sticky
+
+            # The sticky values are plain strings, so skip ConfigParser's % interpolation on every read.
+            config = ConfigParser.RawConfigParser()
+            with io.open( self.ConfigFile, "rb" ) as fileHandle:
+                rawContents = fileHandle.read()
+            # The file is written as UTF-8, but files saved by older submitters used the locale encoding.
+            try:
+                contents = rawContents.decode( "utf-8" )
+            except UnicodeDecodeError:
+                contents = rawContents.decode( locale.getpreferredencoding( False ) )
+            # Match the newline translation of a text mode read, so the contents compare equal to what was written.
+            contents = contents.replace( "\r\n", "\n" )
+            config.read_string( contents, source=self.ConfigFile )
+            self.stickySettingsContents = contents
+            if not config.has_section( "Sticky" ):
+                return sticky
+
+            # Snapshot the section once, ConfigParser lowercases the option names.
+            values = dict( config.items( "Sticky" ) )
+        except:
+            print( "Could not read sticky settings:\n" + traceback.format_exc() )
+            return sticky
+
+        # Convert each setting on its own so one bad value only drops that setting, not the rest.
+        badSettings = []
+        for name, optionName, valueType in SubmitC4DToDeadlineDialog.STICKY_OPTIONS:
+            value = values.get( optionName )
+            if value is None:
+                continue
+            try:
+                sticky[ name ] = _STICKY_CONVERTERS[ valueType ]( value )
+            except ( ValueError, TypeError ):
+                badSettings.append( name )
+
+        if badSettings:
+            print( "Ignoring invalid sticky settings: %s" % ", ".join( badSettings ) )
+
+        return sticky
+
     def setComboBoxOptions( self, options, dialogID, stickyValue ):
-        selectedID = 0
+        addChild = self.AddChild
         for i, option in enumerate( options ):
-            self.AddChild( dialogID, i, option )
-            if stickyValue == option:
-                selectedID = i
+            addChild( dialogID, i, option )
 
-        return selectedID
+        optionIndices = self.optionIndices.get( options )
+        if optionIndices is None:
+            # Keep the first index if an option is listed twice, as index() would.
+            optionIndices = self.optionIndices[ options ] = { option: i for i, option in reversed( list( enumerate( options ) ) ) }
+
+        return optionIndices.get( stickyValue, 0 )
 
     def EnableExportFields( self ):
-        exportEnabled = self.GetBool( self.dialogIDs[ "ExportJobID" ] )
+        exportEnabled = self.GetBool( self.ExportJobID )
 
-        self.Enable( self.dialogIDs[ "ExportDependentJobBoxID" ], exportEnabled )
-        self.Enable( self.dialogIDs[ "ExportJobTypesID" ], exportEnabled )
-        self.Enable( self.dialogIDs[ "ExportLocationButtonID" ], exportEnabled )
-        self.Enable( self.dialogIDs[ "ExportLocationBoxID" ], exportEnabled )
+        self.Enable( self.ExportDependentJobBoxID, exportEnabled )
+        self.Enable( self.ExportJobTypesID, exportEnabled )
+        self.Enable( self.ExportLocationButtonID, exportEnabled )
+        self.Enable( self.ExportLocationBoxID, exportEnabled )
 
         self.EnableDependentExportFields()
 
     def EnableDependentExportFields( self ):
-        dependentExportEnabled = self.GetBool( self.dialogIDs[ "ExportDependentJobBoxID" ] )
-        exportJobEnabled = self.GetBool( self.dialogIDs[ "ExportJobID" ] )
-
-        self.Enable( self.dialogIDs[ "ExportPoolBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportSecondaryPoolBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportGroupBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportPriorityBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportThreadsBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportTaskTimeoutBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportAutoTimeoutBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportConcurrentTasksBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportLimitConcurrentTasksBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportMachineLimitBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportIsBlacklistBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportMachineListBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportMachineListButtonID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportLimitGroupsBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportLimitGroupsButtonID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportOnCompleteBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportSubmitSuspendedBoxID" ], ( dependentExportEnabled and exportJobEnabled ) )
-        self.Enable( self.dialogIDs[ "ExportLocalID" ], ( dependentExportEnabled and exportJobEnabled ) )
+        enabled = self.GetBool( self.ExportDependentJobBoxID ) and self.GetBool( self.ExportJobID )
+        enable = self.Enable
+
+        for dialogID in self.DEPENDENT_EXPORT_IDS:
+            enable( dialogID, enabled )
 
     def EnableFrameStep( self ):
-        frameStepEnabled = self.GetBool( self.dialogIDs[ "EnableFrameStepBoxID" ] )
+        frameStepEnabled = self.GetBool( self.EnableFrameStepBoxID )
         
-        isSingleTileJob = self.GetBool( self.dialogIDs[ "SingleFrameTileJobID" ] ) and self.IsRegionRenderingEnabled()
-        self.Enable( self.dialogIDs[ "ChunkSizeBoxID" ], not frameStepEnabled and not isSingleTileJob )
+        isSingleTileJob = self.GetBool( self.SingleFrameTileJobID ) and self.IsRegionRenderingEnabled()
+        self.Enable( self.ChunkSizeBoxID, not frameStepEnabled and not isSingleTileJob )
 
     def IsGPUAffinityOverrideEnabled( self ):
         """
@@ -964,82 +1270,119 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         """
         Determines if the the specified take uses a renderer that support gpu affinity.
         """
+        takeKey = take.GetGUID()
+        usesGPU = self.gpuTakeCache.get( takeKey )
+        if usesGPU is None:
+            rdata = deadlinec4d.takes.get_effective_renderdata(take)
+            usesGPU = self.gpuTakeCache[ takeKey ] = rdata[c4d.RDATA_RENDERENGINE] in self.gpuRendererIDs
 
-        rdata = deadlinec4d.takes.get_effective_renderdata(take)
-        renderer_name = self.GetRendererName( rdata[c4d.RDATA_RENDERENGINE] )
-        return renderer_name in self.gpuRenderers
+        return usesGPU
 
     def EnableGPUAffinityOverride( self ):
         enabled = self.IsGPUAffinityOverrideEnabled()
 
-        self.Enable( self.dialogIDs[ "GPUsPerTaskID" ], enabled )
-        self.Enable( self.dialogIDs[ "SelectGPUDevicesID" ], enabled )
+        self.Enable( self.GPUsPerTaskID, enabled )
+        self.Enable( self.SelectGPUDevicesID, enabled )
 
     def IsRegionRenderingEnabled( self ):
-        return self.GetBool( self.dialogIDs[ "EnableRegionRenderingID" ] ) and self.GetBool( self.dialogIDs[ "UseBatchBoxID" ] )
+        return self.GetBool( self.EnableRegionRenderingID ) and self.GetBool( self.UseBatchBoxID )
     
     def EnableRegionRendering( self ):
-        self.Enable( self.dialogIDs[ "EnableRegionRenderingID" ], self.GetBool( self.dialogIDs[ "UseBatchBoxID" ] ) )
-
-        enable = self.IsRegionRenderingEnabled()
-            
-        self.Enable( self.dialogIDs[ "TilesInXID" ], enable )
-        self.Enable( self.dialogIDs[ "TilesInYID" ], enable )
-        self.Enable( self.dialogIDs[ "SingleFrameTileJobID" ], enable )
-        self.Enable( self.dialogIDs[ "SubmitDependentAssemblyID" ], enable )
-        self.Enable( self.dialogIDs[ "CleanupTilesID" ], enable )
-        self.Enable( self.dialogIDs[ "ErrorOnMissingTilesID" ], enable )
-        self.Enable( self.dialogIDs[ "AssembleTilesOverID" ], enable )
-        
-        self.IsSingleFrameTileJob()
+        # Read each checkbox once and pass the flags down, rather than having every helper re-query the dialog.
+        getBool = self.GetBool
+        useBatch = getBool( self.UseBatchBoxID )
+        regionEnabled = useBatch and getBool( self.EnableRegionRenderingID )
+        singleTile = regionEnabled and getBool( self.SingleFrameTileJobID )
+        frameStep = getBool( self.EnableFrameStepBoxID )
+
+        self._applyRegionState( useBatch, regionEnabled, singleTile, frameStep )
         self.AssembleOverChanged()
         self.EnableOutputOverrides()
 
+    def _applyRegionState( self, useBatch, regionEnabled, singleTile, frameStep ):
+        """
+        Enables the region rendering controls for the given dialog state.
+        :param useBatch: Whether batch mode is checked.
+        :param regionEnabled: Whether region rendering is enabled (requires batch mode).
+        :param singleTile: Whether this is a single frame tile job (requires region rendering).
+        :param frameStep: Whether the frame step checkbox is checked.
+        """
+        enable = self.Enable
+        enable( self.EnableRegionRenderingID, useBatch )
+
+        for dialogID in self.REGION_RENDERING_IDS:
+            enable( dialogID, regionEnabled )
+
+        self._applySingleFrameTileState( singleTile, frameStep )
+
     def IsOutputOverrideEnabled( self ):
-        return not self.GetBool( self.dialogIDs[ "ExportJobID" ] )
+        return not self.GetBool( self.ExportJobID )
     
     def EnableOutputOverrides( self ):
         enable = self.IsOutputOverrideEnabled()
 
-        self.Enable( self.dialogIDs[ "OutputOverrideID" ], enable )
-        self.Enable( self.dialogIDs[ "OutputMultipassOverrideID" ], enable )
+        self.Enable( self.OutputOverrideID, enable )
+        self.Enable( self.OutputMultipassOverrideID, enable )
 
     def IsSingleFrameTileJob( self ):
-        isSingleJob = self.GetBool( self.dialogIDs[ "SingleFrameTileJobID" ] ) and self.IsRegionRenderingEnabled()
-            
-        self.Enable( self.dialogIDs[ "SingleFrameJobFrameID" ], isSingleJob )
-        self.Enable( self.dialogIDs[ "EnableFrameStepBoxID" ], not isSingleJob )
-        self.Enable( self.dialogIDs[ "FramesBoxID" ], not isSingleJob )
-        
-        self.EnableFrameStep()
+        isSingleJob = self.GetBool( self.SingleFrameTileJobID ) and self.IsRegionRenderingEnabled()
+        self._applySingleFrameTileState( isSingleJob, self.GetBool( self.EnableFrameStepBoxID ) )
+
+    def _applySingleFrameTileState( self, singleTile, frameStep ):
+        enable = self.Enable
+        enable( self.SingleFrameJobFrameID, singleTile )
+        enable( self.EnableFrameStepBoxID, not singleTile )
+        enable( self.FramesBoxID, not singleTile )
+        enable( self.ChunkSizeBoxID, not frameStep and not singleTile )
     
     def AssembleOverChanged( self ):
-        assembleOver = self.GetLong( self.dialogIDs[ "AssembleTilesOverID" ] )
-        if assembleOver == 0:
-            self.Enable( self.dialogIDs[ "BackgroundImageID" ], False )
-            self.Enable( self.dialogIDs[ "BackgroundImageButtonID" ], False )
-            self.Enable( self.dialogIDs[ "ErrorOnMissingBackgroundID" ], False )
-        elif assembleOver == 1:
-            self.Enable( self.dialogIDs[ "BackgroundImageID" ], False )
-            self.Enable( self.dialogIDs[ "BackgroundImageButtonID" ], False )
-            self.Enable( self.dialogIDs[ "ErrorOnMissingBackgroundID" ], True )
-        elif assembleOver == 2:
-            self.Enable( self.dialogIDs[ "BackgroundImageID" ], True )
-            self.Enable( self.dialogIDs[ "BackgroundImageButtonID" ], True )
-            self.Enable( self.dialogIDs[ "ErrorOnMissingBackgroundID" ], True )
+        assembleOver = self.GetLong( self.AssembleTilesOverID )
+        if not 0 <= assembleOver < len( self.ASSEMBLE_OVER_STATES ):
+            return
+
+        enable = self.Enable
+        for dialogID, enabled in zip( self.ASSEMBLE_OVER_IDS, self.ASSEMBLE_OVER_STATES[ assembleOver ] ):
+            enable( dialogID, enabled )
     
+    def getActiveScenePath( self ):
+        """
+        :return: The folder of the active document, cached until the document changes.
+        """
+        if self.activeScenePath is None:
+            self.activeScenePath = documents.GetActiveDocument().GetDocumentPath()
+        return self.activeScenePath
+
     def retrievePipelineToolStatus( self ):
         """
         Grabs a status message from the JobWriter that indicates which pipeline tools have settings enabled for the current scene.
         :return: A string representing the status of the pipeline tools for the current scene.
         """
-        jobWriterPath = os.path.join( self.IntegrationDir, "JobWriter.py" )
-        scenePath = documents.GetActiveDocument().GetDocumentPath()
-        args = [ "-ExecuteScript", jobWriterPath, "Cinema4D", "--status", "--scene-path", scenePath ]
-        statusMessage = CallDeadlineCommand( args )
+        scenePath = self.getActiveScenePath()
+        cacheKey = self.getPipelineToolStatusCacheKey()
+        statusMessage = _PIPELINE_TOOL_STATUS_CACHE.get( cacheKey )
+        if statusMessage is None:
+            statusMessage = self.executeIntegrationScript( self.JobWriterPath, "Cinema4D", "--status", "--scene-path", scenePath )
+            # Errors are not cached so they are retried the next time the dialog is opened.
+            if statusMessage and not statusMessage.startswith( "Error" ):
+                _PIPELINE_TOOL_STATUS_CACHE[ cacheKey ] = statusMessage
 
         return statusMessage
 
+    def getPipelineToolStatusCacheKey( self ):
+        """
+        Builds the key the pipeline tools status is cached under. The scene file's modification time is part of the key
+        so the status is fetched again once the scene is saved.
+        :return: A hashable cache key.
+        """
+        scene = documents.GetActiveDocument()
+        scenePath = scene.GetDocumentPath()
+        sceneFilename = os.path.join( scenePath, scene.GetDocumentName() ) if scenePath else ""
+        try:
+            modifiedTime = os.path.getmtime( sceneFilename ) if sceneFilename else 0
+        except OSError:
+            modifiedTime = 0
+        return ( self.IntegrationDir, sceneFilename, modifiedTime )
+
     def updatePipelineToolStatusLabel( self, statusMessage ):
         """
         Updates the pipeline tools status label with a non-empty status message as there's always a status associated with the pipeline tools.
@@ -1050,10 +1393,10 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
             raise ValueError( 'The status message for the pipeline tools label is not allowed to be empty.' )
 
         if statusMessage.startswith( "Error" ):
-            self.SetString( self.dialogIDs[ "PipelineToolStatusID" ], "Pipeline Tools Error" )
+            self.SetString( self.PipelineToolStatusID, "Pipeline Tools Error" )
             print( statusMessage )
         else:
-            self.SetString( self.dialogIDs[ "PipelineToolStatusID" ], statusMessage )
+            self.SetString( self.PipelineToolStatusID, statusMessage )
 
     def OpenIntegrationWindow( self ):
         """
@@ -1072,10 +1415,16 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
             print( traceback.format_exc() )
 
         print( "\nOpening Integration window" )
-        integrationPath = os.path.join( self.IntegrationDir, "IntegrationUIStandAlone.py" )
-        scenePath = documents.GetActiveDocument().GetDocumentPath()
-        args = [ "-ExecuteScript", integrationPath, "-v", "2", "Cinema4D", "-d", "Shotgun", "FTrack", "NIM", "--path", scenePath ]
-        statusMessage = CallDeadlineCommand( args, hideWindow=False, useArgFile=True )
+        scenePath = self.getActiveScenePath()
+        statusMessage = self.executeIntegrationScript( self.IntegrationUIPath, "-v", "2", "Cinema4D", "-d", "Shotgun", "FTrack", "NIM",
+                                                       "--path", scenePath, hideWindow=False )
+
+        # The settings may have changed, so replace any cached status for this scene with the new one.
+        cacheKey = self.getPipelineToolStatusCacheKey()
+        _PIPELINE_TOOL_STATUS_CACHE.pop( cacheKey, None )
+        if statusMessage and not statusMessage.startswith( "Error" ):
+            _PIPELINE_TOOL_STATUS_CACHE[ cacheKey ] = statusMessage
+
         self.updatePipelineToolStatusLabel( statusMessage )
 
     def ConcatenatePipelineSettingsToJob( self, jobInfoPath, batchName ):
@@ -1086,27 +1435,87 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         :return: None
         """
 
-        jobWriterPath = os.path.join( self.IntegrationDir, "JobWriter.py" )
-        scenePath = documents.GetActiveDocument().GetDocumentPath()
-        argArray = [ "-ExecuteScript", jobWriterPath, "Cinema4D", "--write", "--scene-path", scenePath, "--job-path",
-                    jobInfoPath, "--batch-name", batchName ]
-        CallDeadlineCommand( argArray, hideWindow=False, useArgFile=True )
+        scenePath = self.getActiveScenePath()
+        self.executeIntegrationScript( self.JobWriterPath, "Cinema4D", "--write", "--scene-path", scenePath, "--job-path", jobInfoPath,
+                                       "--batch-name", batchName, hideWindow=False )
+
+    def executeIntegrationScript( self, scriptPath, *args, hideWindow=True ):
+        """
+        Runs one of the pipeline tools integration scripts through deadlinecommand. The arguments are always passed in an
+        argument file, since scene and job paths can make the command line long.
+        :param scriptPath: The full path to the integration script.
+        :param args: The arguments to pass to the script.
+        :param hideWindow: Whether to hide the deadlinecommand window. Defaults to True.
+        :return: The output from deadlinecommand.
+        """
+        arguments = [ "-ExecuteScript", scriptPath ]
+        arguments.extend( args )
+        return CallDeadlineCommand( arguments, hideWindow=hideWindow, useArgFile=True )
+
+    def submitJobFiles( self, jobFiles, auxFiles, precacheAssets ):
+        """
+        Submits the given jobs to Deadline. Several jobs are sent with a single -SubmitMultipleJobs call, so deadlinecommand only
+        has to start up once.
+        :param jobFiles: A list of (job info file, plugin info file) pairs.
+        :param auxFiles: A list of auxiliary files to submit with every job.
+        :param precacheAssets: Whether to start AWS Portal asset precaching for each submitted job.
+        :return: A tuple of the number of successful submissions, the number of failed submissions, the submitted job IDs, and
+                 the output from deadlinecommand.
+        """
+        print( "Submitting job" if len( jobFiles ) == 1 else "Submitting %s jobs" % len( jobFiles ) )
+        c4d.StatusSetSpin()
+
+        if len( jobFiles ) == 1:
+            args = list( jobFiles[ 0 ] ) + auxFiles
+        else:
+            args = [ "-SubmitMultipleJobs" ]
+            for jobInfoFile, pluginInfoFile in jobFiles:
+                args.extend( [ "-job", jobInfoFile, pluginInfoFile ] )
+                args.extend( auxFiles )
+
+        try:
+            results = CallDeadlineCommand( args, useArgFile=True )
+        except:
+            results = "An error occurred while submitting the job to Deadline."
+
+        print( results )
+
+        # Each job's output has a Result= line followed by its JobID= line.
+        successes = 0
+        jobIds = []
+        for jobResults in results.split( "Result=" )[ 1: ]:
+            if not jobResults.startswith( "Success" ):
+                continue
+
+            successes += 1
+            for line in jobResults.split():
+                if line.startswith( "JobID=" ):
+                    jobId = line.replace( "JobID=", "" )
+                    if jobId:
+                        jobIds.append( jobId )
+                        if precacheAssets:
+                            print( CallDeadlineCommand( [ "-AWSPortalPrecacheJob", jobId ] ) )
+                    break
 
-    def SubmitDependentExportJob( self, renderer, jobIds, groupBatch, take ):
+        return successes, len( jobFiles ) - successes, jobIds, results
+
+    def SubmitDependentExportJob( self, renderer, jobIds, groupBatch, take, renderInfo=None ):
         """
         Submits the dependent render job for the current renderer following the export process
         :param renderer: string representation of the current renderer
         :param jobIds: a list of dependent job IDs
         :param groupBatch: boolean used to determine if we should batch the jobs
         :param take: the current take to render
+        :param renderInfo: the take's render settings, if the caller already has them
         :return: the results from submitting the job via deadlinecommand
         """
         scene = documents.GetActiveDocument()
-        jobName = self.GetString( self.dialogIDs[ "NameBoxID" ] )
+        jobName = self.GetString( self.NameBoxID )
 
         exportDependencies = ",".join( jobIds )
 
-        renderInfo = self.GetRenderInfo( scene, take )
+        if renderInfo is None:
+            renderInfo = self.GetRenderInfo( scene, take )
         renderData = renderInfo.GetDataInstance()
 
         if take:
@@ -1114,7 +1523,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
 
         jobName += " - %s Standalone" % renderer
 
-        scenePath = scene.GetDocumentPath()
+        scenePath = self.getActiveScenePath()
         outputPath = self.getOutputPath( renderData, scenePath )
 
         outputFormat = renderData.GetLong( c4d.RDATA_FORMAT )
@@ -1124,55 +1533,55 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         print( "\nCreating %s standalone job info file" % renderer )
         exportJobInfoFile = os.path.join( self.DeadlineTemp, "%s_submit_info.job" % renderer.lower() )
 
+        getLong = self.GetLong
+        getBool = self.GetBool
+
         jobContents = {
             "Plugin" : renderer,
             "Name" : jobName,
-            "Pool" : self.Pools[ self.GetLong( self.dialogIDs[ "ExportPoolBoxID" ] ) ],
+            "Pool" : self.Pools[ getLong( self.ExportPoolBoxID ) ],
             "SecondaryPool" : "",
-            "Group" : self.Groups[ self.GetLong( self.dialogIDs[ "ExportGroupBoxID" ] ) ],
-            "Priority" : self.GetLong( self.dialogIDs[ "ExportPriorityBoxID" ] ),
-            "MachineLimit" : self.GetLong( self.dialogIDs[ "ExportMachineLimitBoxID" ] ),
-            "TaskTimeoutMinutes" : self.GetLong( self.dialogIDs[ "ExportTaskTimeoutBoxID" ] ),
-            "EnableAutoTimeout" : self.GetBool( self.dialogIDs[ "ExportAutoTimeoutBoxID" ] ),
-            "ConcurrentTasks" : self.GetLong( self.dialogIDs[ "ExportConcurrentTasksBoxID" ] ),
-            "LimitConcurrentTasksToNumberOfCpus" : self.GetBool( self.dialogIDs[ "ExportLimitConcurrentTasksBoxID" ] ),
-            "LimitGroups" : self.GetString( self.dialogIDs[ "ExportLimitGroupsBoxID" ] ),
+            "Group" : self.Groups[ getLong( self.ExportGroupBoxID ) ],
+            "LimitGroups" : self.GetString( self.ExportLimitGroupsBoxID ),
             "JobDependencies" : exportDependencies,
-            "OnJobComplete" : self.OnComplete[ self.GetLong( self.dialogIDs[ "ExportOnCompleteBoxID" ] ) ],
+            "OnJobComplete" : self.OnComplete[ getLong( self.ExportOnCompleteBoxID ) ],
             "IsFrameDependent" : True,
             "ChunkSize" : 1,
         }
+        jobContents.update( ( key, getLong( dialogID ) ) for key, dialogID in self.EXPORT_LONG_SETTINGS )
+        jobContents.update( ( key, getBool( dialogID ) ) for key, dialogID in self.EXPORT_BOOL_SETTINGS )
 
         if groupBatch:
-            jobContents[ "BatchName" ] = self.GetString( self.dialogIDs[ "NameBoxID" ] )
+            jobContents[ "BatchName" ] = self.GetString( self.NameBoxID )
 
         # If it's not a space, then a secondary pool was selected.
-        if self.SecondaryPools[ self.GetLong( self.dialogIDs[ "ExportSecondaryPoolBoxID" ] ) ] != " ":
-            jobContents[ "SecondaryPool" ] = self.SecondaryPools[ self.GetLong( self.dialogIDs[ "ExportSecondaryPoolBoxID" ] ) ]
+        secondaryPool = self.SecondaryPools[ getLong( self.ExportSecondaryPoolBoxID ) ]
+        if secondaryPool != " ":
+            jobContents[ "SecondaryPool" ] = secondaryPool
 
-        if self.GetBool( self.dialogIDs[ "TakeFramesBoxID" ] ):
+        if self.GetBool( self.TakeFramesBoxID ):
             framesPerSecond = renderData.GetReal( c4d.RDATA_FRAMERATE )
             startFrame = renderData.GetTime( c4d.RDATA_FRAMEFROM ).GetFrame( int(framesPerSecond) )
             endFrame = renderData.GetTime( c4d.RDATA_FRAMETO ).GetFrame( int(framesPerSecond) )
             frames = "%s-%s" % ( startFrame, endFrame )
         else:
-            frames  = self.GetString( self.dialogIDs[ "FramesBoxID" ] )
+            frames  = self.GetString( self.FramesBoxID )
         jobContents[ "Frames" ] = frames
 
-        if self.GetBool( self.dialogIDs[ "ExportSubmitSuspendedBoxID" ] ):
+        if self.GetBool( self.ExportSubmitSuspendedBoxID ):
             jobContents[ "InitialStatus" ] = "Suspended"
 
-        if self.GetBool( self.dialogIDs[ "ExportIsBlacklistBoxID" ] ):
-            jobContents[ "Blacklist" ] = self.GetString( self.dialogIDs[ "ExportMachineListBoxID" ] )
+        if self.GetBool( self.ExportIsBlacklistBoxID ):
+            jobContents[ "Blacklist" ] = self.GetString( self.ExportMachineListBoxID )
         else:
-            jobContents[ "Whitelist" ] = self.GetString( self.dialogIDs[ "ExportMachineListBoxID" ] )
+            jobContents[ "Whitelist" ] = self.GetString( self.ExportMachineListBoxID )
 
         outputFilename = self.GetOutputFileName( outputPath, outputFormat, outputNameFormat, take )
         if outputFilename:
             jobContents[ "OutputFilename0" ] = outputFilename
 
         self.writeInfoFile( exportJobInfoFile, jobContents )
-        self.ConcatenatePipelineSettingsToJob( exportJobInfoFile, self.GetString( self.dialogIDs[ "NameBoxID" ] ) )
+        self.ConcatenatePipelineSettingsToJob( exportJobInfoFile, self.GetString( self.NameBoxID ) )
 
         print( "Creating %s standalone plugin info file" % renderer )
         exportPluginInfoFile = os.path.join( self.DeadlineTemp, "%s_plugin_info.job" % renderer.lower() )
@@ -1184,9 +1593,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
             pluginContents[ "SceneFile" ] = exportFilename
 
         elif renderer == "Octane":
-            octaneVideoPost = renderInfo.GetFirstVideoPost()
-            while octaneVideoPost is not None and not self.GetRendererName( octaneVideoPost.GetType() ) == "octane":
-                octaneVideoPost = octaneVideoPost.GetNext()
+            octaneVideoPost = self.getTakeVideoPosts( scene, take ).get( self.rendererIDs[ "octane" ] )
 
             # This shouldn't happen as we check all the settings before the submission.
             if not octaneVideoPost:
@@ -1194,7 +1601,9 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                 print( errorMessage )
                 return errorMessage
 
-            pluginContents[ "Version" ] = self.getOctaneVersion( scene )
+            if self.octaneVersion is None:
+                self.octaneVersion = self.getOctaneVersion( scene )
+            pluginContents[ "Version" ] = self.octaneVersion
             pluginContents[ "SceneFile" ] = exportFilename
             if outputPath:
                 pluginContents[ "OutputFolder" ] = os.path.dirname( outputPath )
@@ -1220,7 +1629,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
             pluginContents[ "InputFile" ] = exportFilename
 
         if renderer == "Arnold":
-            pluginContents[ "Threads" ] = self.GetLong( self.dialogIDs[ "ExportThreadsBoxID" ] )
+            pluginContents[ "Threads" ] = self.GetLong( self.ExportThreadsBoxID )
             pluginContents[ "CommandLineOptions" ] = ""
             pluginContents[ "Verbose" ] = 4
 
@@ -1248,9 +1657,10 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         :return: A string that contains the full path to the output.
         """
         outputPath = renderData.GetFilename( c4d.RDATA_PATH )
-        outputOverride = self.GetString( self.dialogIDs[ "OutputOverrideID" ] ).strip()
-        if self.IsOutputOverrideEnabled() and len( outputOverride ) > 0:
-            outputPath = outputOverride
+        if self.IsOutputOverrideEnabled():
+            outputOverride = self.GetString( self.OutputOverrideID ).strip()
+            if outputOverride:
+                outputPath = outputOverride
 
         if not os.path.isabs( outputPath ):
             outputPath = os.path.join( scenePath, outputPath )
@@ -1265,9 +1675,11 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         errors = []
         export_scene_takes = []
 
+        if _find_plugin(self.VRAY5_RENDERER_ID, c4d.PLUGINTYPE_VIDEOPOST) is None:
+            return errors
+
         for take in takes:
-            render_info = self.GetRenderInfo(scene, take)
-            video_post = self.vray5_get_video_post(render_info)
+            video_post = self.vray5_get_take_video_post(scene, take)
             if video_post and video_post[c4d.VRAY_VP_COMMON_EXPORT_STD_SCENE_ENABLED]:
                 export_scene_takes.append(take.GetName())
 
@@ -1288,8 +1700,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         :param region_prefix: The prefix to be used if region rendering is enabled.
         :return: A list of all output filenames with frame numbers replaced with ####.
         """
-        render_info = self.GetRenderInfo( scene, take )
-        video_post = self.vray5_get_video_post(render_info)
+        video_post = self.vray5_get_take_video_post(scene, take)
         use_vray_output = self.vray5_get_use_output_system(video_post)
 
         if not use_vray_output or not output_path:
@@ -1309,13 +1720,11 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
 
         if self.vray5_save_multiple_files(video_post, output_format):
             # Get output paths of all enabled render elements.
-            render_elements = self.vray5_get_render_elements(scene, video_post)
+            render_elements = self.vray5_get_take_render_elements(scene, take, video_post)
             for render_element in render_elements:
                 # Replace spaces and dashes with underscores to match the V-Ray behavior.
-                render_element = re.sub(r"[\s-]", "_", render_element)
-                render_element_path = output_prefix
-                for token in (self.PASS_TOKEN, self.USER_PASS_TOKEN):
-                    render_element_path = render_element_path.replace(token, render_element)
+                render_element = self.RENDER_ELEMENT_SEPARATORS_RE.sub("_", render_element)
+                render_element_path = self.PASS_TOKENS_RE.sub(lambda match: render_element, output_prefix)
                 render_element_path += "." + output_format
                 paths.append(render_element_path)
 
@@ -1338,10 +1747,17 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
 
         modified_output, temp_output_extension = os.path.splitext( output_path )
 
-        if not any(token in modified_output for token in (self.PASS_TOKEN, self.USER_PASS_TOKEN)):
+        # One regex scan finds either pass token.
+        has_pass_token = self.PASS_TOKENS_RE.search(modified_output) is not None
+        has_frame_token = self.FRAME_TOKEN in modified_output
+        if has_pass_token and has_frame_token and temp_output_extension:
+            # Nothing needs adding, so the path can be used as is.
+            return output_path
+
+        if not has_pass_token:
             modified_output += "." + self.PASS_TOKEN
 
-        if self.FRAME_TOKEN not in modified_output:
+        if not has_frame_token:
             modified_output += "." + self.FRAME_TOKEN
 
         # Output extension will be ignored by Cinema4D, so we just add here a dummy extension,
@@ -1358,11 +1774,9 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         rgb_path = None
         save_rgb = not bool(video_post[c4d.SETTINGSOUTPUT_IMG_DONTSAVERGBCHANNEL])
         # For exr and vrimg one file is always created. It will contain the main rgb pass and all the render elements.
-        if output_format in ["exr", "vrimg"] or save_rgb:
-            rgb_path = output_prefix
+        if output_format in self.VRAY5_SINGLE_FILE_FORMATS or save_rgb:
             # Remove pass or userpass tokens with an optional preceding dot.
-            for token in (self.PASS_TOKEN, self.USER_PASS_TOKEN):
-                rgb_path = re.sub(r"\.?%s" % re.escape(token), "", rgb_path)
+            rgb_path = self.DOTTED_PASS_TOKENS_RE.sub("", output_prefix)
             rgb_path += "." + output_format
 
         return rgb_path
@@ -1398,11 +1812,11 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
 
         # Add all enabled V-Ray render elements
         channels = []
+        append_channel = channels.append
         channel_node = head.GetFirst()
         while channel_node:
-            channel_data = channel_node.GetDataInstance()
-            if channel_data[ VRAY5_MP_NODE_ISENABLED ]:
-                channels.append( channel_node.GetName() )
+            if channel_node.GetDataInstance()[ VRAY5_MP_NODE_ISENABLED ]:
+                append_channel( channel_node.GetName() )
 
             channel_node = channel_node.GetNext()
 
@@ -1421,6 +1835,18 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
 
         return channels
 
+    def vray5_get_take_render_elements(self, scene, take, video_post):
+        """
+        Return the names of the take's enabled V-Ray render elements.
+        The result is reused for the rest of the submission, since the render elements are the same for every tile of a take.
+        """
+        take_key = take.GetGUID() if take else None
+        try:
+            return self.vray5RenderElementsCache[take_key]
+        except KeyError:
+            render_elements = self.vray5RenderElementsCache[take_key] = self.vray5_get_render_elements(scene, video_post)
+            return render_elements
+
     def vray5_eval_tokens(self, paths, doc, take):
         """Replace Cinema4D tokens (resolution, date, etc.) in V-Ray 5 output paths."""
         evaluated_paths = []
@@ -1435,12 +1861,21 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
 
     def vray5_get_video_post(self, render_info):
         """Return video post object for V-Ray 5 if available. Otherwise, return None."""
-        video_post = render_info.GetFirstVideoPost()
+        # Without the V-Ray plugin there is nothing to find, so don't walk the video posts at all.
+        if _find_plugin(self.VRAY5_RENDERER_ID, c4d.PLUGINTYPE_VIDEOPOST) is None:
+            return None
 
-        while video_post is not None and not self.GetRendererName( video_post.GetType() ) == "vray_5":
-           video_post = video_post.GetNext()
+        return self.getVideoPosts(render_info).get(self.VRAY5_RENDERER_ID)
 
-        return video_post
+    def vray5_get_take_video_post(self, scene, take):
+        """
+        Return the V-Ray 5 video post for the take's render data, or None.
+        The result is reused for the rest of the submission, since the output paths are built once per frame and tile.
+        """
+        if _find_plugin(self.VRAY5_RENDERER_ID, c4d.PLUGINTYPE_VIDEOPOST) is None:
+            return None
+
+        return self.getTakeVideoPosts(scene, take).get(self.VRAY5_RENDERER_ID)
 
     def vray5_get_use_output_system(self, video_post):
         """Return True if V-Ray output system is enabled. Otherwise, return False."""
@@ -1466,20 +1901,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
 
     def vray5_get_format(self, c4d_id, default_return="png"):
         """Converts Cinema4D ID for V-Ray file format into a readable string displayed in UI."""
-        switcher = {
-            c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_PNG: "png",
-            c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_JPG: "jpg",
-            c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_VRIMG: "vrimg",
-            c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_HDR: "hdr",
-            c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_EXR: "exr",
-            c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_TGA: "tga",
-            c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_BMP: "bmp",
-            c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_SGI: "sgi",
-            c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_TIF: "tif",
-            c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_VRST: "vrst",
-        }
-
-        return switcher.get(c4d_id, default_return)
+        return _vray5_format_names().get(c4d_id, default_return)
 
     def vray5_create_dta_config_file(self, frame, render_data, output_name):
         """
@@ -1489,8 +1911,13 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         :param output_name: The full path to the output file with #### instead of a frame number.
         :return: A name of the created config file.
         """
-        # Partial function, that requires region prefix to be passed when called.
-        get_region_output_filename_function = partial(insert_before_substring, output_name, self.FRAME_PLACEHOLDER)
+        # Split the name around the frame placeholder once, rather than searching for it again for every tile.
+        # The region prefix goes right before the placeholder, and the name is left alone if there is no placeholder.
+        head, placeholder, tail = output_name.partition(self.FRAME_PLACEHOLDER)
+        if placeholder:
+            get_region_output_filename_function = lambda region_prefix: head + region_prefix + placeholder + tail
+        else:
+            get_region_output_filename_function = lambda region_prefix: output_name
         return self.create_dta_config_file(frame, render_data, output_name, get_region_output_filename_function)
 
     def create_dta_config_file(self, frame, render_data, output_name, get_region_output_filename_function):
@@ -1508,8 +1935,8 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
 
         width = render_data.GetLong( c4d.RDATA_XRES )
         height = render_data.GetLong( c4d.RDATA_YRES )
-        tiles_in_x = self.GetLong( self.dialogIDs[ "TilesInXID" ] )
-        tiles_in_y = self.GetLong( self.dialogIDs[ "TilesInYID" ] )
+        tiles_in_x = self.GetLong( self.TilesInXID )
+        tiles_in_y = self.GetLong( self.TilesInYID )
 
         file_name, fileExtension = os.path.splitext( padded_output_name )
         
@@ -1523,43 +1950,41 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
             "TileCount" : tiles_in_x * tiles_in_y,
         }
 
-        background_type = self.AssembleOver[ self.GetLong( self.dialogIDs[ "AssembleTilesOverID" ] ) ]
+        background_type = self.AssembleOver[ self.GetLong( self.AssembleTilesOverID ) ]
         if background_type == "Previous Output":
             config_contents[ "BackgroundSource" ] = padded_output_name
         elif background_type == "Selected Image":
-            background_image = self.GetString( self.dialogIDs[ "BackgroundImageID" ] )
+            background_image = self.GetString( self.BackgroundImageID )
             config_contents[ "BackgroundSource" ] = background_image
 
+        # The tile edges are shared by every tile in the same row or column, so round each one once up front.
+        x_edges = [ int( ( float( x ) / tiles_in_x ) * width + 0.5 ) for x in range( tiles_in_x + 1 ) ]
+        y_edges = [ int( ( float( y ) / tiles_in_y ) * height + 0.5 ) for y in range( tiles_in_y + 1 ) ]
+
+        # The tiles are formatted straight into lines, five per tile, rather than going through the info file dict.
+        config_lines = [ "%s=%s" % item for item in config_contents.items() ]
+        tile_template = self.DTA_TILE_CONFIG_TEMPLATE
+
         curr_tile = 0
         region_num = 0
         for y in range( tiles_in_y ):
-            for x in range( tiles_in_x ):
-                left = ( float( x ) /tiles_in_x ) * width
-                left = int( left + 0.5 )
+            top = height - y_edges[ y + 1 ]
+            tile_height = y_edges[ y + 1 ] - y_edges[ y ]
 
-                right = ( float( x + 1.0 ) /tiles_in_x ) * width
-                right = int( right + 0.5 )
-                tile_width = right - left
-
-                top = ( float( y + 1 ) /tiles_in_y ) * height
-                top = height - int( top + 0.5 )
-
-                tile_height = int ( ( float( y + 1 ) /tiles_in_y ) * height +0.5 ) - int ( ( float( y ) /tiles_in_y ) * height +0.5 )
+            for x in range( tiles_in_x ):
+                left = x_edges[ x ]
+                tile_width = x_edges[ x + 1 ] - left
 
                 region_prefix = "_region_%s_" % region_num
                 region_output_filename = get_region_output_filename_function(region_prefix)
                 region_output_filename = region_output_filename.replace( self.FRAME_PLACEHOLDER, padded_frame )
 
-                config_contents["Tile%iFileName" % curr_tile] = region_output_filename
-                config_contents["Tile%iX" % curr_tile] = left
-                config_contents["Tile%iY" % curr_tile] = top
-                config_contents["Tile%iWidth" % curr_tile] = tile_width
-                config_contents["Tile%iHeight" % curr_tile] = tile_height
+                config_lines.append( tile_template.format( curr_tile, region_output_filename, left, top, tile_width, tile_height ) )
 
                 curr_tile += 1
                 region_num += 1
 
-        self.writeInfoFile( config_filename, config_contents )
+        self.writeInfoLines( config_filename, config_lines )
 
         return config_filename
 
@@ -1576,9 +2001,8 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         octaneVersion = containerInstance.GetLong( c4d.SET_OCTANE_VERSION, 4000000 )
         versionInC4D = str( octaneVersion // 1000000 )
 
-        C4D_TO_DEADLINE_VERSION = { "5":"2018", "6":"2019", "10":"2020" }
         # Try to find the mapping in the dictionary. If there is no mapping, use version as is by default.
-        versionInDeadline = C4D_TO_DEADLINE_VERSION.get(versionInC4D, versionInC4D)
+        versionInDeadline = SubmitC4DToDeadlineDialog.OCTANE_C4D_TO_DEADLINE_VERSIONS.get(versionInC4D, versionInC4D)
 
         return versionInDeadline
 
@@ -1592,32 +2016,20 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         if not outputFilename:
             return "%n_%p_%f_%s.%e"
 
-        outputFilename = re.sub( r"#{3,4}", "%F", outputFilename )
+        # Most names have no frame padding at all, so only run the regex when there is a # to replace.
+        if "#" in outputFilename:
+            outputFilename = self.FRAME_PADDING_RE.sub( "%F", outputFilename )
         template = ".%e"
 
         passPlaceholder = "%p"
         if saveRenderPasses and passPlaceholder not in outputFilename:
             template = "_" + passPlaceholder + template
 
-        fullFilename = os.path.split( outputFilename )[ 1 ]
-        return  os.path.splitext( fullFilename )[ 0 ] + template
+        return os.path.splitext( os.path.basename( outputFilename ) )[ 0 ] + template
 
     def getOctaneCompression( self, argument, defaultReturn="ZIP (lossless)" ):
         """Converts Cinema4D ID of selected compression into a string supported by Deadline Submitter."""
-        switcher = {
-            0: "Uncompressed",
-            1: "RLE (lossless)",
-            2: "ZIPS (lossless)",
-            3: "ZIP (lossless)",
-            4: "PIZ (lossless)",
-            5: "PXR24 (lossy)",
-            6: "B44 (lossy)",
-            7: "B44A (lossy)",
-            8: "DWAA (lossy)",
-            9: "DWAB (lossy)"
-        }
-
-        return switcher.get(argument, defaultReturn)
+        return self.OCTANE_COMPRESSIONS.get(argument, defaultReturn)
 
     def createOctaneFileFormat( self, extension, depth, tonemap=3 ):
         """
@@ -1648,15 +2060,19 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         :param fileContents: A dictionary of submission key-value pairs to be written to the info file
         :return: None
         """
-        # A list comprehension with a join statement on a newline doesn't work here, since we're mixing and matches types which
-        # causes unicode decode issues. As such, iterating over the  items is the cleanest method that works in python 2 and 3.
+        self.writeInfoLines( filename, [ "%s=%s" % item for item in fileContents.items() ] )
 
+    def writeInfoLines( self, filename, lines ):
+        """
+        Writes already formatted key=value lines to a Deadline info file, encoded and written in one go.
+        :param filename: The path to the info file
+        :param lines: The lines to write, without line endings
+        :return: None
+        """
+        # Joined in one pass, with the final line ending added on the end rather than formatted onto every line.
+        contents = "\n".join( lines ) + "\n" if lines else ""
         with open( filename, "wb" ) as fileHandle:
-            for key, value in fileContents.items():
-                line = "%s=%s\n" % ( key, value )
-                if isinstance(line, unicode_type):
-                    line = line.encode("utf-8")
-                fileHandle.write( line )
+            fileHandle.write( contents.encode( "utf-8" ) )
 
     def getExportFilename( self, renderer, take ):
         """
@@ -1665,94 +2081,77 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         :param take: The current take
         :return: A string containing the resulting filename
         """
-        exportFilename = self.GetString( self.dialogIDs[ "ExportLocationBoxID" ] )
+        exportFilename = self.GetString( self.ExportLocationBoxID )
 
         if not os.path.isabs( exportFilename ):
-            scene = documents.GetActiveDocument()
-            scenePath = scene.GetDocumentPath()
-            exportFilename = os.path.join( scenePath, exportFilename )
+            exportFilename = os.path.join( self.getActiveScenePath(), exportFilename )
 
         exportFilename, extension = os.path.splitext( exportFilename )
 
-        exportFilename = "%s_%s" % ( exportFilename, take.GetName() )
+        if renderer == "Octane":
+            frameSuffix = ""
+        elif renderer == "Redshift":
+            frameSuffix = "0000"
+        else:
+            frameSuffix = ".0000"
+
+        return "%s_%s%s%s" % ( exportFilename, take.GetName(), frameSuffix, extension )
+
+    def readDialogState( self ):
+        """
+        Reads every control listed in the DIALOG_STATE_*_CONTROLS tables from the dialog, once each.
+        :return: A types.SimpleNamespace with an attribute per control name. Combo boxes hold the selected option, or None if the box has no options.
+        """
+        getString, getLong, getBool = self.GetString, self.GetLong, self.GetBool
 
-        if renderer not in [ "Octane", "Redshift" ]:
-            exportFilename += "."
+        state = { name: getString( dialogID ) for name, dialogID in self.DIALOG_STATE_STRING_CONTROLS }
+        state.update( ( name, getLong( dialogID ) ) for name, dialogID in self.DIALOG_STATE_LONG_CONTROLS )
+        state.update( ( name, getBool( dialogID ) ) for name, dialogID in self.DIALOG_STATE_BOOL_CONTROLS )
 
-        if renderer != "Octane":
-            exportFilename += "0000"
-        
-        exportFilename += extension
+        for name, dialogID, optionsName in self.DIALOG_STATE_COMBO_CONTROLS:
+            # The exporters list is empty when no exporter plugins are installed.
+            options = getattr( self, optionsName )
+            state[ name ] = options[ getLong( dialogID ) ] if options else None
 
-        return exportFilename
+        return types.SimpleNamespace( **state )
 
-    def WriteStickySettings( self ):
+    def WriteStickySettings( self, state=None ):
+        """
+        Saves the sticky settings to the settings file.
+        :param state: The dialog state from readDialogState. Read from the dialog if not given.
+        :return: None
+        """
         print( "Writing sticky settings" )
         # Save sticky settings
         try:
-            config = ConfigParser.ConfigParser()
-            config.add_section( "Sticky" )
-
-            config.set( "Sticky", "Department", self.GetString( self.dialogIDs[ "DepartmentBoxID" ] ) )
-            config.set( "Sticky", "Pool", self.Pools[ self.GetLong( self.dialogIDs[ "PoolBoxID" ] ) ] )
-            config.set( "Sticky", "SecondaryPool", self.SecondaryPools[ self.GetLong( self.dialogIDs[ "SecondaryPoolBoxID" ] ) ] )
-            config.set( "Sticky", "Group", self.Groups[ self.GetLong( self.dialogIDs[ "GroupBoxID" ] ) ] )
-            config.set( "Sticky", "Priority", str( self.GetLong( self.dialogIDs[ "PriorityBoxID" ] ) ) )
-            config.set( "Sticky", "MachineLimit", str( self.GetLong( self.dialogIDs[ "MachineLimitBoxID" ] ) ) )
-            config.set( "Sticky", "IsBlacklist", str( self.GetBool( self.dialogIDs[ "IsBlacklistBoxID" ] ) ) )
-            config.set( "Sticky", "MachineList", self.GetString( self.dialogIDs[ "MachineListBoxID" ] ) )
-            config.set( "Sticky", "ConcurrentTasks", str( self.GetLong( self.dialogIDs[ "ConcurrentTasksBoxID" ] ) ) )
-            config.set( "Sticky", "LimitGroups", self.GetString( self.dialogIDs[ "LimitGroupsBoxID" ] ) )
-            config.set( "Sticky", "SubmitSuspended", str( self.GetBool( self.dialogIDs[ "SubmitSuspendedBoxID" ] ) ) )
-            config.set( "Sticky", "ChunkSize", str( self.GetLong( self.dialogIDs[ "ChunkSizeBoxID" ] ) ) )
-
-            config.set( "Sticky", "IncludeMainTake", str( self.GetBool( self.dialogIDs[ "IncludeMainBoxID" ] ) ) )
-            config.set( "Sticky", "UseTakeFrames", str( self.GetBool( self.dialogIDs[ "TakeFramesBoxID" ] ) ) )
-            config.set( "Sticky", "SubmitScene", str( self.GetBool( self.dialogIDs[ "SubmitSceneBoxID" ] ) ) )
-            config.set( "Sticky", "Threads", str( self.GetLong( self.dialogIDs[ "ThreadsBoxID" ] ) ) )
-            config.set( "Sticky", "ExportProject", str( self.GetBool( self.dialogIDs[ "ExportProjectBoxID" ] ) ) )
-            config.set( "Sticky", "Build", self.Builds[ self.GetLong( self.dialogIDs[ "BuildBoxID" ] ) ] )
-            config.set( "Sticky", "LocalRendering", str( self.GetBool( self.dialogIDs[ "LocalRenderingBoxID" ] ) ) )
-            config.set( "Sticky", "CloseOnSubmission", str( self.GetBool( self.dialogIDs[ "CloseOnSubmissionID" ] ) ) )
-            config.set( "Sticky", "UseBatchPlugin", str( self.GetBool( self.dialogIDs[ "UseBatchBoxID" ] ) ) )
-
-            config.set( "Sticky", "ExportJob", str( self.GetBool( self.dialogIDs[ "ExportJobID" ] ) ) )
-            config.set( "Sticky", "ExportDependentJob", str( self.GetBool( self.dialogIDs[ "ExportDependentJobBoxID" ] ) ) )
-            config.set( "Sticky", "LocalExport", str(self.GetBool( self.dialogIDs[ "ExportLocalID" ] ) ))
-            config.set( "Sticky", "ExportPool", self.Pools[ self.GetLong( self.dialogIDs[ "ExportPoolBoxID" ] ) ] )
-            config.set( "Sticky", "ExportSecondaryPool", self.SecondaryPools[ self.GetLong( self.dialogIDs[ "ExportSecondaryPoolBoxID" ] ) ] )
-            config.set( "Sticky", "ExportGroup", self.Groups[ self.GetLong( self.dialogIDs[ "ExportGroupBoxID" ] ) ] )
-            config.set( "Sticky", "ExportPriority", str( self.GetLong( self.dialogIDs[ "ExportPriorityBoxID" ] ) ) )
-            config.set( "Sticky", "ExportMachineLimit", str( self.GetLong( self.dialogIDs[ "ExportMachineLimitBoxID" ] ) ) )
-            config.set( "Sticky", "ExportIsBlacklist", str( self.GetBool( self.dialogIDs[ "ExportIsBlacklistBoxID" ] ) ) )
-            config.set( "Sticky", "ExportMachineList", self.GetString( self.dialogIDs[ "ExportMachineListBoxID" ] ) )
-            config.set( "Sticky", "ExportLimitGroups", self.GetString( self.dialogIDs[ "ExportLimitGroupsBoxID" ] ) )
-            config.set( "Sticky", "ExportSubmitSuspended", str( self.GetBool( self.dialogIDs[ "ExportSubmitSuspendedBoxID" ] ) ) )
-            config.set( "Sticky", "ExportThreads", str( self.GetLong( self.dialogIDs[ "ExportThreadsBoxID" ] ) ) )
-            config.set( "Sticky", "ExportOutputLocation", self.GetString( self.dialogIDs[ "ExportLocationBoxID" ] ) )
-
-            config.set( "Sticky", "EnableRegionRendering", str(self.GetBool( self.dialogIDs[ "EnableRegionRenderingID" ] ) ))
-            config.set( "Sticky", "TilesInX", str( self.GetLong( self.dialogIDs[ "TilesInXID" ] ) ) )
-            config.set( "Sticky", "TilesInY", str( self.GetLong( self.dialogIDs[ "TilesInYID" ] ) ) )
-            config.set( "Sticky", "SingleFrameTileJob", str(self.GetBool( self.dialogIDs[ "SingleFrameTileJobID" ] ) ))
-            config.set( "Sticky", "SingleFrameJobFrame", str( self.GetLong( self.dialogIDs[ "SingleFrameJobFrameID" ] ) ) )
-            config.set( "Sticky", "SubmitDependentAssembly", str(self.GetBool( self.dialogIDs[ "SubmitDependentAssemblyID" ] ) ))
-            config.set( "Sticky", "CleanupTiles", str(self.GetBool( self.dialogIDs[ "CleanupTilesID" ] ) ))
-            config.set( "Sticky", "ErrorOnMissingTiles", str(self.GetBool( self.dialogIDs[ "ErrorOnMissingTilesID" ] ) ))
-            config.set( "Sticky", "AssembleTilesOver", self.AssembleOver[ self.GetLong( self.dialogIDs[ "AssembleTilesOverID" ] ) ] )
-            config.set( "Sticky", "BackgroundImage", self.GetString( self.dialogIDs[ "BackgroundImageID" ] ) )
-            config.set( "Sticky", "ErrorOnMissingBackground", str(self.GetBool( self.dialogIDs[ "ErrorOnMissingBackgroundID" ] ) ))
-
-            config.set( "Sticky", "OutputOverride", self.GetString( self.dialogIDs[ "OutputOverrideID" ] ) )
-            config.set( "Sticky", "OutputMultipassOverride", self.GetString( self.dialogIDs[ "OutputMultipassOverrideID" ] ) )
-
-            config.set( "Sticky" ,"GPUsPerTask", str( self.GetLong( self.dialogIDs[ "GPUsPerTaskID" ] ) ) )
-            config.set( "Sticky", "GPUsSelectDevices", self.GetString( self.dialogIDs[ "SelectGPUDevicesID" ] ) )
-
-            config.set( "Sticky", "EnableAssetServerPrecaching", str(self.GetBool( self.dialogIDs[ "EnableAssetServerPrecachingID" ] ) ))
-            
-            with open( self.ConfigFile, "w" ) as fileHandle:
-                config.write( fileHandle )
+            if state is None:
+                state = self.readDialogState()
+
+            # Collect the values in a plain dict and hand the whole section to the parser at once.
+            values = vars( state )
+            sticky = { name: str( values[ name ] ) for name in self.STICKY_CONTROL_NAMES }
+
+            config = ConfigParser.RawConfigParser()
+            config.read_dict( { "Sticky": sticky } )
+
+            # Format the file in memory so it is written out in a single call.
+            buffer = io.StringIO()
+            config.write( buffer )
+            contents = buffer.getvalue()
+            if contents == self.stickySettingsContents:
+                print( "Sticky settings are unchanged" )
+                return
+
+            # Write next to the settings file and swap it in, so an interrupted write can't leave a truncated file behind.
+            fileHandle = tempfile.NamedTemporaryFile( "w", encoding="utf-8", dir=os.path.dirname( self.ConfigFile ), suffix=".tmp", delete=False )
+            try:
+                with fileHandle:
+                    fileHandle.write( contents )
+                os.replace( fileHandle.name, self.ConfigFile )
+            except:
+                os.remove( fileHandle.name )
+                raise
+            self.stickySettingsContents = contents
         except:
             print( "Could not write sticky settings:\n" + traceback.format_exc() )
 
@@ -1774,19 +2173,17 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         """
         message = []
 
-        def check_output_settings( save_image_container_id, output_path_container_id, is_multipass, take_name ):
+        def check_output_settings( render_data, save_image_container_id, output_path_container_id, is_multipass, take_message ):
             """
             Check if the render output settings are in a good state and add any issues to the list of warning messages.
 
             Container ids can be found here (https://developers.maxon.net/docs/Cinema4DPythonSDK/html/modules/c4d.documents/RenderData/index.html)
+            :param c4d.BaseContainer -- render_data: The render settings of the take to check
             :param int -- save_image_container_id:
             :param int -- output_path_container_id:
             :param bool -- is_multipass: Whether or not we are checking multipass output
-            :param String -- take_name: The name the take to check
+            :param String -- take_message: Names the take in the warning, or "" when takes aren't being used
             """
-            # If the takes name is "" or None it's because takes aren't being used. No need to include takes in the
-            # messaging at that point.
-            take_message = ' in the "{}" take'.format( take_name ) if take_name else ""
             message_prefix = ' multipass' if is_multipass else ""
 
             if not render_data.GetBool( save_image_container_id ):
@@ -1796,84 +2193,129 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
 
                 if not output_path:
                     message.append( "The{} output image does not have a path set{}.".format( message_prefix, take_message ) )
-                elif deadlinec4d.utils.is_path_local(output_path):
+                    return
+
+                if self.isPathLocal( output_path ):
                     message.append(
                         "The{} output image path '{}'{} is local and may not be accessible by your render nodes.".format( message_prefix, output_path, take_message )
                     )
 
         for take in takes:
-            render_data = self.GetRenderInfo( scene, take ).GetDataInstance()
-            check_output_settings( save_image_container_id=c4d.RDATA_SAVEIMAGE, output_path_container_id=c4d.RDATA_PATH,
-                                  is_multipass=False, take_name=take.GetName() )
+            render_data = self.getTakeRenderInfo( scene, take ).GetDataInstance()
+            # If the takes name is "" or None it's because takes aren't being used. No need to include takes in the
+            # messaging at that point.
+            take_name = take.GetName()
+            take_message = ' in the "{}" take'.format( take_name ) if take_name else ""
+
+            check_output_settings( render_data, save_image_container_id=c4d.RDATA_SAVEIMAGE, output_path_container_id=c4d.RDATA_PATH,
+                                  is_multipass=False, take_message=take_message )
 
             if render_data.GetBool( c4d.RDATA_MULTIPASS_ENABLE ):
-                check_output_settings( save_image_container_id=c4d.RDATA_MULTIPASS_SAVEIMAGE,
+                check_output_settings( render_data, save_image_container_id=c4d.RDATA_MULTIPASS_SAVEIMAGE,
                                       output_path_container_id=c4d.RDATA_MULTIPASS_FILENAME, is_multipass=True,
-                                      take_name=take.GetName() )
+                                      take_message=take_message )
 
         return message
 
-    def SubmitJob( self ):
+    def clearSubmissionCaches( self ):
+        """
+        Drops the scene lookups that are only reused within a single submission.
+        :return: None
+        """
+        self.renderInfoCache.clear()
+        self.videoPostCache.clear()
+        self.vray5RenderElementsCache.clear()
+        self.octaneVersion = None
+        self.localPathCache.clear()
+
+    def isPathLocal( self, path ):
+        """
+        A cached deadlinec4d.utils.is_path_local. The cache only lasts for a single submission, since drives can be
+        mapped or unmapped in between.
+        :param path: The path to check
+        :return: Whether the path is on a local drive
+        """
+        isLocal = self.localPathCache.get( path )
+        if isLocal is None:
+            isLocal = self.localPathCache[ path ] = deadlinec4d.utils.is_path_local( path )
+        return isLocal
+
+    def parseFrameNumbers( self, frames ):
+        """
+        Asks Deadline to expand a frame list string such as "1-20,40x2,50".
+        :param frames: The frame list string
+        :return: The frame numbers in the list, as ints
+        """
+        frameListString = CallDeadlineCommand( [ "-ParseFrameList", frames, "False" ] ).strip()
+        return [ int( frame ) for frame in frameListString.split( "," ) ]
+
+    def SubmitJob( self, state=None ):
+        if state is None:
+            state = self.readDialogState()
+
+        # Look the scene folder up again for this submission, then reuse it for every job that is written.
+        self.activeScenePath = None
+        self.clearSubmissionCaches()
 
         takesToRender = self.takes_to_render()
 
-        jobName = self.GetString( self.dialogIDs[ "NameBoxID" ] )
-        comment = self.GetString( self.dialogIDs[ "CommentBoxID" ] )
-        department = self.GetString( self.dialogIDs[ "DepartmentBoxID" ] )
-        
-        pool = self.Pools[ self.GetLong( self.dialogIDs[ "PoolBoxID" ] ) ]
-        secondaryPool = self.SecondaryPools[ self.GetLong( self.dialogIDs[ "SecondaryPoolBoxID" ] ) ]
-        group = self.Groups[ self.GetLong( self.dialogIDs[ "GroupBoxID" ] ) ]
-        priority = self.GetLong( self.dialogIDs[ "PriorityBoxID" ] )
-        machineLimit = self.GetLong( self.dialogIDs[ "MachineLimitBoxID" ] )
-        taskTimeout = self.GetLong( self.dialogIDs[ "TaskTimeoutBoxID" ] )
-        autoTaskTimeout = self.GetBool( self.dialogIDs[ "AutoTimeoutBoxID" ] )
-        concurrentTasks = self.GetLong( self.dialogIDs[ "ConcurrentTasksBoxID" ] )
-        limitConcurrentTasks = self.GetBool( self.dialogIDs[ "LimitConcurrentTasksBoxID" ] )
-        isBlacklist = self.GetBool( self.dialogIDs[ "IsBlacklistBoxID" ] )
-        machineList = self.GetString( self.dialogIDs[ "MachineListBoxID" ] )
-        limitGroups = self.GetString( self.dialogIDs[ "LimitGroupsBoxID" ] )
-        dependencies = self.GetString( self.dialogIDs[ "DependenciesBoxID" ] )
-        onComplete = self.OnComplete[ self.GetLong( self.dialogIDs[ "OnCompleteBoxID" ] ) ]
-        submitSuspended = self.GetBool( self.dialogIDs[ "SubmitSuspendedBoxID" ] )
-        IncludeMainTake = self.GetBool( self.dialogIDs[ "IncludeMainBoxID" ] )
-
-        frames = self.GetString( self.dialogIDs[ "FramesBoxID" ] )
-        useTakeFrames = self.GetBool( self.dialogIDs[ "TakeFramesBoxID" ] )
-        frameStepEnabled = self.GetBool( self.dialogIDs[ "EnableFrameStepBoxID" ] )
+        jobName = state.JobName
+        comment = state.Comment
+        department = state.Department
+        
+        pool = state.Pool
+        secondaryPool = state.SecondaryPool
+        group = state.Group
+        priority = state.Priority
+        machineLimit = state.MachineLimit
+        taskTimeout = state.TaskTimeout
+        autoTaskTimeout = state.AutoTimeout
+        concurrentTasks = state.ConcurrentTasks
+        limitConcurrentTasks = state.LimitConcurrentTasks
+        isBlacklist = state.IsBlacklist
+        machineList = state.MachineList
+        limitGroups = state.LimitGroups
+        dependencies = state.Dependencies
+        onComplete = state.OnComplete
+        submitSuspended = state.SubmitSuspended
+        IncludeMainTake = state.IncludeMainTake
+
+        frames = state.Frames
+        useTakeFrames = state.UseTakeFrames
+        frameStepEnabled = state.EnableFrameStep
         frameStep = 1
-        chunkSize = self.GetLong( self.dialogIDs[ "ChunkSizeBoxID" ] )
-        threads = self.GetLong( self.dialogIDs[ "ThreadsBoxID" ] )
-        build = self.Builds[ self.GetLong( self.dialogIDs[ "BuildBoxID" ] ) ]
-        submitScene = self.GetBool( self.dialogIDs[ "SubmitSceneBoxID" ] )
-        exportProject = self.GetBool( self.dialogIDs[ "ExportProjectBoxID" ] )
-        localRendering = self.GetBool( self.dialogIDs[ "LocalRenderingBoxID" ] )
-        useBatchPlugin = self.GetBool( self.dialogIDs[ "UseBatchBoxID" ] )
-        disableOpenGl = self.GetBool( self.dialogIDs[ "OpenGLBoxID" ] )
-
-        exportJob = self.GetBool( self.dialogIDs[ "ExportJobID" ] )
-        if self.Exporters:
-            exporter = self.Exporters[ self.GetLong( self.dialogIDs[ "ExportJobTypesID" ] ) ]
-        dependentExport = self.GetBool( self.dialogIDs[ "ExportDependentJobBoxID" ] ) and exportJob
-        localExport = self.GetBool( self.dialogIDs[ "ExportLocalID" ] ) and dependentExport
-        exportFilename = self.GetString( self.dialogIDs[ "ExportLocationBoxID" ] )
-
-        GPUsPerTask = self.GetLong( self.dialogIDs[ "GPUsPerTaskID" ] )
-        GPUsSelectDevices = self.GetString( self.dialogIDs[ "SelectGPUDevicesID" ] )
-
-        EnableRegionRendering = self.IsRegionRenderingEnabled()
-        TilesInX = self.GetLong( self.dialogIDs[ "TilesInXID" ] )
-        TilesInY = self.GetLong( self.dialogIDs[ "TilesInYID" ] )
-        SingleFrameTileJob = self.GetBool( self.dialogIDs[ "SingleFrameTileJobID" ] )
-        SingleFrameJobFrame = self.GetLong( self.dialogIDs[ "SingleFrameJobFrameID" ] )
-        SubmitDependentAssembly = self.GetBool( self.dialogIDs[ "SubmitDependentAssemblyID" ] )
-        CleanupTiles = self.GetBool( self.dialogIDs[ "CleanupTilesID" ] )
-        ErrorOnMissingTiles = self.GetBool( self.dialogIDs[ "ErrorOnMissingTilesID" ] )
-        AssembleTilesOver = self.AssembleOver[ self.GetLong( self.dialogIDs[ "AssembleTilesOverID" ] ) ]
-        BackgroundImage = self.GetString( self.dialogIDs[ "BackgroundImageID" ] )
-        ErrorOnMissingBackground = self.GetBool( self.dialogIDs[ "ErrorOnMissingBackgroundID" ] )
-
-        EnableAssetServerPrecaching = self.GetBool( self.dialogIDs[ "EnableAssetServerPrecachingID" ] )
+        chunkSize = state.ChunkSize
+        threads = state.Threads
+        build = state.Build
+        submitScene = state.SubmitScene
+        exportProject = state.ExportProject
+        localRendering = state.LocalRendering
+        useBatchPlugin = state.UseBatchPlugin
+        disableOpenGl = state.DisableOpenGL
+
+        exportJob = state.ExportJob
+        exporter = state.Exporter
+        dependentExport = state.ExportDependentJob and exportJob
+        localExport = state.LocalExport and dependentExport
+        exportFilename = state.ExportOutputLocation
+        outputMultipassOverride = state.OutputMultipassOverride.strip()
+
+        GPUsPerTask = state.GPUsPerTask
+        GPUsSelectDevices = state.GPUsSelectDevices
+
+        EnableRegionRendering = state.EnableRegionRendering and useBatchPlugin
+        TilesInX = state.TilesInX
+        TilesInY = state.TilesInY
+        SingleFrameTileJob = state.SingleFrameTileJob
+        SingleFrameJobFrame = state.SingleFrameJobFrame
+        SubmitDependentAssembly = state.SubmitDependentAssembly
+        CleanupTiles = state.CleanupTiles
+        ErrorOnMissingTiles = state.ErrorOnMissingTiles
+        AssembleTilesOver = state.AssembleTilesOver
+        BackgroundImage = state.BackgroundImage
+        ErrorOnMissingBackground = state.ErrorOnMissingBackground
+
+        EnableAssetServerPrecaching = state.EnableAssetServerPrecaching
 
         regionJobCount = 1
         regionOutputCount = 1
@@ -1900,7 +2342,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
 
         sceneFilename = os.path.join( scenePath, sceneName )
 
-        if deadlinec4d.utils.is_path_local( sceneFilename ) and not submitScene:
+        if not submitScene and self.isPathLocal( sceneFilename ):
             warningMessages.append( "The c4d file %s is local and is not being submitted with the Job." %sceneFilename )
 
         warningMessages.extend( self.renderOutputSanityCheck( scene, takesToRender ) )
@@ -1929,21 +2371,17 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
             if "," in frames:
                 errorMessages.append( "Unable to submit non contiguous frame ranges when submitting all frames as a single task." )
             else:
-                match = re.search( r"x(\d+)", frames )
+                match = self.FRAME_STEP_RE.search( frames )
                 if match is not None:
                     frameStep = int( match.group( 1 ) )
-                    frames = re.sub( r"x\d+", "", frames )
+                    frames = self.FRAME_STEP_RE.sub( "", frames )
         
         if errorMessages:
-            errorMessages.insert( 0, "The following errors were detected:\n" )
-            errorMessages.append( "\nPlease fix these issues and submit again." )
-            gui.MessageDialog( "\n\n".join( errorMessages ) )
+            gui.MessageDialog( "The following errors were detected:\n\n\n%s\n\n\nPlease fix these issues and submit again." % "\n\n".join( errorMessages ) )
             return False
         
         if warningMessages:
-            warningMessages.insert( 0, "The following warnings were detected:\n" )
-            warningMessages.append( "\nDo you still wish to submit this job to Deadline?" )
-            if not gui.QuestionDialog( "\n\n".join( warningMessages ) ):
+            if not gui.QuestionDialog( "The following warnings were detected:\n\n\n%s\n\n\nDo you still wish to submit this job to Deadline?" % "\n\n".join( warningMessages ) ):
                 return False
         
         groupBatch = ( ( EnableRegionRendering and SubmitDependentAssembly ) or
@@ -1951,186 +2389,258 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                       ( len( takesToRender ) > 1 ) )
         
         renderData = scene.GetActiveRenderData().GetDataInstance()
-        framesPerSecond = renderData.GetReal( c4d.RDATA_FRAMERATE )
+        # Frames are counted at the whole frame rate of the active render settings.
+        framesPerSecond = int( renderData.GetReal( c4d.RDATA_FRAMERATE ) )
         successes = 0
         failures = 0
+        auxFiles = [ sceneFilename ] if submitScene else []
+        # Jobs that don't depend on each other are all written first and then sent to Deadline in one call.
+        # A dependent export job needs the IDs of the jobs before it though, so those are still submitted one at a time,
+        # and a dependent assembly job needs the IDs of its take's jobs, so each take's jobs are sent before the next take.
+        batchJobs = not dependentExport
+        batchTakes = batchJobs and not ( EnableRegionRendering and SubmitDependentAssembly )
+        pendingJobFiles = []
+        results = ""
+        # The frame list is parsed by Deadline the first time a take needs it and reused for the rest of the submission.
+        frameNumbers = None
+
+        # The texture search paths and the scene's assets don't change between takes or regions, so look them up once.
+        # The asset entries are formatted up front too, and added to each job info file in one update.
+        textureSearchPaths = self.getTextureSearchPaths()
+        assetEntries = {}
+        if EnableAssetServerPrecaching and not localExport:
+            assets = self.GetAllAssets( submitScene, sceneFilename )
+            assetEntries = { "AWSAssetFile%d" % index: asset for index, asset in enumerate( assets ) }
+
+        # The region prefix of each output in a job. A single frame tile job writes every tile, and other region jobs
+        # swap in their own region below.
+        regionPrefixes = ( "", )
+        if EnableRegionRendering and SingleFrameTileJob:
+            regionPrefixes = tuple( "_region_%s_" % outputRegNum for outputRegNum in range( regionOutputCount ) )
+
+        # Bound once here since they're used for every region job.
+        pathJoin = os.path.join
+        pathSplit = os.path.split
+        pathSplitext = os.path.splitext
+        pathDirname = os.path.dirname
+
         # Loop through the list of takes and submit them all
         for take in takesToRender:
             jobIds = []
-            submissionSuccess = 0
             exportFilename = ""
+            take_name = take.GetName()
             if exportJob:
-                exportFilename = self.GetString( self.dialogIDs[ "ExportLocationBoxID" ] )
-                exportFilename, extension = os.path.splitext( exportFilename )
-                exportFilename = "%s_%s" % ( exportFilename, take.GetName() )
+                exportFilename, extension = os.path.splitext( state.ExportOutputLocation )
+                exportFilename = "%s_%s" % ( exportFilename, take_name )
                 
                 if exporter == "Arnold":
                     exportFilename += "." + self.FRAME_PLACEHOLDER
                 
                 exportFilename += extension
 
-            for jobRegNum in range( regionJobCount ):
+                # Jobs rendered on the farm need the full path. A local export keeps the path as it was entered.
+                if not localExport and not os.path.isabs( exportFilename ):
+                    exportFilename = os.path.join( scene.GetDocumentPath(), exportFilename )
+                exportDirectory = os.path.dirname( exportFilename )
 
-                renderInfo = self.GetRenderInfo( scene, take )
-                renderData = renderInfo.GetDataInstance()
-                
-                saveOutput = renderData.GetBool( c4d.RDATA_SAVEIMAGE )
-                outputPath = self.getOutputPath( renderData, scenePath )
-
-                outputFormat = renderData.GetLong( c4d.RDATA_FORMAT )
-                outputNameFormat = renderData.GetLong( c4d.RDATA_NAMEFORMAT )
-                alphaEnabled = renderData.GetBool( c4d.RDATA_ALPHACHANNEL )
-                separateAlpha = renderData.GetBool( c4d.RDATA_SEPARATEALPHA )
-
-                saveMP = renderData.GetBool( c4d.RDATA_MULTIPASS_ENABLE ) and renderData.GetBool( c4d.RDATA_MULTIPASS_SAVEIMAGE )
-                mpPath = renderData.GetFilename( c4d.RDATA_MULTIPASS_FILENAME )
-                outputMultipassOverride = self.GetString( self.dialogIDs[ "OutputMultipassOverrideID" ] ).strip()
-                if len( outputMultipassOverride ) > 0:
-                    mpPath = outputMultipassOverride
-
-                if not os.path.isabs( mpPath ):
-                    mpPath = os.path.join( scenePath, mpPath )
-
-                mpFormat = renderData.GetLong( c4d.RDATA_MULTIPASS_SAVEFORMAT )
-                mpSuffix = renderData.GetBool( c4d.RDATA_MULTIPASS_SUFFIX )
-                mpUsers = False
-                try:
-                    mpUsers = renderData.GetBool( c4d.RDATA_MULTIPASS_USERNAMES )
-                except:
-                    pass
-                width = renderData.GetLong( c4d.RDATA_XRES )
-                height = renderData.GetLong( c4d.RDATA_YRES )
-                
-                if not localExport:
-                    print( "Creating C4D submit info file" )
-                    jobInfoFile = os.path.join( self.DeadlineTemp, "c4d_submit_info.job" )
+            # The take's render settings are the same for every region job, so fetch them once.
+            renderInfo = self.getTakeRenderInfo( scene, take )
+            renderData = renderInfo.GetDataInstance()
 
-                    tempJobName = jobName
-                    take_name = take.GetName()
-                    if not take_name == "Main":
-                        tempJobName += " - " + take_name
+            saveOutput = renderData.GetBool( c4d.RDATA_SAVEIMAGE )
+            outputPath = self.getOutputPath( renderData, scenePath )
 
-                    if EnableRegionRendering and not SingleFrameTileJob:
-                        tempJobName += " - Region " + str( jobRegNum )
-
-                    jobContents = {
-                        "Plugin" : "Cinema4D",
-                        "Name" : tempJobName,
-                        "Comment" : comment,
-                        "Department" : department,
-                        "Group" : group,
-                        "Pool" : pool,
-                        "SecondaryPool" : "",
-                        "Priority" : priority,
-                        "MachineLimit" : machineLimit,
-                        "TaskTimeoutMinutes" : taskTimeout,
-                        "EnableAutoTimeout" : autoTaskTimeout,
-                        "ConcurrentTasks" : concurrentTasks,
-                        "LimitConcurrentTasksToNumberOfCpus" : limitConcurrentTasks,
-                        "LimitGroups" : limitGroups,
-                        "JobDependencies" : dependencies,
-                        "OnJobComplete" : onComplete,
-                    }
-
-                    if groupBatch:
-                        jobContents[ "BatchName" ] = jobName
-
-                    if useBatchPlugin and self.c4dMajorVersion >= 15:
-                        jobContents[ "Plugin" ] = "Cinema4DBatch"
-
-                    # If it's not a space, then a secondary pool was selected.
-                    if secondaryPool != " ":
-                        jobContents[ "SecondaryPool" ] = secondaryPool
-
-                    if EnableRegionRendering and SingleFrameTileJob and not exportJob:
-                        jobContents[ "TileJob" ] = True
-                        jobContents[ "TileJobFrame" ] = SingleFrameJobFrame
-                        jobContents[ "TileJobTilesInX" ] = TilesInX
-                        jobContents[ "TileJobTilesInY" ] = TilesInY
-                    else:
-                        if useTakeFrames:
-                            startFrame = renderData.GetTime( c4d.RDATA_FRAMEFROM ).GetFrame( int(framesPerSecond) )
-                            endFrame = renderData.GetTime( c4d.RDATA_FRAMETO ).GetFrame( int(framesPerSecond) )
-                            takeFrames = "%s-%s" % ( startFrame, endFrame )
-                            jobContents[ "Frames" ] = takeFrames
-                        else:
-                            jobContents[ "Frames" ] = frames
+            outputFormat = renderData.GetLong( c4d.RDATA_FORMAT )
+            outputNameFormat = renderData.GetLong( c4d.RDATA_NAMEFORMAT )
+            alphaEnabled = renderData.GetBool( c4d.RDATA_ALPHACHANNEL )
+            separateAlpha = renderData.GetBool( c4d.RDATA_SEPARATEALPHA )
 
-                        if frameStepEnabled:
-                            jobContents[ "ChunkSize" ] = 10000
-                        else:
-                            jobContents[ "ChunkSize" ] = chunkSize
+            saveMP = renderData.GetBool( c4d.RDATA_MULTIPASS_ENABLE ) and renderData.GetBool( c4d.RDATA_MULTIPASS_SAVEIMAGE )
+            mpPath = renderData.GetFilename( c4d.RDATA_MULTIPASS_FILENAME )
+            if len( outputMultipassOverride ) > 0:
+                mpPath = outputMultipassOverride
 
-                    if submitSuspended:
-                        jobContents[ "InitialStatus" ] = "Suspended"
+            if not os.path.isabs( mpPath ):
+                mpPath = os.path.join( scenePath, mpPath )
 
-                    if isBlacklist:
-                        jobContents[ "Blacklist" ] = machineList
-                    else:
-                        jobContents[ "Whitelist" ] = machineList
+            mpFormat = renderData.GetLong( c4d.RDATA_MULTIPASS_SAVEFORMAT )
+            mpSuffix = renderData.GetBool( c4d.RDATA_MULTIPASS_SUFFIX )
+            mpUsers = False
+            try:
+                mpUsers = renderData.GetBool( c4d.RDATA_MULTIPASS_USERNAMES )
+            except:
+                pass
+            width = renderData.GetLong( c4d.RDATA_XRES )
+            height = renderData.GetLong( c4d.RDATA_YRES )
+
+            renderer = self.getRenderer( scene, take, renderInfo=renderInfo )
+            usesGpuRenderer = self.take_uses_gpu_renderer( take )
+            vray5_output_path = self.vray5_get_modified_output(renderInfo)
+
+            outputDirectory = pathDirname( outputPath )
+            mpDirectory = pathDirname( mpPath )
+
+            # The folder and file name of each output, and the name without its extension that the region prefixes are
+            # appended to. These are the same for every region, so only split the paths once.
+            outputFolder, outputPrefix = pathSplit( outputPath )
+            outputBaseName = pathSplitext( outputPrefix )[ 0 ]
+            mpFolder, mpPrefix = pathSplit( mpPath )
+            mpBaseName = pathSplitext( mpPrefix )[ 0 ]
+            vray5Folder, vray5Prefix = pathSplit( vray5_output_path ) if vray5_output_path else ( "", "" )
+            # When AWS Portal generates the path mapping rules, it expects a trailing slash.
+            outputFolder = pathJoin( outputFolder, '' )
+            mpFolder = pathJoin( mpFolder, '' )
+            vray5Folder = pathJoin( vray5Folder, '' )
+
+            # Whether the multipasses go to one file, and if not which passes there are, is the same for every region and
+            # the assembly jobs, so work it out once.
+            singleMultipassFile = self.isSingleMultipassFile( renderData )
+            multipasses = list( self.getEachMultipass( take ) ) if saveMP and mpPath and not singleMultipassFile else []
+
+            if useTakeFrames:
+                takeStartFrame = renderData.GetTime( c4d.RDATA_FRAMEFROM ).GetFrame( framesPerSecond )
+                takeEndFrame = renderData.GetTime( c4d.RDATA_FRAMETO ).GetFrame( framesPerSecond )
+
+            # The job and plugin info entries shared by every region job of this take.
+            takeJobName = jobName
+            if not take_name == "Main":
+                takeJobName += " - " + take_name
+
+            takeJobContents = {
+                "Plugin" : "Cinema4D",
+                "Name" : takeJobName,
+                "Comment" : comment,
+                "Department" : department,
+                "Group" : group,
+                "Pool" : pool,
+                "SecondaryPool" : "",
+                "Priority" : priority,
+                "MachineLimit" : machineLimit,
+                "TaskTimeoutMinutes" : taskTimeout,
+                "EnableAutoTimeout" : autoTaskTimeout,
+                "ConcurrentTasks" : concurrentTasks,
+                "LimitConcurrentTasksToNumberOfCpus" : limitConcurrentTasks,
+                "LimitGroups" : limitGroups,
+                "JobDependencies" : dependencies,
+                "OnJobComplete" : onComplete,
+            }
+
+            if groupBatch:
+                takeJobContents[ "BatchName" ] = jobName
+
+            if useBatchPlugin and self.batchSupported:
+                takeJobContents[ "Plugin" ] = "Cinema4DBatch"
+
+            # If it's not a space, then a secondary pool was selected.
+            if secondaryPool != " ":
+                takeJobContents[ "SecondaryPool" ] = secondaryPool
+
+            if EnableRegionRendering and SingleFrameTileJob and not exportJob:
+                takeJobContents[ "TileJob" ] = True
+                takeJobContents[ "TileJobFrame" ] = SingleFrameJobFrame
+                takeJobContents[ "TileJobTilesInX" ] = TilesInX
+                takeJobContents[ "TileJobTilesInY" ] = TilesInY
+            else:
+                if useTakeFrames:
+                    takeJobContents[ "Frames" ] = "%s-%s" % ( takeStartFrame, takeEndFrame )
+                else:
+                    takeJobContents[ "Frames" ] = frames
+
+                if frameStepEnabled:
+                    takeJobContents[ "ChunkSize" ] = 10000
+                else:
+                    takeJobContents[ "ChunkSize" ] = chunkSize
+
+            if submitSuspended:
+                takeJobContents[ "InitialStatus" ] = "Suspended"
+
+            if isBlacklist:
+                takeJobContents[ "Blacklist" ] = machineList
+            else:
+                takeJobContents[ "Whitelist" ] = machineList
+
+            takePluginContents = {
+                "Version" : self.c4dMajorVersion,
+                "Build" : build,
+                "Threads" : threads,
+                "Width" : width,
+                "Height" : height,
+                "LocalRendering" : localRendering,
+                "Take" : take_name,
+                "RegionRendering" : EnableRegionRendering,
+                "HasTexturePaths" : True,
+                "NoOpenGL" : disableOpenGl,
+            }
+
+            if not submitScene:
+                takePluginContents[ "SceneFile" ] = sceneFilename
+
+            if usesGpuRenderer:
+                takePluginContents[ "GPUsPerTask" ] = GPUsPerTask
+                takePluginContents[ "GPUsSelectDevices" ] = GPUsSelectDevices
+
+            for jobRegNum in range( regionJobCount ):
+                if not localExport:
+                    print( "Creating C4D submit info file" )
+                    # Jobs waiting to be sent together each need their own info files.
+                    jobFileIndex = len( pendingJobFiles )
+                    jobInfoFile = self.C4DJobInfoFile
+                    if jobFileIndex:
+                        jobInfoFile = pathJoin( self.DeadlineTemp, "c4d_submit_info%s.job" % jobFileIndex )
 
-                    outputFilenameLine = False
-                    outputDirectoryLine = False
-                    outputFileCount = 0
+                    tempJobName = takeJobName
+                    if EnableRegionRendering and not SingleFrameTileJob:
+                        tempJobName += " - Region %s" % jobRegNum
+
+                    # Only the name differs between a take's region jobs, so each one starts from a copy of the take's job info.
+                    jobContents = dict( takeJobContents )
+                    jobContents[ "Name" ] = tempJobName
+
+                    # Each output as a ( key, path ) pair. They are numbered in the order they're found once they're all collected.
+                    outputs = []
+                    addOutput = outputs.append
 
-                    vray5_output_path = self.vray5_get_modified_output(renderInfo)
                     if not exportJob:
-                        for outputRegNum in range( regionOutputCount ):
-                            regionPrefix = ""
-                            if EnableRegionRendering:
-                                if SingleFrameTileJob:
-                                    regionPrefix = "_region_%s_" % outputRegNum
-                                else:
-                                    regionPrefix = "_region_%s_" % jobRegNum
+                        jobRegionPrefixes = regionPrefixes
+                        if EnableRegionRendering and not SingleFrameTileJob:
+                            jobRegionPrefixes = ( "_region_%s_" % jobRegNum, )
 
+                        for regionPrefix in jobRegionPrefixes:
                             if saveOutput and outputPath != "":
                                 outputFilename = self.GetOutputFileName( outputPath, outputFormat, outputNameFormat, take, regionPrefix=regionPrefix )
                                 if outputFilename:
-                                    jobContents[ "OutputFilename%s" % outputFileCount ] = outputFilename
-                                    outputFileCount += 1
+                                    addOutput( ( "OutputFilename", outputFilename ) )
                                     if alphaEnabled and separateAlpha:
-                                        tempOutputFolder, tempOutputFile = os.path.split( outputFilename )
+                                        tempOutputFolder, tempOutputFile = pathSplit( outputFilename )
 
-                                        jobContents[ "OutputFilename%s" % outputFileCount ] =  os.path.join( tempOutputFolder, "A_" + tempOutputFile )
-                                        outputFileCount += 1
+                                        addOutput( ( "OutputFilename", pathJoin( tempOutputFolder, "A_" + tempOutputFile ) ) )
                                 else:
-                                    jobContents[ "OutputDirectory%s" % outputFileCount ] = os.path.dirname( outputPath )
-                                    outputFileCount += 1
+                                    addOutput( ( "OutputDirectory", outputDirectory ) )
 
                             if saveMP and mpPath:
-                                if self.isSingleMultipassFile( renderData ):
+                                if singleMultipassFile:
                                     mpFilename = self.GetOutputFileName( mpPath, mpFormat, outputNameFormat, take, isMulti = True, regionPrefix=regionPrefix )
                                     if mpFilename:
-                                        jobContents["OutputFilename%s" % outputFileCount] = mpFilename
+                                        addOutput( ( "OutputFilename", mpFilename ) )
                                     else:
-                                        jobContents[ "OutputDirectory%s" % outputFileCount ] = os.path.dirname( mpPath )
-
-                                    outputFileCount += 1
+                                        addOutput( ( "OutputDirectory", mpDirectory ) )
                                 else:
-                                    for mPass, postEffect in self.getEachMultipass( take ):
+                                    for mPass, postEffect in multipasses:
                                         mpFilename = self.GetOutputFileName( mpPath, mpFormat, outputNameFormat, take, isMulti=True, mpass=mPass, mpassSuffix=mpSuffix, mpUsers=mpUsers,
                                                                              regionPrefix=regionPrefix, postEffect=postEffect )
                                         if mpFilename:
-                                            jobContents[ "OutputFilename%s" % outputFileCount ] = mpFilename
+                                            addOutput( ( "OutputFilename", mpFilename ) )
                                         else:
-                                            jobContents[ "OutputDirectory%s" % outputFileCount ] = os.path.dirname( mpPath )
-                                        outputFileCount += 1
+                                            addOutput( ( "OutputDirectory", mpDirectory ) )
 
                             # Get any Renderer Specific output paths for V-Ray 5 and higher
-                            for output_filename in self.vray5_get_output_paths(scene, take, vray5_output_path, region_prefix=regionPrefix):
-                                jobContents[ "OutputFilename%s" % outputFileCount ] = output_filename
-                                outputFileCount += 1
+                            outputs.extend( ( "OutputFilename", output_filename ) for output_filename in self.vray5_get_output_paths(scene, take, vray5_output_path, region_prefix=regionPrefix) )
 
                     else:
-                        if not os.path.isabs( exportFilename ):
-                            scenePath = scene.GetDocumentPath()
-                            exportFilename = os.path.join( scenePath, exportFilename )
-
-                        jobContents[ "OutputDirectory%s" % outputFileCount ] = os.path.dirname( exportFilename )
+                        addOutput( ( "OutputDirectory", exportDirectory ) )
 
-                    if EnableAssetServerPrecaching:
-                        for index, asset in enumerate( self.GetAllAssets( submitScene, sceneFilename ) ):
-                            jobContents[ "AWSAssetFile%d" % index ] = asset
+                    jobContents.update( ( "%s%s" % ( key, index ), path ) for index, ( key, path ) in enumerate( outputs ) )
+                    jobContents.update( assetEntries )
 
                     self.writeInfoFile( jobInfoFile, jobContents )
 
@@ -2138,28 +2648,11 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                         self.ConcatenatePipelineSettingsToJob( jobInfoFile, jobName )
 
                     print( "Creating C4D plugin info file" )
-                    renderer = self.getRenderer( scene, take )
-                    pluginInfoFile = os.path.join( self.DeadlineTemp, "c4d_plugin_info.job" )
-
-                    pluginContents = {
-                        "Version" : self.c4dMajorVersion,
-                        "Build" : build,
-                        "Threads" : threads,
-                        "Width" : width,
-                        "Height" : height,
-                        "LocalRendering" : localRendering,
-                        "Take" : take.GetName(),
-                        "RegionRendering" : EnableRegionRendering,
-                        "HasTexturePaths" : True,
-                        "NoOpenGL" : disableOpenGl,
-                    }
-
-                    if not submitScene:
-                        pluginContents[ "SceneFile" ] = sceneFilename
-
-                    if self.take_uses_gpu_renderer(take):
-                        pluginContents[ "GPUsPerTask" ] = GPUsPerTask
-                        pluginContents[ "GPUsSelectDevices" ] = GPUsSelectDevices
+                    pluginInfoFile = self.C4DPluginInfoFile
+                    if jobFileIndex:
+                        pluginInfoFile = pathJoin( self.DeadlineTemp, "c4d_plugin_info%s.job" % jobFileIndex )
+
+                    pluginContents = dict( takePluginContents )
 
                     if exportJob:
                         pluginContents[ "Renderer" ] = "%sExport" % exporter
@@ -2167,6 +2660,14 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                     else:
                         if renderer:
                             pluginContents[ "Renderer" ] = renderer
+
+                        if saveOutput and outputPath:
+                            pluginContents[ "FilePath" ] = outputFolder
+                        if saveMP and mpPath:
+                            pluginContents[ "MultiFilePath" ] = mpFolder
+                        if vray5_output_path:
+                            pluginContents[ "VRay5FilePath" ] = vray5Folder
+
                         if EnableRegionRendering:
                             if SingleFrameTileJob:
                                 for outputRegNum in range( regionOutputCount ):
@@ -2182,25 +2683,15 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                                     pluginContents[ "RegionTop%s" % outputRegNum ] = tile_region.top
                                     pluginContents[ "RegionBottom%s" % outputRegNum ] = tile_region.bottom
 
+                                    regionPrefix = regionPrefixes[ outputRegNum ]
                                     if saveOutput and outputPath:
-                                        path, prefix = os.path.split( outputPath )
-                                        extlessPrefix, tempOutputExtension = os.path.splitext( prefix )
-                                        # When AWS Portal generates the path mapping rules, it expects a trailing slash.
-                                        pluginContents[ "FilePath" ] = os.path.join( path, '' ) 
-                                        pluginContents[ "RegionPrefix%s" % outputRegNum ] = "%s_region_%s_" % ( extlessPrefix, outputRegNum )
+                                        pluginContents[ "RegionPrefix%s" % outputRegNum ] = outputBaseName + regionPrefix
 
                                     if saveMP and mpPath:
-                                        path, prefix = os.path.split( mpPath )
-                                        extlessPrefix, tempOutputExtension = os.path.splitext( prefix )
-                                        # When AWS Portal generates the path mapping rules, it expects a trailing slash.
-                                        pluginContents[ "MultiFilePath" ] = os.path.join( path, '' ) 
-                                        pluginContents[ "MultiFileRegionPrefix%s" % outputRegNum ] = "%s_region_%s_" % ( extlessPrefix, outputRegNum )
+                                        pluginContents[ "MultiFileRegionPrefix%s" % outputRegNum ] = mpBaseName + regionPrefix
 
                                     if vray5_output_path:
-                                        path, prefix = os.path.split( vray5_output_path )
-                                        # When AWS Portal generates the path mapping rules, it expects a trailing slash.
-                                        pluginContents[ "VRay5FilePath" ] = os.path.join( path, '' )
-                                        pluginContents[ "VRay5RegionPrefix%s" % outputRegNum ] = insert_before_substring(prefix, self.FRAME_TOKEN, "_region_%s_" % outputRegNum)
+                                        pluginContents[ "VRay5RegionPrefix%s" % outputRegNum ] = insert_before_substring(vray5Prefix, self.FRAME_TOKEN, regionPrefix)
 
                             else:
                                 tile_region = compute_tile_region(jobRegNum,
@@ -2215,86 +2706,42 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                                 pluginContents[ "RegionTop" ] = tile_region.top
                                 pluginContents[ "RegionBottom" ] = tile_region.bottom
 
+                                regionPrefix = jobRegionPrefixes[ 0 ]
                                 if saveOutput and outputPath:
-                                    path, prefix = os.path.split( outputPath )
-                                    extlessPrefix, tempOutputExtension = os.path.splitext( prefix )
-                                    # When AWS Portal generates the path mapping rules, it expects a trailing slash.
-                                    pluginContents[ "FilePath" ] = os.path.join( path, '' ) 
-                                    pluginContents[ "FilePrefix" ] = "%s_region_%s_" % ( extlessPrefix, jobRegNum )
+                                    pluginContents[ "FilePrefix" ] = outputBaseName + regionPrefix
 
                                 if saveMP and mpPath:
-                                    path, prefix = os.path.split( mpPath )
-                                    extlessPrefix, tempOutputExtension = os.path.splitext( prefix )
-                                    # When AWS Portal generates the path mapping rules, it expects a trailing slash.
-                                    pluginContents[ "MultiFilePath" ] = os.path.join( path, '' ) 
-                                    pluginContents[ "MultiFilePrefix" ] = "%s_region_%s_" % ( extlessPrefix, jobRegNum )
+                                    pluginContents[ "MultiFilePrefix" ] = mpBaseName + regionPrefix
                                 
                                 if vray5_output_path:
-                                    path, prefix = os.path.split( vray5_output_path )
-                                    # When AWS Portal generates the path mapping rules, it expects a trailing slash.
-                                    pluginContents[ "VRay5FilePath" ] = os.path.join( path, '' )
-                                    pluginContents[ "VRay5FilePrefix" ] = insert_before_substring(prefix, self.FRAME_TOKEN, "_region_%s_" % jobRegNum)
+                                    pluginContents[ "VRay5FilePrefix" ] = insert_before_substring(vray5Prefix, self.FRAME_TOKEN, regionPrefix)
                         else:
                             if saveOutput and outputPath:
-                                head, tail = os.path.split( outputPath )
-                                # When AWS Portal generates the path mapping rules, it expects a trailing slash.
-                                pluginContents[ "FilePath" ] = os.path.join( head, '' ) 
-                                pluginContents[ "FilePrefix" ] = tail
+                                pluginContents[ "FilePrefix" ] = outputPrefix
 
                             if saveMP and mpPath:
-                                head, tail = os.path.split( mpPath )
-                                # When AWS Portal generates the path mapping rules, it expects a trailing slash.
-                                pluginContents[ "MultiFilePath" ] = os.path.join( head, '' ) 
-                                pluginContents[ "MultiFilePrefix" ] = tail
+                                pluginContents[ "MultiFilePrefix" ] = mpPrefix
                             
                             if vray5_output_path:
-                                head, tail = os.path.split( vray5_output_path )
-                                # When AWS Portal generates the path mapping rules, it expects a trailing slash.
-                                pluginContents[ "VRay5FilePath" ] = os.path.join( head, '' )
-                                pluginContents[ "VRay5FilePrefix" ] = tail
+                                pluginContents[ "VRay5FilePrefix" ] = vray5Prefix
 
                     if frameStepEnabled:
                         pluginContents[ "EnableFrameStep" ] = True
                         pluginContents[ "FrameStep" ] = frameStep
 
                     # Add the texture search paths, if they exist
-                    for index, path in enumerate( self.getTextureSearchPaths() ):
+                    for index, path in enumerate( textureSearchPaths ):
                         pluginContents[ "TexturePath%s" % index ] = path
 
                     self.writeInfoFile( pluginInfoFile, pluginContents )
 
-                    print( "Submitting job" )
-                    c4d.StatusSetSpin()
-
-                    args = [ jobInfoFile, pluginInfoFile ]
-                    if submitScene:
-                        args.append( sceneFilename )
-                    
-                    results = ""
-                    try:
-                        results = CallDeadlineCommand( args, useArgFile=True )
-                        submissionSuccess += 1
-                    except:
-                        results = "An error occurred while submitting the job to Deadline."
-                    
-                    print( results )
-                    
-                    successfulSubmission = ( results.find( "Result=Success" ) != -1 )
-                    
-                    if successfulSubmission:
-                        successes += 1
-                        jobId = ""
-                        resultArray = results.split()
-                        for line in resultArray:
-                            if line.startswith( "JobID=" ):
-                                jobId = line.replace( "JobID=", "" )
-                                break
-                        if not jobId == "":
-                            jobIds.append( jobId )
-                            if EnableAssetServerPrecaching:
-                                print( CallDeadlineCommand( [ "-AWSPortalPrecacheJob", jobId ] ) )
-                    else:
-                        failures += 1
+                    pendingJobFiles.append( ( jobInfoFile, pluginInfoFile ) )
+                    if not batchJobs:
+                        jobSuccesses, jobFailures, submittedJobIds, results = self.submitJobFiles( pendingJobFiles, auxFiles, EnableAssetServerPrecaching )
+                        successes += jobSuccesses
+                        failures += jobFailures
+                        jobIds.extend( submittedJobIds )
+                        pendingJobFiles = []
                 # Local Export
                 elif localExport:
                     scene.GetTakeData().SetCurrentTake( take )
@@ -2302,17 +2749,15 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                     numExports = 1
 
                     if useTakeFrames:
-                        startFrame = renderData.GetTime( c4d.RDATA_FRAMEFROM ).GetFrame( int(framesPerSecond) )
-                        endFrame = renderData.GetTime( c4d.RDATA_FRAMETO ).GetFrame( int(framesPerSecond) )
+                        startFrame, endFrame = takeStartFrame, takeEndFrame
                     else:
-                        parsedFrameList = CallDeadlineCommand( [ "-ParseFrameList", self.GetString( self.dialogIDs[ "FramesBoxID" ] ), "False" ] ).strip()
-                        parsedFrameList = parsedFrameList.split( "," )
-                        numExports = len( parsedFrameList )
+                        if frameNumbers is None:
+                            frameNumbers = self.parseFrameNumbers( state.Frames )
+                        numExports = len( frameNumbers )
 
                     for i in range( 0, numExports ):
                         if not useTakeFrames:
-                            startFrame = int( parsedFrameList[ i ] )
-                            endFrame = int ( parsedFrameList[ i ] )
+                            startFrame = endFrame = frameNumbers[ i ]
 
                         if exporter == "Arnold":
                             options = c4d.BaseContainer()
@@ -2326,7 +2771,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                             c4d.CallCommand( SubmitC4DToDeadlineDialog.ARNOLD_ASS_EXPORT )
 
                         elif exporter == "Redshift":
-                            plug = c4d.plugins.FindPlugin( SubmitC4DToDeadlineDialog.REDSHIFT_EXPORT_PLUGIN_ID, c4d.PLUGINTYPE_SCENESAVER )
+                            plug = _find_plugin( SubmitC4DToDeadlineDialog.REDSHIFT_EXPORT_PLUGIN_ID, c4d.PLUGINTYPE_SCENESAVER )
 
                             op = {}
                             plug.Message( c4d.MSG_RETRIEVEPRIVATEDATA, op )
@@ -2340,7 +2785,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                             documents.SaveDocument( scene, exportFilename, c4d.SAVEDOCUMENTFLAGS_0, SubmitC4DToDeadlineDialog.REDSHIFT_EXPORT_PLUGIN_ID )
 
                 if dependentExport:
-                    results = self.SubmitDependentExportJob( exporter, jobIds, groupBatch, take )
+                    results = self.SubmitDependentExportJob( exporter, jobIds, groupBatch, take, renderInfo=renderInfo )
 
                     successfulSubmission = ( results.find( "Result=Success" ) != -1 )
                     if successfulSubmission:
@@ -2356,15 +2801,20 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                     else:
                         failures+=1
 
+            if pendingJobFiles and not batchTakes:
+                jobSuccesses, jobFailures, submittedJobIds, results = self.submitJobFiles( pendingJobFiles, auxFiles, EnableAssetServerPrecaching )
+                successes += jobSuccesses
+                failures += jobFailures
+                jobIds.extend( submittedJobIds )
+                pendingJobFiles = []
+
             if EnableRegionRendering and SubmitDependentAssembly:
                 if SingleFrameTileJob:
                     
                     configFiles = []
                     outputFiles = []
                     
-                    paddedFrame = str(SingleFrameJobFrame)
-                    while len( paddedFrame ) < 4:
-                        paddedFrame = "0" + paddedFrame
+                    paddedFrame = str( SingleFrameJobFrame ).zfill( 4 )
                     
                     if saveOutput and outputPath:
                         configFiles.append( self.createDTAConfigFile( SingleFrameJobFrame, renderData, outputPath, outputFormat, outputNameFormat, take )  )
@@ -2379,12 +2829,12 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                             outputFiles.append( outputFile.replace( self.FRAME_PLACEHOLDER, paddedFrame ) )
                         
                     if saveMP and mpPath:
-                        if self.isSingleMultipassFile( renderData ):
+                        if singleMultipassFile:
                             configFiles.append( self.createDTAConfigFile( SingleFrameJobFrame, renderData, mpPath, mpFormat, outputNameFormat, take, isMulti=True )  )
                             outputFile = self.GetOutputFileName( mpPath, mpFormat, outputNameFormat, take, isMulti=True )
                             outputFiles.append( outputFile.replace( self.FRAME_PLACEHOLDER, paddedFrame ) )
                         else:
-                            for mPass, postEffect in self.getEachMultipass( take ):
+                            for mPass, postEffect in multipasses:
                                 configFiles.append(
                                     self.createDTAConfigFile( SingleFrameJobFrame, renderData, mpPath, mpFormat, outputNameFormat, take, isMulti=True, mpass=mPass, mpassSuffix=mpSuffix,
                                                               mpUsers=mpUsers, postEffect=postEffect ) )
@@ -2401,13 +2851,13 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                     else:
                         failures += 1
                 else:
-                    frameListString = CallDeadlineCommand( [ "-ParseFrameList", self.GetString( self.dialogIDs[ "FramesBoxID" ] ), "False" ] ).strip()
-                    frameList = frameListString.split( "," )
+                    if frameNumbers is None:
+                        frameNumbers = self.parseFrameNumbers( state.Frames )
                     
                     if saveOutput and outputPath:
                         configFiles = []
                         outputFiles = []
-                        for frame in frameList:
+                        for frame in frameNumbers:
                             configFiles.append( self.createDTAConfigFile( frame, renderData, outputPath, outputFormat, outputNameFormat, take )  )
                             
                         outputFile = self.GetOutputFileName( outputPath, outputFormat, outputNameFormat, take )
@@ -2422,7 +2872,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                             
                             configFiles = []
                             outputFiles = []
-                            for frame in frameList:
+                            for frame in frameNumbers:
                                 configFiles.append( self.createDTAConfigFile( frame, renderData, outputPath, outputFormat, outputNameFormat, take, isAlpha=True ) )
                                 
                             outputFile = self.GetOutputFileName( outputPath, outputFormat, outputNameFormat, take )
@@ -2436,11 +2886,11 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                                 failures += 1
 
                     if saveMP and mpPath:
-                        if self.isSingleMultipassFile( renderData ):
+                        if singleMultipassFile:
                             configFiles = []
                             outputFiles = []
                             
-                            for frame in frameList:
+                            for frame in frameNumbers:
                                 configFiles.append( self.createDTAConfigFile( frame, renderData, mpPath, mpFormat, outputNameFormat, take, isMulti = True )  )
                             outputFile = self.GetOutputFileName( mpPath, mpFormat, outputNameFormat, take, isMulti = True )
                             outputFiles.append( outputFile )
@@ -2451,10 +2901,10 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                                 failures += 1
                         else:
 
-                            for mPass, postEffect in self.getEachMultipass( take ):
+                            for mPass, postEffect in multipasses:
                                 configFiles = []
                                 outputFiles = []
-                                for frame in frameList:
+                                for frame in frameNumbers:
                                     configFiles.append(
                                         self.createDTAConfigFile( frame, renderData, mpPath, mpFormat, outputNameFormat, take, isMulti=True, mpass=mPass, mpassSuffix=mpSuffix, mpUsers=mpUsers,
                                                                     postEffect=postEffect ) )
@@ -2471,7 +2921,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                         for output_filename in self.vray5_get_output_paths(scene, take, vray5_output_path):
                             configFiles = []
                             outputFiles = []
-                            for frame in frameList:
+                            for frame in frameNumbers:
                                 configFiles.append( self.vray5_create_dta_config_file( frame, renderData, output_filename ) )
 
                             outputFiles.append( output_filename )
@@ -2481,11 +2931,16 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                             else:
                                 failures += 1
 
+        if pendingJobFiles:
+            jobSuccesses, jobFailures, submittedJobIds, results = self.submitJobFiles( pendingJobFiles, auxFiles, EnableAssetServerPrecaching )
+            successes += jobSuccesses
+            failures += jobFailures
+
         c4d.StatusClear()
         if successes + failures == 1:
             gui.MessageDialog( results )
         elif successes + failures > 1:
-            gui.MessageDialog( "Submission Results\n\nSuccesses: " + str( successes ) + "\nFailures: " + str( failures ) + "\n\nSee script console for more details" )
+            gui.MessageDialog( "Submission Results\n\nSuccesses: %s\nFailures: %s\n\nSee script console for more details" % ( successes, failures ) )
         else:
             gui.MessageDialog( "Submission Failed. No takes selected." )
             return False
@@ -2515,12 +2970,10 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         invalidCompressionTakes = []
 
         for take in takesToRender:
-            renderInfo = self.GetRenderInfo( scene, take )
+            renderInfo = self.getTakeRenderInfo( scene, take )
             renderData = renderInfo.GetDataInstance()
 
-            octaneVideoPost = renderInfo.GetFirstVideoPost()
-            while octaneVideoPost is not None and not self.GetRendererName( octaneVideoPost.GetType() ) == "octane":
-                octaneVideoPost = octaneVideoPost.GetNext()
+            octaneVideoPost = self.getTakeVideoPosts( scene, take ).get( self.rendererIDs[ "octane" ] )
 
             if not octaneVideoPost:
                 videoPostErrorTakes.append( take )
@@ -2538,7 +2991,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
             outputFormat = renderData.GetLong( c4d.RDATA_FORMAT )
             outputExtension = self.GetExtensionFromFormat( outputFormat )
 
-            if outputExtension not in [ "png", "exr" ]:
+            if outputExtension not in self.OCTANE_OUTPUT_EXTENSIONS:
                 formatAffectedTakes.append( take )
 
             checkResults = self.checkOctaneRenderPassesSettings( octaneVideoPost, outputExtension )
@@ -2589,9 +3042,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         :param octaneVideoPost: C4D VideoPost object for Octane.
         :return: Returns True if selected buffer type is supported by Deadline. Returns False otherwise.
         """
-        renderBufferType = octaneVideoPost[ c4d.VP_BUFFER_TYPE ]
-        # 2 is Float (tonemapped). 3 is Float (Linear).
-        return renderBufferType in [ 2, 3 ]
+        return octaneVideoPost[ c4d.VP_BUFFER_TYPE ] in self.OCTANE_BUFFER_TYPES
 
     def usingCustomDeepImageName( self, octaneVideoPost ):
         """
@@ -2641,9 +3092,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         :param octaneVideoPost: C4D VideoPost object for Octane.
         :return: Returns True if selected format for render passes is EXR. Returns False otherwise.
         """
-        renderPassFormat = octaneVideoPost[ c4d.SET_PASSES_FILEFORMAT ]
-        # 3 is EXR. 8 is EXR(Octane).
-        return renderPassFormat in [ 3, 8 ]
+        return octaneVideoPost[ c4d.SET_PASSES_FILEFORMAT ] in self.OCTANE_EXR_PASS_FORMATS
 
     def getVideoPostError( self, videoPostErrorTakes ):
         """
@@ -2766,12 +3215,12 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         :return List: A list of the takes to render.
         """
 
-        take_selection = self.Takes[self.GetLong( self.dialogIDs[ "TakesBoxID" ] ) ]
+        take_selection = self.Takes[self.GetLong( self.TakesBoxID ) ]
 
         if take_selection == "Active":
             return [deadlinec4d.takes.get_active_take()]
         elif take_selection == "All":
-            include_main = self.GetBool( self.dialogIDs[ "IncludeMainBoxID" ] )
+            include_main = self.GetBool( self.IncludeMainBoxID )
             return [x for x in deadlinec4d.takes.get_all_takes(include_main=include_main)]
         elif take_selection == 'Marked':
             return [x for x in deadlinec4d.takes.get_checked_takes()]
@@ -2791,158 +3240,173 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         return mpOneFile and mpFormat in ( c4d.FILTER_B3D, c4d.FILTER_PSD, c4d.FILTER_PSB, c4d.FILTER_TIF_B3D, c4d.FILTER_TIF, c4d.FILTER_EXR )
 
     
+    # This is called for core messages. Any change to the document may change the takes' render settings.
+    def CoreMessage( self, id, msg ):
+        if id == c4d.EVMSG_CHANGE:
+            self.gpuTakeCache.clear()
+            self.activeScenePath = None
+
+        return gui.GeDialog.CoreMessage( self, id, msg )
+
     # This is called when a user clicks on a button or changes the value of a field.
     def Command( self, id, msg ):
         # The Limit Group browse button was pressed.
-        if id == self.dialogIDs[ "LimitGroupsButtonID" ]:
+        if id == self.LimitGroupsButtonID:
             c4d.StatusSetSpin()
             
-            currLimitGroups = self.GetString( self.dialogIDs[ "LimitGroupsBoxID" ] )
+            currLimitGroups = self.GetString( self.LimitGroupsBoxID )
             result = CallDeadlineCommand( [ "-selectlimitgroups", currLimitGroups ], hideWindow=False )
             result = result.replace( "\n", "" ).replace( "\r", "" )
             
             if result != "Action was cancelled by user":
-                self.SetString( self.dialogIDs[ "LimitGroupsBoxID" ], result )
+                self.SetString( self.LimitGroupsBoxID, result )
             
             c4d.StatusClear()
         
         # The Dependencies browse button was pressed.
-        elif id == self.dialogIDs[ "DependenciesButtonID" ]:
+        elif id == self.DependenciesButtonID:
             c4d.StatusSetSpin()
             
-            currDependencies = self.GetString( self.dialogIDs[ "DependenciesBoxID" ] )
+            currDependencies = self.GetString( self.DependenciesBoxID )
             result = CallDeadlineCommand( [ "-selectdependencies", currDependencies ], hideWindow=False )
             result = result.replace( "\n", "" ).replace( "\r", "" )
             
             if result != "Action was cancelled by user":
-                self.SetString( self.dialogIDs[ "DependenciesBoxID" ], result )
+                self.SetString( self.DependenciesBoxID, result )
             
             c4d.StatusClear()
         
-        elif id == self.dialogIDs[ "MachineListButtonID" ]:
+        elif id == self.MachineListButtonID:
             c4d.StatusSetSpin()
             
-            currMachineList = self.GetString( self.dialogIDs[ "MachineListBoxID" ] )
+            currMachineList = self.GetString( self.MachineListBoxID )
             result = CallDeadlineCommand( [ "-selectmachinelist", currMachineList ], hideWindow=False )
             result = result.replace( "\n", "" ).replace( "\r", "" )
             
             if result != "Action was cancelled by user":
-                self.SetString( self.dialogIDs[ "MachineListBoxID" ], result )
+                self.SetString( self.MachineListBoxID, result )
             
             c4d.StatusClear()
         
-        elif id == self.dialogIDs[ "ExportProjectBoxID" ]:
-            self.Enable( self.dialogIDs[ "SubmitSceneBoxID" ], not self.GetBool( self.dialogIDs[ "ExportProjectBoxID" ] ) )
+        elif id == self.ExportProjectBoxID:
+            self.Enable( self.SubmitSceneBoxID, not self.GetBool( self.ExportProjectBoxID ) )
         
-        elif id == self.dialogIDs[ "EnableFrameStepBoxID" ]:
+        elif id == self.EnableFrameStepBoxID:
             self.EnableFrameStep()
 
-        elif id == self.dialogIDs[ "OutputOverrideButtonID" ]:
+        elif id == self.OutputOverrideButtonID:
             c4d.StatusSetSpin()
             try:
-                currTemplate = self.GetString( self.dialogIDs[ "OutputOverrideID" ] )
+                currTemplate = self.GetString( self.OutputOverrideID )
                 if not os.path.isabs( currTemplate ):
                     scenePath = documents.GetActiveDocument().GetDocumentPath()
                     currTemplate = os.path.join( scenePath, currTemplate )
 
                 result = CallDeadlineCommand( [ "-SelectFilenameSave", currTemplate ] )
                 if result != "Action was cancelled by user" and result != "":
-                    self.SetString( self.dialogIDs[ "OutputOverrideID" ], result )
+                    self.SetString( self.OutputOverrideID, result )
             finally:
                 c4d.StatusClear()
 
-        elif id == self.dialogIDs[ "OutputMultipassOverrideButtonID" ]:
+        elif id == self.OutputMultipassOverrideButtonID:
             c4d.StatusSetSpin()
             try:
-                currTemplate = self.GetString( self.dialogIDs[ "OutputMultipassOverrideID" ] )
+                currTemplate = self.GetString( self.OutputMultipassOverrideID )
                 if not os.path.isabs( currTemplate ):
                     scenePath = documents.GetActiveDocument().GetDocumentPath()
                     currTemplate = os.path.join( scenePath, currTemplate )
                 
                 result = CallDeadlineCommand( [ "-SelectFilenameSave", currTemplate ] )
                 if result != "Action was cancelled by user" and result != "":
-                    self.SetString( self.dialogIDs[ "OutputMultipassOverrideID" ], result )
+                    self.SetString( self.OutputMultipassOverrideID, result )
             finally:
                 c4d.StatusClear()
 
-        elif id == self.dialogIDs[ "UseBatchBoxID" ]:
+        elif id == self.UseBatchBoxID:
             self.EnableRegionRendering()
         
-        elif id == self.dialogIDs[ "EnableRegionRenderingID" ]:
+        elif id == self.EnableRegionRenderingID:
             self.EnableRegionRendering()
         
-        elif id == self.dialogIDs[ "SingleFrameTileJobID" ]:
+        elif id == self.SingleFrameTileJobID:
             self.IsSingleFrameTileJob()
         
-        elif id == self.dialogIDs[ "AssembleTilesOverID" ]:
+        elif id == self.AssembleTilesOverID:
             self.AssembleOverChanged()
         
-        elif id == self.dialogIDs[ "BackgroundImageButtonID" ]:
+        elif id == self.BackgroundImageButtonID:
             backgroundImage = c4d.storage.LoadDialog( type=c4d.FILESELECTTYPE_IMAGES, title="Background Image" )
             if backgroundImage is not None:
-                self.SetString(self.dialogIDs[ "BackgroundImageID" ], backgroundImage )
+                self.SetString(self.BackgroundImageID, backgroundImage )
                 
-        elif id == self.dialogIDs[ "ExportJobID" ]:
+        elif id == self.ExportJobID:
             self.EnableExportFields()
             self.EnableOutputOverrides()
 
-        elif id == self.dialogIDs[ "ExportDependentJobBoxID" ]:
+        elif id == self.ExportDependentJobBoxID:
             self.EnableDependentExportFields()
 
-        elif id == self.dialogIDs[ "ExportMachineListButtonID" ]:
+        elif id == self.ExportMachineListButtonID:
             c4d.StatusSetSpin()
             
-            currMachineList = self.GetString( self.dialogIDs[ "ExportMachineListBoxID" ] )
+            currMachineList = self.GetString( self.ExportMachineListBoxID )
             result = CallDeadlineCommand( [ "-selectmachinelist", currMachineList ], hideWindow=False )
             result = result.replace( "\n", "" ).replace( "\r", "" )
             
             if result != "Action was cancelled by user":
-                self.SetString( self.dialogIDs[ "ExportMachineListBoxID" ], result )
+                self.SetString( self.ExportMachineListBoxID, result )
             
             c4d.StatusClear()
 
-        elif id == self.dialogIDs[ "ExportLimitGroupsButtonID" ]:
+        elif id == self.ExportLimitGroupsButtonID:
             c4d.StatusSetSpin()
             
-            currLimitGroups = self.GetString( self.dialogIDs[ "ExportLimitGroupsBoxID" ] )
+            currLimitGroups = self.GetString( self.ExportLimitGroupsBoxID )
             result = CallDeadlineCommand( [ "-selectlimitgroups", currLimitGroups ], hideWindow=False )
             result = result.replace( "\n", "" ).replace( "\r", "" )
             
             if result != "Action was cancelled by user":
-                self.SetString( self.dialogIDs[ "ExportLimitGroupsBoxID" ], result )
+                self.SetString( self.ExportLimitGroupsBoxID, result )
             
             c4d.StatusClear()
 
-        elif id == self.dialogIDs[ "ExportLocationButtonID" ]:
+        elif id == self.ExportLocationButtonID:
             c4d.StatusSetSpin()
-            exporter = self.Exporters[ self.GetLong( self.dialogIDs[ "ExportJobTypesID" ] ) ]
+            exporter = self.Exporters[ self.GetLong( self.ExportJobTypesID ) ]
             exportFileType = self.exportFileTypeDict[exporter]
 
             try:
-                currTemplate = self.GetString( self.dialogIDs[ "ExportLocationBoxID" ] )
+                currTemplate = self.GetString( self.ExportLocationBoxID )
                 result = CallDeadlineCommand( [ "-SelectFilenameSave", currTemplate, exportFileType ] )
                 
                 if result != "Action was cancelled by user" and result != "":
-                    self.SetString( self.dialogIDs[ "ExportLocationBoxID" ], result )
+                    self.SetString( self.ExportLocationBoxID, result )
             finally:
                 c4d.StatusClear()
         
-        elif id == self.dialogIDs[ "UnifiedIntegrationButtonID" ]:
+        elif id == self.UnifiedIntegrationButtonID:
             self.OpenIntegrationWindow()
 
         # The Submit or the Cancel button was pressed.
-        elif id == self.dialogIDs[ "SubmitButtonID" ] or id == self.dialogIDs[ "CancelButtonID" ]:
-            self.WriteStickySettings()
+        elif id == self.SubmitButtonID or id == self.CancelButtonID:
+            # Read the dialog once and share it between the sticky settings and the submission.
+            state = self.readDialogState()
+            self.WriteStickySettings( state )
 
             # Close the dialog if the Cancel button was clicked
-            if id == self.dialogIDs[ "SubmitButtonID" ]:
-                if not self.SubmitJob():
+            if id == self.SubmitButtonID:
+                try:
+                    submitted = self.SubmitJob( state )
+                finally:
+                    self.clearSubmissionCaches()
+
+                if not submitted:
                     return True
 
-            if id == self.dialogIDs[ "CancelButtonID" ] or self.GetBool( self.dialogIDs[ "CloseOnSubmissionID" ] ):
+            if id == self.CancelButtonID or state.CloseOnSubmission:
                 self.Close()
 
-        elif id == self.dialogIDs["TakesBoxID"]:
+        elif id == self.TakesBoxID:
             self.take_selection_changed()
 
         return True
@@ -2955,27 +3419,27 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         self.EnableGPUAffinityOverride()
 
     def submitDependentAssemblyJob( self, outputFiles, configFiles, jobNum, dependentIDs ):
-        jobName = self.GetString( self.dialogIDs[ "NameBoxID" ] )
-        department = self.GetString( self.dialogIDs[ "DepartmentBoxID" ] )
+        jobName = self.GetString( self.NameBoxID )
+        department = self.GetString( self.DepartmentBoxID )
             
-        pool = self.Pools[ self.GetLong( self.dialogIDs[ "PoolBoxID" ] ) ]
-        secondaryPool = self.SecondaryPools[ self.GetLong( self.dialogIDs[ "SecondaryPoolBoxID" ] ) ]
-        group = self.Groups[ self.GetLong( self.dialogIDs[ "GroupBoxID" ] ) ]
-        priority = self.GetLong( self.dialogIDs[ "PriorityBoxID" ] )
-        machineLimit = self.GetLong( self.dialogIDs[ "MachineLimitBoxID" ] )
-        taskTimeout = self.GetLong( self.dialogIDs[ "TaskTimeoutBoxID" ] )
-        autoTaskTimeout = self.GetBool( self.dialogIDs[ "AutoTimeoutBoxID" ] )
-        limitConcurrentTasks = self.GetBool( self.dialogIDs[ "LimitConcurrentTasksBoxID" ] )
-        isBlacklist = self.GetBool( self.dialogIDs[ "IsBlacklistBoxID" ] )
-        machineList = self.GetString( self.dialogIDs[ "MachineListBoxID" ] )
-        limitGroups = self.GetString( self.dialogIDs[ "LimitGroupsBoxID" ] )
-        onComplete = self.OnComplete[ self.GetLong( self.dialogIDs[ "OnCompleteBoxID" ] ) ]
-        
-        ErrorOnMissingTiles = self.GetBool( self.dialogIDs[ "ErrorOnMissingTilesID" ] )
-        AssembleTilesOver = self.AssembleOver[ self.GetLong( self.dialogIDs[ "AssembleTilesOverID" ] ) ]
-        BackgroundImage = self.GetString( self.dialogIDs[ "BackgroundImageID" ] )
-        ErrorOnMissingBackground = self.GetBool( self.dialogIDs[ "ErrorOnMissingBackgroundID" ] )
-        CleanupTiles = self.GetBool( self.dialogIDs[ "CleanupTilesID" ] )
+        pool = self.Pools[ self.GetLong( self.PoolBoxID ) ]
+        secondaryPool = self.SecondaryPools[ self.GetLong( self.SecondaryPoolBoxID ) ]
+        group = self.Groups[ self.GetLong( self.GroupBoxID ) ]
+        priority = self.GetLong( self.PriorityBoxID )
+        machineLimit = self.GetLong( self.MachineLimitBoxID )
+        taskTimeout = self.GetLong( self.TaskTimeoutBoxID )
+        autoTaskTimeout = self.GetBool( self.AutoTimeoutBoxID )
+        limitConcurrentTasks = self.GetBool( self.LimitConcurrentTasksBoxID )
+        isBlacklist = self.GetBool( self.IsBlacklistBoxID )
+        machineList = self.GetString( self.MachineListBoxID )
+        limitGroups = self.GetString( self.LimitGroupsBoxID )
+        onComplete = self.OnComplete[ self.GetLong( self.OnCompleteBoxID ) ]
+        
+        ErrorOnMissingTiles = self.GetBool( self.ErrorOnMissingTilesID )
+        AssembleTilesOver = self.AssembleOver[ self.GetLong( self.AssembleTilesOverID ) ]
+        BackgroundImage = self.GetString( self.BackgroundImageID )
+        ErrorOnMissingBackground = self.GetBool( self.ErrorOnMissingBackgroundID )
+        CleanupTiles = self.GetBool( self.CleanupTilesID )
         
         jobInfoFile = os.path.join( self.DeadlineTemp, "draft_submit_info%s.job" % jobNum )
         jobContents = {
@@ -3008,8 +3472,8 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
             jobContents[ "OutputFilename%s" % outputFileNum ] = outputFile
             outputFileNum += 1
 
-        if not self.GetBool( self.dialogIDs[ "SingleFrameTileJobID" ] ):
-            frames = self.GetString( self.dialogIDs[ "FramesBoxID" ] )
+        if not self.GetBool( self.SingleFrameTileJobID ):
+            frames = self.GetString( self.FramesBoxID )
             jobContents["Frames"] = frames
         else:
             jobContents["Frames"] = "0-%s" % ( outputFileNum - 1 )
@@ -3118,11 +3582,11 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
             passType = mpass[ c4d.MULTIPASSOBJECT_TYPE ]
             if passType == c4d.VPBUFFER_BLEND:
                 blendCount = self.GetBlendIndex( mpass )
-                context[ 'userpass' ] = mpass.GetName() + "blend_" + str( blendCount )
+                context[ 'userpass' ] = "%sblend_%s" % ( mpass.GetName(), blendCount )
                 if mpUsers:
-                    context[ 'pass' ] = mpass.GetName() + "blend_" + str( blendCount )
+                    context[ 'pass' ] = context[ 'userpass' ]
                 else:
-                    context[ 'pass' ] = "blend_" + str( blendCount )
+                    context[ 'pass' ] = "blend_%s" % blendCount
             elif passType == c4d.VPBUFFER_ALLPOSTEFFECTS:
                 context[ 'pass' ] = postEffect.lower()
                 context[ 'userpass' ] = postEffect
@@ -3175,11 +3639,11 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
             passType = mpass[ c4d.MULTIPASSOBJECT_TYPE ]
             if passType == c4d.VPBUFFER_BLEND:
                 blendCount = self.GetBlendIndex( mpass )
-                rpData[ '_layerName' ] = mpass.GetName() + "blend_" + str( blendCount )
+                rpData[ '_layerName' ] = "%sblend_%s" % ( mpass.GetName(), blendCount )
                 if mpUsers:
-                    rpData[ '_layerTypeName' ] = mpass.GetName() + "blend_" + str( blendCount )
+                    rpData[ '_layerTypeName' ] = rpData[ '_layerName' ]
                 else:
-                    rpData[ '_layerTypeName' ] = "blend_" + str( blendCount )
+                    rpData[ '_layerTypeName' ] = "blend_%s" % blendCount
             elif passType == c4d.VPBUFFER_ALLPOSTEFFECTS:
                 rpData[ 'pass' ] = postEffect.lower()
                 rpData[ 'userpass' ] = postEffect
@@ -3219,7 +3683,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
                 passType = mpass[ c4d.MULTIPASSOBJECT_TYPE ]
                 if passType == c4d.VPBUFFER_BLEND:
                     blendCount = self.GetBlendIndex( mpass )
-                    mpassValue = blendCount + "blend_" + str( blendCount )
+                    mpassValue = "%sblend_%s" % ( mpass.GetName(), blendCount )
                 elif passType == c4d.VPBUFFER_ALLPOSTEFFECTS:
                     mpassValue = postEffect
                 else:
@@ -3363,9 +3827,53 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
     def GetTakeFromName( self, name ):
         return deadlinec4d.takes.find_take(name)
     
+    def getVideoPosts( self, renderInfo ):
+        """
+        Walks the video posts of the render settings once.
+        :param renderInfo: The render settings object.
+        :return: A dict of video post type to the first video post of that type.
+        """
+        videoPosts = {}
+        videoPost = renderInfo.GetFirstVideoPost()
+        while videoPost is not None:
+            videoPosts.setdefault( videoPost.GetType(), videoPost )
+            videoPost = videoPost.GetNext()
+
+        return videoPosts
+
+    def getTakeVideoPosts( self, scene, take ):
+        """
+        Returns getVideoPosts for the take's render settings. The result is reused for the rest of the submission, so
+        the validation and the job submission share one walk per take.
+        :param scene: The current scene.
+        :param take: The take to get the video posts for.
+        :return: A dict of video post type to the first video post of that type.
+        """
+        takeKey = take.GetGUID() if take else None
+        videoPosts = self.videoPostCache.get( takeKey )
+        if videoPosts is None:
+            videoPosts = self.videoPostCache[ takeKey ] = self.getVideoPosts( self.getTakeRenderInfo( scene, take ) )
+
+        return videoPosts
+
     def GetRenderInfo( self, scene, take=None ):
         return deadlinec4d.utils.get_render_data(scene,take)
 
+    def getTakeRenderInfo( self, scene, take ):
+        """
+        Returns GetRenderInfo for the take, reused for the rest of the submission so the checks and the job submission
+        only look each take's render settings up once.
+        :param scene: The current scene.
+        :param take: The take to get the render settings for.
+        :return: The take's effective render data.
+        """
+        takeKey = take.GetGUID() if take else None
+        renderInfo = self.renderInfoCache.get( takeKey )
+        if renderInfo is None:
+            renderInfo = self.renderInfoCache[ takeKey ] = self.GetRenderInfo( scene, take )
+
+        return renderInfo
+
     def GetAllAssets( self, submitScene, sceneFile ):
         """ 
         Retrieves all the assets from the document
@@ -3428,9 +3936,7 @@ class SubmitC4DToDeadlineDialog( gui.GeDialog ):
         :param renderInfo: The current render settings object
         :return: the list of Post effects passes
         """
-        videoPost = renderInfo.GetFirstVideoPost()
-        while videoPost is not None and not self.GetRendererName( videoPost.GetType() ) == "iray":
-            videoPost = videoPost.GetNext()
+        videoPost = self.getVideoPosts( renderInfo ).get( self.rendererIDs[ "iray" ] )
 
         if not videoPost:
             return []
@@ -3592,6 +4098,10 @@ class CheckRenderPassesResult(object):
         self.UnrecognizedCompression = False
         self.MultilayerEnabled = False
 
+# Expose each dialog control ID as a class attribute, eg. SubmitC4DToDeadlineDialog.NameBoxID.
+for _name, _index in SubmitC4DToDeadlineDialog.dialogIDs.items():
+    setattr( SubmitC4DToDeadlineDialog, _name, _index )
+
 ## Class to create the submission menu item in C4D.
 class SubmitC4DtoDeadlineMenu( plugins.CommandData ):
     ScriptPath = ""
@@ -3608,6 +4118,48 @@ class SubmitC4DtoDeadlineMenu( plugins.CommandData ):
     def GetScriptName( self ):
         return "Submit To Deadline"
     
+def _import_from_path( moduleName, modulePath ):
+    """
+    Imports a module straight from its file rather than searching sys.path for it. The module is registered in sys.modules,
+    so later calls for the same file reuse it instead of executing it again.
+    :param moduleName: The name to register the module under.
+    :param modulePath: The path to the module's .py file.
+    :return: The imported module.
+    """
+    module = sys.modules.get( moduleName )
+    if module is not None and os.path.normcase( getattr( module, "__file__", "" ) or "" ) == os.path.normcase( modulePath ):
+        return module
+
+    spec = importlib.util.spec_from_file_location( moduleName, modulePath )
+    module = importlib.util.module_from_spec( spec )
+    spec.loader.exec_module( module )
+    sys.modules[ moduleName ] = module
+    return module
+
+## Plugins can only be registered when C4D starts up, so the lookups are safe to cache for the session.
+@lru_cache( maxsize=None )
+def _find_plugin( pluginID, pluginType=c4d.PLUGINTYPE_ANY ):
+    return plugins.FindPlugin( pluginID, pluginType )
+
+@lru_cache( maxsize=None )
+def _vray5_format_names():
+    """
+    Maps V-Ray's output format IDs to their file extensions. Built on first use rather than at import,
+    since the c4d.VRAY_* constants only exist when the V-Ray plugin is loaded.
+    """
+    return {
+        c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_PNG: "png",
+        c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_JPG: "jpg",
+        c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_VRIMG: "vrimg",
+        c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_HDR: "hdr",
+        c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_EXR: "exr",
+        c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_TGA: "tga",
+        c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_BMP: "bmp",
+        c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_SGI: "sgi",
+        c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_TIF: "tif",
+        c4d.VRAY_VP_OUTPUT_SETTINGS_FORMAT_VRST: "vrst",
+    }
+
 def GetDeadlineCommand( useDeadlineBg=False ):
     deadlineBin = ""
     try:
@@ -3634,14 +4186,93 @@ def CreateArgFile( arguments, tmpDir ):
     
     with io.open( tmpFile, 'w', encoding="utf-8-sig" ) as fileHandle:
         for argument in arguments:
-            line = "%s\n" % ( argument )
-            if not isinstance(line, unicode_type):
-                line = line.decode("utf-8")
-            fileHandle.write( line )
+            fileHandle.write( "%s\n" % ( argument ) )
         
     return tmpFile
     
-def CallDeadlineCommand( arguments, hideWindow=True, useArgFile=False, useDeadlineBg=False ):
+def _get_repository_root():
+    """
+    Reads the repository root the Deadline client is connected to from its settings, without starting deadlinecommand.
+    :return: The repository root, or an empty string if it can't be found.
+    """
+    for iniFile in DEADLINE_CLIENT_INI_FILES:
+        config = ConfigParser.RawConfigParser( strict=False )
+        try:
+            if not config.read( iniFile, encoding="utf-8" ):
+                continue
+        except ( ConfigParser.Error, UnicodeDecodeError ):
+            continue
+
+        repositoryRoot = config.get( "Deadline", "NetworkRoot", fallback="" ).strip()
+        if repositoryRoot:
+            return repositoryRoot
+
+    return ""
+
+def _get_submission_info_cache_key():
+    """
+    Builds the key the submitter info is cached under, so the cache is dropped once the Deadline client is upgraded or
+    connected to a different repository, and is never shared between users.
+    :return: A list of the user's home folder, deadlinecommand's modification time and the repository root.
+    """
+    deadlineCommand = GetDeadlineCommand()
+    if not os.path.dirname( deadlineCommand ):
+        deadlineCommand = shutil.which( deadlineCommand ) or deadlineCommand
+
+    modifiedTime = None
+    for path in ( deadlineCommand, deadlineCommand + ".exe" ):
+        try:
+            modifiedTime = os.path.getmtime( path )
+            break
+        except OSError:
+            pass
+
+    return [ os.path.expanduser( "~" ), modifiedTime, _get_repository_root() ]
+
+def _load_submission_info():
+    """
+    Grabs the submitter info from Deadline, reusing the in-process or on-disk cache when it is still fresh and was read
+    from the same deadlinecommand and repository.
+    :return: The parsed output of deadlinecommand's GetSubmissionInfo, in the form { "ok": bool, "result": ... }
+    """
+    global _SUBMISSION_INFO_CACHE
+
+    cacheKey = _get_submission_info_cache_key()
+    if _SUBMISSION_INFO_CACHE is not None:
+        cachedKey, cachedInfo, fetchedTime = _SUBMISSION_INFO_CACHE
+        if cachedKey == cacheKey and time.time() - fetchedTime < SUBMISSION_INFO_CACHE_TTL:
+            return { "ok": True, "result": cachedInfo }
+
+    try:
+        fetchedTime = os.stat( SUBMISSION_INFO_CACHE_FILE ).st_mtime
+        if time.time() - fetchedTime < SUBMISSION_INFO_CACHE_TTL:
+            with io.open( SUBMISSION_INFO_CACHE_FILE, "r", encoding="utf-8" ) as fileHandle:
+                cached = json.load( fileHandle )
+            if cached.get( "Key" ) == cacheKey:
+                _SUBMISSION_INFO_CACHE = ( cacheKey, cached[ "Info" ], fetchedTime )
+                return { "ok": True, "result": cached[ "Info" ] }
+    except ( OSError, IOError, ValueError, AttributeError, KeyError ):
+        # Missing, outdated or corrupt cache file, fall back to deadlinecommand.
+        pass
+
+    # Parse the raw bytes directly rather than decoding them to a str first.
+    dcOutput = CallDeadlineCommand( [ "-prettyJSON", "-GetSubmissionInfo", "Pools", "Groups", "MaxPriority", "TaskLimit", "UserHomeDir", "RepoDir:submission/Cinema4D/Main", "RepoDir:submission/Integration/Main", ], useDeadlineBg=True, returnBytes=True )
+    output = json_loads( dcOutput )
+
+    if output[ "ok" ]:
+        _SUBMISSION_INFO_CACHE = ( cacheKey, output[ "result" ], time.time() )
+        try:
+            # Write to a temp file first so a concurrent reader never sees a partial file.
+            tmpFile = SUBMISSION_INFO_CACHE_FILE + ".tmp"
+            with io.open( tmpFile, "w", encoding="utf-8" ) as fileHandle:
+                fileHandle.write( json.dumps( { "Key": cacheKey, "Info": output[ "result" ] } ) )
+            os.replace( tmpFile, SUBMISSION_INFO_CACHE_FILE )
+        except ( OSError, IOError ):
+            print( 'Failed to write submitter info cache: "%s"' % SUBMISSION_INFO_CACHE_FILE )
+
+    return output
+
+def CallDeadlineCommand( arguments, hideWindow=True, useArgFile=False, useDeadlineBg=False, returnBytes=False ):
     deadlineCommand = GetDeadlineCommand( useDeadlineBg )
     tmpdir = None
     
@@ -3680,9 +4311,13 @@ def CallDeadlineCommand( arguments, hideWindow=True, useArgFile=False, useDeadli
     output, errors = proc.communicate()
     
     if useDeadlineBg:
-        with io.open( os.path.join( tmpdir, "dlout.txt" ), 'r', encoding='utf-8' ) as fileHandle:
-            output = fileHandle.read()
-    else:
+        if returnBytes:
+            with io.open( os.path.join( tmpdir, "dlout.txt" ), 'rb' ) as fileHandle:
+                output = fileHandle.read()
+        else:
+            with io.open( os.path.join( tmpdir, "dlout.txt" ), 'r', encoding='utf-8' ) as fileHandle:
+                output = fileHandle.read()
+    elif not returnBytes:
         output = output.decode('utf-8')
     
     if tmpdir:
@@ -0,0 +1,84 @@
+"""
+Import smoke test for the Cinema 4D submitter.
+
+The submitter only runs inside Cinema 4D, so the c4d and deadlinec4d modules are replaced with stand-ins that hand out
+a distinct integer for every constant. That is enough to execute the module and its class bodies, which catches names
+that don't resolve at import time.
+
+Run with: python -m unittest discover -s C4D_2026/tests
+"""
+
+import importlib.util
+import itertools
+import os
+import sys
+import types
+import unittest
+
+SUBMITTER_PATH = os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), os.pardir, "DeadlineRepository10", "submission",
+                               "Cinema4D", "Main", "SubmitC4DToDeadline.py" )
+
+_constantIDs = itertools.count( 1 )
+
+
+class _StubModule( types.ModuleType ):
+    """
+    A module that returns a new integer for any attribute it doesn't have, like the c4d constants.
+    """
+    def __getattr__( self, name ):
+        if name.startswith( "__" ):
+            raise AttributeError( name )
+        value = next( _constantIDs )
+        setattr( self, name, value )
+        return value
+
+
+def _stubModules():
+    """
+    :return: A dictionary of the stand-in modules, keyed by module name.
+    """
+    c4d = _StubModule( "c4d" )
+    gui = _StubModule( "c4d.gui" )
+    gui.GeDialog = type( "GeDialog", ( object, ), {} )
+    plugins = _StubModule( "c4d.plugins" )
+    plugins.CommandData = type( "CommandData", ( object, ), {} )
+    modules = _StubModule( "c4d.modules" )
+
+    stubs = {
+        "c4d": c4d,
+        "c4d.documents": _StubModule( "c4d.documents" ),
+        "c4d.gui": gui,
+        "c4d.plugins": plugins,
+        "c4d.modules": modules,
+        "c4d.modules.takesystem": _StubModule( "c4d.modules.takesystem" ),
+        "c4d.modules.tokensystem": _StubModule( "c4d.modules.tokensystem" ),
+        "deadlinec4d": _StubModule( "deadlinec4d" ),
+    }
+    for name, module in stubs.items():
+        parentName, _, childName = name.rpartition( "." )
+        if parentName:
+            setattr( stubs[ parentName ], childName, module )
+    return stubs
+
+
+class SubmitterImportTest( unittest.TestCase ):
+
+    def setUp( self ):
+        self.savedModules = dict( sys.modules )
+        sys.modules.update( _stubModules() )
+
+    def tearDown( self ):
+        sys.modules.clear()
+        sys.modules.update( self.savedModules )
+
+    def test_import( self ):
+        spec = importlib.util.spec_from_file_location( "SubmitC4DToDeadline", SUBMITTER_PATH )
+        submitter = importlib.util.module_from_spec( spec )
+        spec.loader.exec_module( submitter )
+
+        dialogClass = submitter.SubmitC4DToDeadlineDialog
+        self.assertIn( dialogClass.rendererIDs[ "redshift" ], dialogClass.gpuRendererIDs )
+
+
+if __name__ == "__main__":
+    unittest.main()